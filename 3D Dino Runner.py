@@ -1,12 +1,18 @@
 # ----------------- Professional 3D Dino Runner -----------------
 # PyOpenGL + GLUT
-# pip install PyOpenGL PyOpenGL_accelerate
+# pip install PyOpenGL PyOpenGL_accelerate numpy
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
-import sys, math, time, random
+import sys, math, time, random, argparse, atexit
 from OpenGL.GLUT import glutLeaveMainLoop
+from OpenGL import commandbuffer
+import dino_meshes, dino_instancing, dino_profiler, dino_text, dino_culling, dino_lod, dino_lighting, dino_replay, dino_stars, dino_world
+import numpy
+from dino_timing import FixedStep, lerp
+from dino_entities import CACTUS, PTERO
+from dino_sim import DinoSim, SIM_DT, CACTUS_DIMS
 
 # Window and Camera :
 
@@ -42,36 +48,30 @@ PATH_COL= (1.0, 1.0, 0.2)  # light yellow track
 NIGHT_SKY = (0.07, 0.10, 0.18)
 PEBBLE_COL= (0.55, 0.47, 0.40)
 
-# Game State :
+# Game State (simulation lives in dino_sim, this file only draws it) :
 
-running = True
-game_over = False
-invuln_t = 0.0
-lives = 3
-score = 0
-eggs_collected = 0
-time_score_acc = 0.0
-last_time = time.time()
+sim = DinoSim()
+obstacles, coins, clouds = sim.obstacles, sim.coins, sim.clouds
+dino = sim.dino
 is_night = False
-game_time = 0.0
 
-# Dino Varibables:
+# Fixed simulation step; rendering interpolates between steps :
 
-dino = {"x":0.0,"y":0.0,"z":0.0,"w":1.6,"h":2.2,"d":0.9,"vy":0.0,"jumping":False,"crouch":False}
-GRAVITY = -22.0
-JUMP_V = 11.5
-GROUND_Y = 0.0
+MAX_CATCHUP = 5
+clock = FixedStep(SIM_DT, MAX_CATCHUP)
 
-# World :
+# Scenery streams in by chunks around the camera (see grow_trees) :
 
-WORLD_SPEED = 10.0
-SPAWN_T, COIN_T, CLOUD_T = 0.0, 0.0, 0.0
-SPAWN_INT_BASE, SPAWN_INT_JIT = 1.2, 0.5
-COIN_INT_BASE, COIN_INT_JIT = 1.3, 0.9
-CLOUD_INT_BASE, CLOUD_INT_JIT = 1.0, 0.8
+trees_per_chunk = 4  # --trees-per-chunk; chunks are 40 units long
 
-obstacles, coins, clouds, trees = [], [], [], []
-next_id = 1
+# Animation clock for purely cosmetic motion (egg wobble); offscreen
+# capture swaps it for simulated time :
+
+anim_clock = time.time
+
+# Frame profiler (F toggles the overlay, --profile streams to a file) :
+
+profiler = dino_profiler.FrameProfiler()
 
 # Single-lane setup (center lane at z=0) :
 
@@ -79,12 +79,23 @@ lane_speed = 0.0  # no lateral movement needed
 
 # Stars for night sky :
 
-stars = [(random.uniform(0, WIN_W), random.uniform(WIN_H*0.55, WIN_H-10)) for _ in range(90)]
+def scatter_stars():
+    return [(random.uniform(0, WIN_W), random.uniform(WIN_H*0.55, WIN_H-10)) for _ in range(90)]
+
+stars = scatter_stars()
+star_field = dino_stars.StarField()  # uploads stars to a VBO on first draw
+twinkle = False  # --twinkle: animate the stars in a shader
+
+# Input recorder (--record), fed every key event and simulation step :
+
+recorder = None
 
 # Fonts :
 
 FONT_BIG = GLUT_BITMAP_HELVETICA_18
 FONT_SMALL = GLUT_BITMAP_9_BY_15
+atlas_text = False  # draw text from glyph atlases (set in init_gl)
+text_enabled = True  # bitmap fonts need GLUT; off when rendering without it
 
 
 
@@ -113,7 +124,14 @@ def end_2d():
 
 def draw_text(x, y, s, font=FONT_SMALL, color=BLACK):
 
+    if not text_enabled:
+        return
     glColor3f(*color)
+
+    if atlas_text:
+        dino_text.draw_text(x, y, s, font)
+        return
+
     glRasterPos2f(x, y)
 
     for ch in s:
@@ -123,73 +141,19 @@ def draw_text(x, y, s, font=FONT_SMALL, color=BLACK):
 #  
 def draw_box(w,h,d):
 
-    w2,h2,d2 = w/2,h/2,d/2
-    glBegin(GL_QUADS)
-
-    # Front:
-
-    glNormal3f(0,0,1); glVertex3f(-w2,-h2,d2); glVertex3f(w2,-h2,d2)
-    glVertex3f(w2,h2,d2); glVertex3f(-w2,h2,d2)
-
-    # Back:
-
-    glNormal3f(0,0,-1); glVertex3f(-w2,-h2,-d2); glVertex3f(-w2,h2,-d2)
-    glVertex3f(w2,h2,-d2); glVertex3f(w2,-h2,-d2)
-
-    # Left:
+    # Cached unit cube scaled by the model transform :
 
-    glNormal3f(-1,0,0); glVertex3f(-w2,-h2,-d2); glVertex3f(-w2,-h2,d2)
-    glVertex3f(-w2,h2,d2); glVertex3f(-w2,h2,-d2)
-
-    # Right:
-
-    glNormal3f(1,0,0); glVertex3f(w2,-h2,-d2); glVertex3f(w2,h2,-d2)
-    glVertex3f(w2,h2,d2); glVertex3f(w2,-h2,d2)
-
-    # Top:
-
-    glNormal3f(0,1,0); glVertex3f(-w2,h2,-d2); glVertex3f(-w2,h2,d2)
-    glVertex3f(w2,h2,d2); glVertex3f(w2,h2,-d2)
-
-    # Bottom :
-
-    glNormal3f(0,-1,0); glVertex3f(-w2,-h2,-d2); glVertex3f(w2,-h2,-d2)
-    glVertex3f(w2,-h2,d2); glVertex3f(-w2,-h2,d2)
-    glEnd()
+    glPushMatrix()
+    glScalef(w,h,d)
+    dino_meshes.unit_box().draw()
+    glPopMatrix()
 
 def draw_disc(radius=0.35, thick=0.12, slices=24):
 
-    h,r = thick, radius
-    glBegin(GL_TRIANGLE_FAN)
-    glNormal3f(0,1,0); glVertex3f(0,h/2,0)
-
-    for i in range(slices+1):
-        a = 2*math.pi*i/slices
-        glVertex3f(r*math.cos(a),h/2,r*math.sin(a))
-    glEnd()
-
-    glBegin(GL_TRIANGLE_FAN)
-    glNormal3f(0,-1,0); glVertex3f(0,-h/2,0)
-
-    for i in range(slices+1):
-        a = 2*math.pi*i/slices
-        glVertex3f(r*math.cos(a),-h/2,r*math.sin(a))
-    glEnd()
-    glBegin(GL_QUAD_STRIP)
-
-    for i in range(slices+1):
-
-        a =2*math.pi*i/slices; nx, nz = math.cos(a), math.sin(a)
-        glNormal3f(nx,0,nz)
-        glVertex3f(r*nx,-h/2,r*nz)
-        glVertex3f(r*nx,h/2,r*nz)
-    glEnd()
-
-def aabb(ax,ay,az,aw,ah,ad,bx,by,bz,bw,bh,bd):
-
-    return (abs(ax-bx)*2 < (aw+bw) and
-            abs(ay-by)*2 < (ah+bh) and
-            abs(az-bz)*2 < (ad+bd))
+    glPushMatrix()
+    glScalef(radius,thick,radius)
+    dino_meshes.unit_disc(slices).draw()
+    glPopMatrix()
 
 #  Environment Drawing:
 
@@ -211,7 +175,39 @@ def draw_ground():
     draw_box(1,1,1)
     glPopMatrix()
 
-def draw_tree(x,z):
+ground_commands = None  # draw_ground's calls, recorded once per context
+
+def replay_ground():
+
+    # The ground is the same every frame: record its GL calls once (with
+    # the mesh release, so the replay leaves no arrays bound) and replay
+    # them as raw ctypes calls.  The box mesh is uploaded beforehand so
+    # the upload itself is not part of the recording :
+
+    global ground_commands
+    if ground_commands is None:
+        dino_meshes.unit_box().bind()
+        dino_meshes.release()
+        with commandbuffer.recording(namespaces=(globals(),)) as commands:
+            draw_ground()
+            dino_meshes.release()
+        ground_commands = commands
+    dino_meshes.release()  # the replay starts and ends with no mesh bound
+    ground_commands.replay()
+    dino_profiler.count_calls(len(ground_commands))
+
+# Box around a whole tree (trunk and canopy), relative to its base :
+
+TREE_BOUNDS = ((-1.3, 0.0, -1.2), (1.3, 3.9, 1.2))
+
+# Level of detail: tessellations finest first, and the projected radius
+# (pixels) below which each next one takes over :
+
+TREE_LOD = dino_lod.LodLevels([(16,12), (10,8), (6,5)], [40, 16])
+EGG_LOD = dino_lod.LodLevels([(20,16), (12,9), (8,6)], [24, 10])
+CLOUD_LOD = dino_lod.LodLevels([28, 16, 10], [60, 25])
+
+def draw_tree(x,z,lod=(16,12)):
 
     glPushMatrix()
     glTranslatef(x,0,z)
@@ -220,48 +216,54 @@ def draw_tree(x,z):
 
     # Layered leafy canopy (spherical clusters):
 
-    glDisable(GL_LIGHTING)
+    set_lit(False)
     glColor3f(*TREE_LEAF)
-    glPushMatrix(); glTranslatef(0,3.0,0); q=gluNewQuadric(); gluSphere(q,0.9,16,12); glPopMatrix()
-    glPushMatrix(); glTranslatef(0.6,2.6,0); q=gluNewQuadric(); gluSphere(q,0.7,16,12); glPopMatrix()
-    glPushMatrix(); glTranslatef(-0.6,2.6,0); q=gluNewQuadric(); gluSphere(q,0.7,16,12); glPopMatrix()
-    glPushMatrix(); glTranslatef(0,2.3,0.6); q=gluNewQuadric(); gluSphere(q,0.6,16,12); glPopMatrix()
-    glPushMatrix(); glTranslatef(0,2.3,-0.6); q=gluNewQuadric(); gluSphere(q,0.6,16,12); glPopMatrix()
-    glEnable(GL_LIGHTING)
+    glPushMatrix(); glTranslatef(0,3.0,0); dino_meshes.sphere(0.9,*lod).draw(); glPopMatrix()
+    glPushMatrix(); glTranslatef(0.6,2.6,0); dino_meshes.sphere(0.7,*lod).draw(); glPopMatrix()
+    glPushMatrix(); glTranslatef(-0.6,2.6,0); dino_meshes.sphere(0.7,*lod).draw(); glPopMatrix()
+    glPushMatrix(); glTranslatef(0,2.3,0.6); dino_meshes.sphere(0.6,*lod).draw(); glPopMatrix()
+    glPushMatrix(); glTranslatef(0,2.3,-0.6); dino_meshes.sphere(0.6,*lod).draw(); glPopMatrix()
+    set_lit(True)
     glPopMatrix()
 
-def draw_cloud_entity(c):
+def build_cloud(points=28):
 
-    glDisable(GL_LIGHTING)
+    # Three puffs, each a fan of points rim points, flattened into triangles :
 
-    if is_night:
-        glColor3f(0.55,0.55,0.6)
+    data = []
+    n = points - 1
+    for (ox,oy,r) in [(-1,0,1),(0,0.5,1.2),(1,0,1)]:
+        rim = [(ox+r*math.cos(2*math.pi*i/n), oy+r*math.sin(2*math.pi*i/n)) for i in range(points)]
+        for (x0,y0),(x1,y1) in zip(rim, rim[1:]):
+            data += [(0,0,1,ox,oy,0),(0,0,1,x0,y0,0),(0,0,1,x1,y1,0)]
+    return GL_TRIANGLES, data
 
-    else:
-        glColor3f(1,1,1)
-    glPushMatrix()
-    glTranslatef(c["x"], c["y"], c["z"])
-    glScalef(c["s"],c["s"],1)
+def cloud_mesh(level=0):
+    points = CLOUD_LOD.levels[level]
+    return dino_meshes.get_mesh(("cloud", points), lambda: build_cloud(points))
 
-    for (ox,oy,r) in [(-1,0,1),(0,0.5,1.2),(1,0,1)]:
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(ox,oy,0)
+def cloud_color():
+    return (0.55,0.55,0.6) if is_night else (1,1,1)
+
+def draw_cloud_entity(x, y, z, s, level=0):
 
-        for i in range(28):
-            a = 2*math.pi*i/27
-            glVertex3f(ox+r*math.cos(a),oy+r*math.sin(a),0)
-        glEnd()
+    set_lit(False)
+    glColor3f(*cloud_color())
+    glPushMatrix()
+    glTranslatef(x, y, z)
+    glScalef(s,s,1)
+    cloud_mesh(level).draw()
     glPopMatrix()
-    glEnable(GL_LIGHTING)
+    set_lit(True)
 
 # Entities :
 
 #Dino Draw:
 
-def draw_dino():
+def draw_dino(y):
      
 	glColor3f(*DINO_COL)
-	x, y, z = dino["x"], dino["y"], dino["z"]
+	x, z = dino["x"], dino["z"]
 	h = dino["h"] * (0.65 if dino["crouch"] and not dino["jumping"] else 1.0)
 	w, d = dino["w"], dino["d"]
 	glPushMatrix()
@@ -327,225 +329,288 @@ def draw_dino():
      
 #Cactus Draw:
 
-def draw_cactus(o):
-	glColor3f(*CACTUS_COL)
-	glPushMatrix()
-	glTranslatef(o["x"], o["y"], o["z"])
+def build_cactus(w, h, d):
+
+	# Baked once per cactus size into a single mesh :
+
+	b = dino_meshes.MeshBuilder(GL_QUADS)
 
 	# Main trunk with segmented look:
      
-	seg_h = o["h"]/3.0
+	seg_h = h/3.0
 
 	for i in range(3):
-		glPushMatrix()
-		glTranslatef(0, seg_h*(i+0.5), 0)
+		b.push()
+		b.translate(0, seg_h*(i+0.5), 0)
 		scl = 1.0 - 0.08*i
-		draw_box(o["w"]*scl, seg_h*0.95, o["d"]*scl)
-		glPopMatrix()
+		b.box(w*scl, seg_h*0.95, d*scl)
+		b.pop()
 
 	# Arms:
      
 	for dir, up, off in [(-1, 1, 0.35), (1, 1, 0.5)]:
 
-		glPushMatrix()
-		glTranslatef(dir*o["w"]*0.85, seg_h*1.4, 0)
-		glRotatef(20*dir, 0, 0, 1)
-		draw_box(o["w"]*0.45, seg_h*0.9, o["d"]*0.45)
-		glPushMatrix(); glTranslatef(0, seg_h*0.55, 0); draw_box(o["w"]*0.35, seg_h*0.35, o["d"]*0.35); glPopMatrix()
-		glPopMatrix()
+		b.push()
+		b.translate(dir*w*0.85, seg_h*1.4, 0)
+		b.rotate(20*dir, 0, 0, 1)
+		b.box(w*0.45, seg_h*0.9, d*0.45)
+		b.push(); b.translate(0, seg_h*0.55, 0); b.box(w*0.35, seg_h*0.35, d*0.35); b.pop()
+		b.pop()
 
 	# Top cap :
      
-	glPushMatrix()
-	glTranslatef(0, o["h"]*0.98, 0)
-	draw_box(o["w"]*0.6, seg_h*0.4, o["d"]*0.6)
-	glPopMatrix()
+	b.push()
+	b.translate(0, h*0.98, 0)
+	b.box(w*0.6, seg_h*0.4, d*0.6)
+	b.pop()
 
 	# Simple spikes :
      
-	sp = max(3, int(6*o["h"]))//6
+	sp = max(3, int(6*h))//6
 	for i in range(sp):
-		yy=(i+1)*o["h"]/sp
+		yy=(i+1)*h/sp
         
 		for s in (-1,1):
 
-			glPushMatrix(); glTranslatef(s*o["w"]*0.55, yy, 0); draw_box(0.06,0.12,0.06); glPopMatrix()
-			glPushMatrix(); glTranslatef(0, yy, s*o["d"]*0.55); draw_box(0.06,0.12,0.06); glPopMatrix()
+			b.push(); b.translate(s*w*0.55, yy, 0); b.box(0.06,0.12,0.06); b.pop()
+			b.push(); b.translate(0, yy, s*d*0.55); b.box(0.06,0.12,0.06); b.pop()
                
 	# Base roots :
      
-	glPushMatrix(); glTranslatef(0,-0.05,0); draw_box(o["w"]*1.2, 0.1, o["d"]*1.2); glPopMatrix()
+	b.push(); b.translate(0,-0.05,0); b.box(w*1.2, 0.1, d*1.2); b.pop()
+	return b.build()
+
+def cactus_mesh():
+	return dino_meshes.get_mesh(("cactus",) + CACTUS_DIMS, lambda: build_cactus(*CACTUS_DIMS))
+
+def draw_cactus(x, y, z):
+	glColor3f(*CACTUS_COL)
+	glPushMatrix()
+	glTranslatef(x, y, z)
+	cactus_mesh().draw()
 	glPopMatrix()
      
 #Ptero Drawing:
 
 
-def draw_ptero(o):
+def draw_ptero(x, y, z, w, h, d):
     glColor3f(*PTERO_COL)
     glPushMatrix()
-    glTranslatef(o["x"], o["y"]+o["h"]/2,o["z"])
-    draw_box(o["w"],o["h"],o["d"])
+    glTranslatef(x, y+h/2, z)
+    draw_box(w,h,d)
     glPopMatrix()
 
 #Egg Drawing:
 
-def draw_coin(c):
+def egg_mesh(level=0):
+    return dino_meshes.sphere(1.0, *EGG_LOD.levels[level])
+
+def draw_coin(x, y, z, level=0):
      
 	# Draw an egg instead of a coin :
      
 	glColor3f(*EGG_COL)
 	glPushMatrix()
-	glTranslatef(c["x"], c["y"], c["z"])
+	glTranslatef(x, y, z)
 	# Gentle wobble
-	glRotatef((time.time()*40)%360, 0, 1, 0)
+	glRotatef((anim_clock()*40)%360, 0, 1, 0)
 	glScalef(0.35, 0.5, 0.35)
-	q = gluNewQuadric()
-	gluSphere(q, 1.0, 20, 16)
+	egg_mesh(level).draw()
 	glPopMatrix()
 
-# Spawning:
+# Instanced drawing :
 
+instanced = False  # set in init_gl() once the context can run it
+batches = {}
 
-def spawn_coin():
-    x = 28.0
-    z = 0.0
-    y = 0.9 if random.random()<0.6 else 0.6
-    coins.append({"x":x,"y":y,"z":z,"w":0.5,"h":0.5,"d":0.2,"speed":WORLD_SPEED*1.05})
+def get_batch(mesh, lit=True):
 
-def spawn_obstacle():
+    batch = batches.get(mesh)
+    if batch is None:
+        batch = batches[mesh] = dino_instancing.InstanceBatch(mesh, lit)
+    return batch
 
-    global next_id
-    kind = random.choice(["cactus","ptero"])
-    x = 28.0
-    z = 0.0
+def draw_levels(rows, levels, mesh, lit=True):
 
-    if kind=="cactus": 
-        w,h,d=0.9,1.6,0.7; y=GROUND_Y
+    # One instanced draw per level of detail in use :
 
-    else: 
-        w,h,d=1.0,0.7,0.9; y=1.7  # air for crouch
+    for level in numpy.unique(levels):
+        get_batch(mesh(level), lit).draw(rows[levels==level])
 
-    obstacles.append({"id":next_id,"type":kind,"x":x,"y":y,"z":z,"w":w,"h":h,"d":d,"speed":WORLD_SPEED,"counted":False})
-    next_id += 1
+def draw_entities_instanced(view):
 
-def spawn_cloud():
+    # One draw call per entity kind, however many are visible; the instance
+    # rows are filled straight from the entity columns :
 
-    x = 28.0
-    z = random.choice([-2,2]) * random.uniform(12.0, 16.0) 
-    y = random.uniform(3.8,6.5)
+    profiler.phase("clouds")
+    live, x = view["clouds"]
+    rows = dino_instancing.instance_rows(len(live))
+    rows[:,0], rows[:,1], rows[:,2] = x, clouds.y[live], clouds.z[live]
+    rows[:,4] = rows[:,5] = clouds.w[live]
+    rows[:,8:11] = cloud_color()
+    draw_levels(rows, view["cloud_lod"], cloud_mesh, lit=False)
 
-    clouds.append({"x":x,"y":y,"z":z,"s":random.uniform(0.8,1.4),"speed":WORLD_SPEED*0.45})
+    profiler.phase("obstacles")
+    sel, x = view["cacti"]
+    rows = dino_instancing.instance_rows(len(sel))
+    rows[:,0], rows[:,1], rows[:,2] = x, obstacles.y[sel], obstacles.z[sel]
+    rows[:,8:11] = CACTUS_COL
+    get_batch(cactus_mesh()).draw(rows)
 
+    sel, x = view["pteros"]
+    rows = dino_instancing.instance_rows(len(sel))
+    rows[:,0], rows[:,1], rows[:,2] = x, obstacles.y[sel]+obstacles.h[sel]/2, obstacles.z[sel]
+    rows[:,4], rows[:,5], rows[:,6] = obstacles.w[sel], obstacles.h[sel], obstacles.d[sel]
+    rows[:,8:11] = PTERO_COL
+    get_batch(dino_meshes.unit_box()).draw(rows)
 
+    profiler.phase("eggs")
+    live, x = view["eggs"]
+    rows = dino_instancing.instance_rows(len(live))
+    rows[:,0], rows[:,1], rows[:,2] = x, coins.y[live], coins.z[live]
+    rows[:,3] = (anim_clock()*40)%360
+    rows[:,4:7] = 0.35, 0.5, 0.35
+    rows[:,8:11] = EGG_COL
+    draw_levels(rows, view["egg_lod"], egg_mesh)
 
-def seed_trees():
+# Culling :
 
-    for i in range(14):
+def visible(frustum, store, live, alpha, bounds, lift=0.0, sx=1.0, sy=1.0, sz=1.0):
 
-        x = 8+i*10
-        trees.append((x, -7.5 if i%2==0 else 7.5))
+    # Slots of live the camera may see, with their interpolated x :
 
-# Update:
+    x = store.lerp_x(live, alpha)
+    keep = frustum.visible(bounds, x, store.y[live] + store.h[live]*lift, store.z[live], sx, sy, sz)
+    return live[keep], x[keep]
 
-def update(dt):
+def cull_scene(frustum, alpha, distance):
 
-    global SPAWN_T, COIN_T, CLOUD_T, running, game_over, score, time_score_acc, invuln_t, lives, eggs_collected, game_time
+    # Everything the frame draws besides the ground and the dino, reduced
+    # to what is inside the view frustum :
 
-    if not running or game_over: 
-        return
-    
-    game_time+= dt
-    time_score_acc+= dt
+    view = {}
+    tree_ids, tree_serials, xz = scenery.items()
+    xz = xz - (dino["x"] + distance, 0.0)
+    keep = numpy.flatnonzero(frustum.visible(TREE_BOUNDS, xz[:,0], 0.0, xz[:,1]))
+    view["trees"] = tree_ids[keep], xz[keep]
+    view["tree_serials"] = tree_serials[keep]
 
-    if time_score_acc >= 1.0:
-        add =int(time_score_acc); score += add; time_score_acc -= add
+    live = clouds.live()
+    view["clouds"] = visible(frustum, clouds, live, alpha, cloud_mesh().bounds(), sx=clouds.w[live], sy=clouds.w[live])
 
-    if invuln_t > 0: 
-        invuln_t =max(0, invuln_t - dt)
+    live = obstacles.live()
+    kind = obstacles.kind[live]
+    view["cacti"] = visible(frustum, obstacles, live[kind==CACTUS], alpha, cactus_mesh().bounds())
+    sel = live[kind==PTERO]
+    view["pteros"] = visible(frustum, obstacles, sel, alpha, dino_meshes.unit_box().bounds(), lift=0.5,
+                             sx=obstacles.w[sel], sy=obstacles.h[sel], sz=obstacles.d[sel])
 
-    if dino["jumping"]:
+    # The wobble spins eggs about y, which a sphere's box already covers :
 
-        dino["vy"] += GRAVITY*dt
-        dino["y"] += dino["vy"]*dt
+    view["eggs"] = visible(frustum, coins, coins.live(), alpha, egg_mesh().bounds(),
+                           sx=0.35, sy=0.5, sz=0.35)
+    return view
 
-        if dino["y"] <= GROUND_Y:
-            dino["y"]=GROUND_Y; dino["jumping"]=False; dino["vy"]=0
+def choose_lod(view, eye):
 
-    # Global speed multiplier increases over time (caps out)
-    speed_mul = 1.0 + min(game_time * 0.008, 0.2)
+    # Tessellation level of every visible tree, cloud and egg from its
+    # projected radius :
 
-    for o in obstacles[:]:
+    def size(x, y, z, radius):
+        return dino_lod.screen_radius(eye, x, y, z, radius, FOV, WIN_H)
 
-        o["x"] -= o["speed"]*speed_mul*dt
-        dh = dino["h"]*(0.65 if dino["crouch"] and not dino["jumping"] else 1.0)
+    ids, xz = view["trees"]
+    view["tree_lod"] = TREE_LOD.select(ids, size(xz[:,0], 2.6, xz[:,1], 1.3), view["tree_serials"])
+    live, x = view["clouds"]
+    view["cloud_lod"] = CLOUD_LOD.select(live, size(x, clouds.y[live], clouds.z[live], 2.2*clouds.w[live]),
+                                         clouds.serial[live])
+    live, x = view["eggs"]
+    view["egg_lod"] = EGG_LOD.select(live, size(x, coins.y[live], coins.z[live], 0.5), coins.serial[live])
 
-        if invuln_t<=0 and aabb(dino["x"],dino["y"]+dh/2,dino["z"],dino["w"],dh,dino["d"],
-                                o["x"],o["y"]+o["h"]/2,o["z"],o["w"],o["h"],o["d"]):
-            lives -= 1; invuln_t=1.2
+# Scenery:
 
-        if o["x"] < -40: 
-            obstacles.remove(o)
+def grow_trees(rng, x0, x1):
 
-    for c in coins[:]:
+    # One chunk's trees, spread along it and alternating verges at random
+    # (runs on the streamer's worker thread; rng is the chunk's own) :
 
-        c["x"] -= c["speed"]*speed_mul*dt
-        dh = dino["h"]*(0.65 if dino["crouch"] and not dino["jumping"] else 1.0)
+    trees = []
+    for i in range(trees_per_chunk):
+        x = x0 + (i + rng.uniform(0.1, 0.9)) * (x1 - x0) / trees_per_chunk
+        side = -1 if rng.random() < 0.5 else 1
+        trees.append((x, side * rng.uniform(7.5, 10.0)))
+    return trees
 
-        if aabb(dino["x"],dino["y"]+dh/2,dino["z"],dino["w"],dh,dino["d"],
-                c["x"],c["y"],c["z"],0.6,0.6,0.6):
-            
-            eggs_collected += 1
-            score += 10
-            coins.remove(c)
+scenery = dino_world.WorldStreamer(grow_trees, seed=random.getrandbits(32), size=40.0, ahead=160.0, behind=40.0)
 
-        if c["x"] < -40: 
-            coins.remove(c)
+# Rendering:
 
-    for cl in clouds[:]:
-        cl["x"] -= cl["speed"]*speed_mul*dt
+# Light position, diffuse, ambient :
 
-        if cl["x"] < -80:
-            clouds.remove(cl)
+DAY_LIGHT = ((6,10,12,1), (1,1,1,1), (0.35,0.35,0.35,1))
+NIGHT_LIGHT = ((0,10,8,1), (0.65,0.65,0.7,1), (0.15,0.15,0.2,1))
 
-    speed_factor =(0.985)**(score//5)
-    SPAWN_T -= dt; COIN_T -= dt; CLOUD_T -= dt
+lighting = None  # dino_lighting.Lighting when shaders can light the world (set in init_gl)
 
-    if SPAWN_T<=0: 
-        SPAWN_T =max(0.3, random.uniform(SPAWN_INT_BASE, SPAWN_INT_BASE+SPAWN_INT_JIT)*speed_factor); spawn_obstacle()
+def setup_lighting():
+    glEnable(GL_LIGHTING); glEnable(GL_LIGHT0)
 
-    if COIN_T<=0: 
-        COIN_T =max(0.2, random.uniform(0.8, 1.4)*speed_factor); spawn_coin()
+    position, diffuse, ambient = NIGHT_LIGHT if is_night else DAY_LIGHT
+    glLightfv(GL_LIGHT0,GL_POSITION,position)
+    glLightfv(GL_LIGHT0,GL_DIFFUSE,diffuse)
+    glLightfv(GL_LIGHT0,GL_AMBIENT,ambient)
 
-    if CLOUD_T<=0: 
-        CLOUD_T =max(0.25, random.uniform(CLOUD_INT_BASE, CLOUD_INT_BASE+CLOUD_INT_JIT)); spawn_cloud()
+    glEnable(GL_COLOR_MATERIAL)
+    glColorMaterial(GL_FRONT_AND_BACK,GL_AMBIENT_AND_DIFFUSE)
 
-    if lives <=0: 
-        game_over=True; running=False
+def set_lit(lit):
 
-# Rendering:
+    # Switch lighting for what follows, on whichever path lights the world :
 
-def setup_lighting():
-    glEnable(GL_LIGHTING); glEnable(GL_LIGHT0)
+    if lighting is not None:
+        lighting.set_lit(lit)
+    elif lit:
+        glEnable(GL_LIGHTING)
+    else:
+        glDisable(GL_LIGHTING)
 
-    if is_night:
+show_profile = False
 
-        glLightfv(GL_LIGHT0,GL_POSITION,(0,10,8,1))
-        glLightfv(GL_LIGHT0,GL_DIFFUSE,(0.65,0.65,0.7,1))
-        glLightfv(GL_LIGHT0,GL_AMBIENT,(0.15,0.15,0.2,1))
+def draw_profile_overlay():
 
-    else:
+    # Stacked per-phase frame-time graph beside the score HUD, with a
+    # legend of mean ms / GL calls per phase :
 
-        glLightfv(GL_LIGHT0,GL_POSITION,(6,10,12,1))
-        glLightfv(GL_LIGHT0,GL_DIFFUSE,(1,1,1,1))
-        glLightfv(GL_LIGHT0,GL_AMBIENT,(0.35,0.35,0.35,1))
+    gx, gy, gw, gh = 180, WIN_H-190, 360, 176
+    profiler.draw_graph(gx, gy, gw, gh)
 
-    glEnable(GL_COLOR_MATERIAL)
-    glColorMaterial(GL_FRONT_AND_BACK,GL_AMBIENT_AND_DIFFUSE)
+    for n, (name, ms, calls) in enumerate(profiler.summary()):
+        draw_text(gx+gw+12, WIN_H-20-15*n, f"{name:<9} {ms:6.2f} ms {calls:6.0f} calls", FONT_SMALL,
+                  dino_profiler.PHASE_COLORS[n])
 
-def display():
+def toggle_profiler():
+
+    global show_profile
+    show_profile = not show_profile
+    profiler.enabled = show_profile or profiler.log is not None
+
+    # Only count GL calls while someone is looking :
+
+    if profiler.enabled:
+        dino_profiler.count_gl_calls(globals(), dino_meshes, dino_instancing, dino_text, dino_lighting, dino_stars)
+    else:
+        dino_profiler.restore_gl_calls()
+
+def render():
+
+    alpha = clock.alpha
+    dino_y = lerp(sim.dino_prev_y, dino["y"], alpha)
 
+    profiler.phase("clear")
     glClearColor(*(NIGHT_SKY if is_night else SKY),1.0)
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+    profiler.phase("camera")
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity(); gluPerspective(FOV,ASPECT,0.1,400)
     
@@ -556,11 +621,11 @@ def display():
 
     # Camera position: Dino head :
 
-        eye = [dino["x"], dino["y"] + 8, dino["z"]]
+        eye = [dino["x"], dino_y + 8, dino["z"]]
 
     # Look forward in the +Y (track) direction :
 
-        ctr = [dino["x"], dino["y"] + 8, dino["z"] + 40]
+        ctr = [dino["x"], dino_y + 8, dino["z"] + 40]
 
     else:
 
@@ -573,25 +638,59 @@ def display():
         ctr = [tx, ty, tz]
 
     gluLookAt(*eye, *ctr, 0,1,0)
+    view_matrix = dino_culling.look_at(eye, ctr, (0,1,0))
+    frustum = dino_culling.Frustum(dino_culling.perspective(FOV, ASPECT, 0.1, 400).dot(view_matrix))
+    distance = lerp(sim.prev_distance, sim.distance, alpha)
+    scenery.update(distance)
+    view = cull_scene(frustum, alpha, distance)
+    choose_lod(view, eye)
+
+    profiler.phase("lighting")
+    if lighting is not None:
+
+        # The light block only changes with day/night; the eye-space
+        # position follows the camera :
+
+        lighting.update(is_night, *(NIGHT_LIGHT if is_night else DAY_LIGHT))
+        lighting.begin(view_matrix)
 
-    setup_lighting()
-    draw_ground()
+    else:
+        setup_lighting()
+    profiler.phase("ground")
+    replay_ground()
+
+    profiler.phase("trees")
+    for (tx,tz), level in zip(view["trees"][1], view["tree_lod"]): draw_tree(tx, tz, TREE_LOD.levels[level])
 
-    for tx,tz in trees: draw_tree(tx - dino["x"], tz)
-    for cl in clouds: draw_cloud_entity(cl)
+    if instanced:
+        draw_entities_instanced(view)
+        if lighting is not None:
+            lighting.use()  # the batches leave no program bound
+
+    else:
+        profiler.phase("clouds")
+        for (i, x), level in zip(zip(*view["clouds"]), view["cloud_lod"]):
+            draw_cloud_entity(x, clouds.y[i], clouds.z[i], clouds.w[i], level)
 
-    for o in obstacles:
+        profiler.phase("obstacles")
+        for i, x in zip(*view["cacti"]):
+            draw_cactus(x, obstacles.y[i], obstacles.z[i])
 
-        if o["type"]=="cactus":
-            draw_cactus(o)
+        for i, x in zip(*view["pteros"]):
+            draw_ptero(x, obstacles.y[i], obstacles.z[i], obstacles.w[i], obstacles.h[i], obstacles.d[i])
 
-        else: 
-            draw_ptero(o)
-    for c in coins: 
+        profiler.phase("eggs")
+        for (i, x), level in zip(zip(*view["eggs"]), view["egg_lod"]): 
 
-        draw_coin(c)  # eggs
+            draw_coin(x, coins.y[i], coins.z[i], level)  # eggs
 
-    draw_dino()
+    profiler.phase("dino")
+    draw_dino(dino_y)
+    dino_meshes.release()
+    if lighting is not None:
+        lighting.end()
+
+    profiler.phase("hud")
     glDisable(GL_LIGHTING)
     begin_2d()
 
@@ -600,62 +699,60 @@ def display():
     if is_night:
 
         glDisable(GL_LIGHTING)
-        glPointSize(2.0)
-        glBegin(GL_POINTS)
-        glColor3f(0.9,0.9,1.0)
-        for sx, sy in stars: glVertex2f(sx, sy)
-        glEnd()
+        star_field.draw(stars, anim_clock() if twinkle else None)
         glEnable(GL_LIGHTING)
 
-    draw_text(14, WIN_H-26, f"Score: {score}", FONT_BIG, BLACK)
-    draw_text(14, WIN_H-54, f"Lives: {lives}", FONT_BIG, BLACK)
-    draw_text(14, WIN_H-82, f"Eggs: {eggs_collected}", FONT_BIG, BLACK)
+    draw_text(14, WIN_H-26, f"Score: {sim.score}", FONT_BIG, BLACK)
+    draw_text(14, WIN_H-54, f"Lives: {sim.lives}", FONT_BIG, BLACK)
+    draw_text(14, WIN_H-82, f"Eggs: {sim.eggs_collected}", FONT_BIG, BLACK)
 
-    if not running and not game_over:
+    if not sim.running and not sim.game_over:
 
         draw_text(WIN_W/2-70, WIN_H/2+10, "PAUSED", FONT_BIG, BLACK)
         draw_text(WIN_W/2-170, WIN_H/2-20, "Press P to resume | R to restart", FONT_SMALL, BLACK)
 
-    if game_over:
+    if sim.game_over:
 
         draw_text(WIN_W/2-80, WIN_H/2+10, "GAME OVER", FONT_BIG, BLACK)
         draw_text(WIN_W/2-160, WIN_H/2-20, "Press R to restart | Q to quit", FONT_SMALL, BLACK)
 
+    profiler.end_frame()
+    if show_profile:
+        draw_profile_overlay()
+
     end_2d()
+
+def display():
+
+    render()
     glutSwapBuffers()
 
 #Input :
 
 def keyboard(key, x, y):
 
-    global running, dino, view_first_person, lives, score, game_over, obstacles, coins, clouds, eggs_collected, is_night
+    global view_first_person, is_night
     key = key.decode("utf-8").lower()
 
-    if key == 'w' and not dino["jumping"]:
-
-        dino["vy"] = JUMP_V; dino["jumping"]=True
-
-    if key == 's':
+    # W jump, S crouch, P pause, R restart :
 
-        dino["crouch"]=True
+    sim.key_down(key)
 
     # Removed A/D/Q/E lane/road switching :
 
-    if key == 'p': 
-        running = not running
     if key == 'c':
         view_first_person = not view_first_person
     if key == 'n':
         is_night = not is_night
-    if key == 'r':
-        lives=3; score=0; eggs_collected=0; obstacles.clear(); coins.clear(); clouds.clear(); dino["y"]=0; dino["z"]=0.0; dino["jumping"]=False; game_over=False; running=True
-    if key =='q'and game_over : 
+    if key == 'f':
+        toggle_profiler()
+    if key =='q'and sim.game_over : 
         glutLeaveMainLoop()
 
 def keyboard_up(key,x,y):
 
     key = key.decode("utf-8").lower()
-    if key=='s': dino["crouch"]=False
+    sim.key_up(key)
 
 def special_keyboard(key, x, y):
 
@@ -689,26 +786,119 @@ def special_keyboard(key, x, y):
 
 def timer(t):
 
-    global last_time
-    curr = time.time(); dt = curr-last_time; last_time = curr
-    update(dt)
+    profiler.phase("update")
+    for _ in range(clock.advance()):
+        sim.step()
+        if recorder is not None:
+            recorder.stepped(sim)
+    profiler.stop()
     glutPostRedisplay()
     glutTimerFunc(16, timer, 0)
 
 # Main :
 
+def set_window_size(w, h):
+
+    # Everything sized by the window follows: the 2D overlay's projection,
+    # the perspective aspect, LOD pixel sizes and the night sky's stars :
+
+    global WIN_W, WIN_H, ASPECT, stars
+    stars = [(x * w / WIN_W, y * h / WIN_H) for x, y in stars]
+    WIN_W, WIN_H = w, h
+    ASPECT = WIN_W / WIN_H
+
+def init_gl():
+
+    # Per-context setup, shared by the window and offscreen capture :
+
+    global instanced, atlas_text, lighting, ground_commands
+    glEnable(GL_DEPTH_TEST)
+    glEnable(GL_NORMALIZE)  # meshes are scaled, keep lit normals unit length
+    instanced = dino_instancing.available()
+    if dino_lighting.available():
+        lighting = dino_lighting.Lighting()
+        dino_instancing.set_lighting(lighting)
+    atlas_text = dino_text.available()
+    ground_commands = None
+
+def release_gl():
+
+    # Delete what init_gl() and drawing created, while the context is still
+    # current; left to the garbage collector they would be freed during
+    # interpreter shutdown, with no context and half the modules gone :
+
+    global lighting, ground_commands
+    ground_commands = None
+    for batch in batches.values():
+        batch.delete()
+    batches.clear()
+    dino_instancing.set_lighting(None)  # deletes the instancing program
+    if lighting is not None:
+        lighting.delete()
+        lighting = None
+    star_field.delete()
+    dino_text.clear()
+    dino_meshes.clear()
+
+def seed_world(seed):
+
+    # Same seed, same game: the simulation's spawns, the star field and
+    # the scenery :
+
+    global stars
+    sim.reset(seed)
+    random.seed(seed)
+    stars = scatter_stars()
+    scenery.reset(seed)
+
 def main():
-    
+
+    parser = argparse.ArgumentParser(description="3D Dino Runner")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="stream per-phase frame timings to PATH (.csv, or .json for JSON lines)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the session's input to PATH for dino_replay.py")
+    parser.add_argument("--seed", type=int, help="seed the game (recordings pick one if not given)")
+    parser.add_argument("--twinkle", action="store_true", help="twinkle the night sky's stars")
+    parser.add_argument("--trees-per-chunk", type=int, help="scenery density: trees per 40 units (default 4)")
+    args, _ = parser.parse_known_args()
+
+    global recorder, twinkle, trees_per_chunk
+    twinkle = args.twinkle
+    if args.trees_per_chunk is not None:
+        trees_per_chunk = args.trees_per_chunk
+        scenery.capacity = max(scenery.capacity, trees_per_chunk)
+        scenery.reset(scenery.seed)
+
+    if args.profile:
+        profiler.open_log(args.profile); atexit.register(profiler.close_log)
+        profiler.enabled = True
+        dino_profiler.count_gl_calls(globals(), dino_meshes, dino_instancing, dino_text, dino_lighting, dino_stars)
+
     glutInit(); glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
     glutInitWindowSize(WIN_W, WIN_H); glutInitWindowPosition(100,50)
     glutCreateWindow(b"3D Dino Runner")
-    glEnable(GL_DEPTH_TEST)
-    seed_trees()
+    init_gl()
+
+    seed = args.seed
+    if seed is None and args.record:
+        seed = random.SystemRandom().randrange(2**31)
+    if seed is not None:
+        seed_world(seed)
+
+    on_key, on_key_up, on_special = keyboard, keyboard_up, special_keyboard
+    if args.record:
+        recorder = dino_replay.Recorder(seed); atexit.register(recorder.save, args.record)
+        on_key = recorder.wrap("keyboard", keyboard)
+        on_key_up = recorder.wrap("keyboard_up", keyboard_up)
+        on_special = recorder.wrap("special", special_keyboard)
+
     glutDisplayFunc(display)
-    glutKeyboardFunc(keyboard)
-    glutKeyboardUpFunc(keyboard_up)
-    glutSpecialFunc(special_keyboard)
+    glutKeyboardFunc(on_key)
+    glutKeyboardUpFunc(on_key_up)
+    glutSpecialFunc(on_special)
     glutTimerFunc(0,timer,0)
+    clock.reset()
     glutMainLoop()
 
 if __name__=="__main__":
@@ -0,0 +1,3 @@
+"""OpenGL Extensions"""
+from OpenGL import lazynamespace as _lazynamespace
+__getattr__, __dir__ = _lazynamespace.submodules( __name__ )
@@ -1 +1,3 @@
-"""OpenGL Extensions"""
\ No newline at end of file
+"""OpenGL Extensions"""
+from OpenGL import lazynamespace as _lazynamespace
+__getattr__, __dir__ = _lazynamespace.submodules( __name__ )
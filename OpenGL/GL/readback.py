@@ -0,0 +1,207 @@
+"""Asynchronous glReadPixels through a ring of pixel-pack buffers
+
+glReadPixels into client memory has to wait until every command that
+draws into the read buffer has finished, then copies the pixels while the
+pipeline sits idle.  With a buffer object bound to GL_PIXEL_PACK_BUFFER
+(ARB_pixel_buffer_object, core in OpenGL 2.1) the read only *queues* a
+copy into the buffer and returns at once; mapping the buffer later is what
+waits for the data.
+
+AsyncReadback keeps count such buffers and uses them round-robin, so the
+pixels of frame K are collected while frame K+1 (.. K+count-1) is being
+rendered:
+
+    readback = AsyncReadback( width, height, GL_RGB, count=2 )
+    while rendering:
+        render_frame()
+        pixels = readback.readPixels()  # None until the ring is full
+        if pixels is not None:
+            use( pixels )               # pixels of an earlier frame
+    for pixels in readback.flush():
+        use( pixels )
+    readback.delete()
+
+Each queued read is guarded by a fence (OpenGL 3.2 / ARB_sync) so
+ready() can tell whether the oldest read has landed without blocking.
+Without sync objects everything still works, mapping simply blocks until
+the copy is done.
+
+Results are returned in the same array shape and type that
+OpenGL.GL.glReadPixels would produce for the same arguments, or copied
+into an array you pass in.
+"""
+import ctypes
+from OpenGL import images, arrays
+from OpenGL.extensions import alternate
+from OpenGL.raw.GL.VERSION import GL_1_1 as _simple
+from OpenGL.GL.VERSION.GL_1_5 import *
+from OpenGL.GL.VERSION.GL_2_1 import GL_PIXEL_PACK_BUFFER
+from OpenGL.GL.VERSION import GL_3_2
+from OpenGL.GL.ARB.vertex_buffer_object import *
+from OpenGL.GL.ARB import sync
+
+__all__ = ( 'AsyncReadback', )
+
+glGenBuffers = alternate( glGenBuffers, glGenBuffersARB )
+glBindBuffer = alternate( glBindBuffer, glBindBufferARB )
+glBufferData = alternate( glBufferData, glBufferDataARB )
+glMapBuffer = alternate( glMapBuffer, glMapBufferARB )
+glUnmapBuffer = alternate( glUnmapBuffer, glUnmapBufferARB )
+glDeleteBuffers = alternate( glDeleteBuffers, glDeleteBuffersARB )
+glFenceSync = alternate( GL_3_2.glFenceSync, sync.glFenceSync )
+glClientWaitSync = alternate( GL_3_2.glClientWaitSync, sync.glClientWaitSync )
+glDeleteSync = alternate( GL_3_2.glDeleteSync, sync.glDeleteSync )
+
+class AsyncReadback( object ):
+    """Ring of GL_PIXEL_PACK_BUFFER objects for non-blocking pixel reads
+
+    width, height -- size of the region read by every readPixels call
+    format, type -- as for glReadPixels
+    count -- number of buffers, i.e. how many reads may be in flight;
+        2 gives classic double-buffered readback
+    usage -- buffer usage hint
+    """
+    def __init__(
+        self, width, height, format=_simple.GL_RGBA, type=_simple.GL_UNSIGNED_BYTE,
+        count=2, usage=GL_STREAM_READ,
+    ):
+        if count < 1:
+            raise ValueError( """Need at least one pack buffer, got %r"""%(count,) )
+        self.width, self.height = int(width), int(height)
+        self.format, self.type = format, type
+        self.arrayType = arrays.GL_CONSTANT_TO_ARRAY_TYPE[
+            images.TYPE_TO_ARRAYTYPE.get( type, type )
+        ]
+        template = images.createTargetArray( format, (self.width, self.height), type )
+        self.shape = self.arrayType.dimensions( template )
+        self.nbytes = self.arrayType.arrayByteCount( template )
+        self.fenced = bool( glFenceSync ) and bool( glClientWaitSync )
+        self.buffers = [int(b) for b in glGenBuffers( count )] if count > 1 else [int(glGenBuffers( 1 ))]
+        for buffer in self.buffers:
+            glBindBuffer( GL_PIXEL_PACK_BUFFER, buffer )
+            glBufferData( GL_PIXEL_PACK_BUFFER, self.nbytes, None, usage )
+        glBindBuffer( GL_PIXEL_PACK_BUFFER, 0 )
+        self.next = 0
+        # FIFO of (buffer index, fence or None, tag) for queued reads
+        self.pending = []
+
+    def __len__( self ):
+        """Number of reads queued and not yet collected"""
+        return len( self.pending )
+
+    def full( self ):
+        """Whether every buffer holds a read that has not been collected"""
+        return len( self.pending ) >= len( self.buffers )
+
+    def start( self, x=0, y=0, tag=None ):
+        """Queue a read of the current read buffer into the next pack buffer
+
+        tag -- any value, handed back by collect( withTag=True ); useful
+            for frame numbers
+
+        Raises RuntimeError if all buffers are still waiting to be
+        collected.
+        """
+        if self.full():
+            raise RuntimeError(
+                """All %s pack buffers are in flight, collect() one first"""%(len(self.buffers),)
+            )
+        index = self.next
+        self.next = (index + 1) % len( self.buffers )
+        images.setupDefaultTransferMode()
+        images.rankPacking( 3 )
+        glBindBuffer( GL_PIXEL_PACK_BUFFER, self.buffers[index] )
+        try:
+            _simple.glReadPixels(
+                x, y, self.width, self.height, self.format, self.type,
+                ctypes.c_void_p( 0 ),
+            )
+        finally:
+            glBindBuffer( GL_PIXEL_PACK_BUFFER, 0 )
+        fence = None
+        if self.fenced:
+            fence = glFenceSync( GL_3_2.GL_SYNC_GPU_COMMANDS_COMPLETE, 0 )
+        self.pending.append( (index, fence, tag) )
+
+    def ready( self ):
+        """Whether the oldest queued read can be collected without blocking
+
+        Always True when sync objects are unavailable (there is no way
+        to ask, mapping will wait).
+        """
+        if not self.pending:
+            return False
+        fence = self.pending[0][1]
+        if fence is None:
+            return True
+        result = glClientWaitSync( fence, GL_3_2.GL_SYNC_FLUSH_COMMANDS_BIT, 0 )
+        return result in (GL_3_2.GL_ALREADY_SIGNALED, GL_3_2.GL_CONDITION_SATISFIED)
+
+    def collect( self, array=None, wait=True, withTag=False ):
+        """Return the pixels of the oldest queued read
+
+        array -- optional array to copy the pixels into (at least nbytes
+            long); by default a new array shaped like glReadPixels' result
+        wait -- if False, return None instead of blocking when the read
+            has not completed yet
+        withTag -- return (pixels, tag) instead of pixels
+
+        Returns None when nothing is queued.
+        """
+        if not self.pending:
+            return None
+        if not wait and not self.ready():
+            return None
+        index, fence, tag = self.pending.pop( 0 )
+        if fence is not None:
+            glDeleteSync( fence )
+        if array is None:
+            array = self.arrayType.zeros( self.shape )
+        elif self.arrayType.arrayByteCount( array ) < self.nbytes:
+            raise ValueError(
+                """Array of %s bytes is too small for %s bytes of pixels"""%(
+                    self.arrayType.arrayByteCount( array ), self.nbytes,
+                )
+            )
+        target = self.arrayType.voidDataPointer( array )
+        glBindBuffer( GL_PIXEL_PACK_BUFFER, self.buffers[index] )
+        try:
+            pointer = glMapBuffer( GL_PIXEL_PACK_BUFFER, GL_READ_ONLY )
+            if not pointer:
+                raise RuntimeError( """glMapBuffer failed for pack buffer %s"""%(self.buffers[index],) )
+            try:
+                ctypes.memmove( target, pointer, self.nbytes )
+            finally:
+                glUnmapBuffer( GL_PIXEL_PACK_BUFFER )
+        finally:
+            glBindBuffer( GL_PIXEL_PACK_BUFFER, 0 )
+        if withTag:
+            return array, tag
+        return array
+
+    def readPixels( self, x=0, y=0, array=None, tag=None, withTag=False ):
+        """Queue a read; once the ring is full, collect and return the oldest
+
+        This is the one-call pipelined form: with count buffers it returns
+        None for the first count-1 calls and then, on every call, the
+        pixels read count-1 calls earlier.
+        """
+        self.start( x, y, tag )
+        if self.full():
+            return self.collect( array, withTag=withTag )
+        return None
+
+    def flush( self, withTag=False ):
+        """Yield the pixels of every read still queued, oldest first"""
+        while self.pending:
+            yield self.collect( withTag=withTag )
+
+    def delete( self ):
+        """Release the fences and buffers (needs the context to be current)"""
+        for index, fence, tag in self.pending:
+            if fence is not None:
+                glDeleteSync( fence )
+        self.pending = []
+        if self.buffers:
+            glDeleteBuffers( len(self.buffers), self.buffers )
+            self.buffers = []
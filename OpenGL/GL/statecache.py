@@ -0,0 +1,332 @@
+"""Client-side shadow of GL state that skips redundant state changes
+
+Immediate-mode code tends to re-issue state it already set: a
+glDisable( GL_LIGHTING )/glEnable( GL_LIGHTING ) pair around every
+unlit object, glColor3f with the colour that is already current,
+glEnable( GL_DEPTH_TEST ) after every 2D overlay.  Each of those goes
+through the full wrapper and error-checking machinery although the GL
+ends up exactly where it was.
+
+The functions in this module remember, per context, the last value they
+set for
+
+    * capabilities (glEnable/glDisable, glEnableClientState/
+      glDisableClientState)
+    * bound objects (glBindTexture per texture unit, glBindBuffer per
+      target, glUseProgram)
+    * the current colour (glColor3f/glColor4f)
+    * blending (glBlendFunc, glBlendEquation) and depth (glDepthFunc,
+      glDepthMask) state
+
+and return without calling the GL when asked to set the value already in
+place.  State the cache has not seen set is unknown and always set.
+
+The cache is opt-in.  Set OpenGL.STATE_CACHE = True (or the environment
+variable PYOPENGL_STATE_CACHE=1) before importing OpenGL.GL and these
+functions replace their plain counterparts in the OpenGL.GL namespace
+(and the core VBO implementation binds buffers through it), or import
+them explicitly from this module.
+
+Invalidation:
+
+    * every context has its own cache.  Asking the platform for the
+      current context costs about as much as the calls being elided,
+      so it is not done per call: the cache of the context current at
+      the first call stays active until switch() is called.  GLUT's
+      glutSetWindow/glutCreateWindow call it for you; after making a
+      context current any other way (EGL, GLX, WGL, OSMesa, GUI
+      toolkits) call switch() yourself.  With OpenGL.CONTEXT_CHECKING
+      set every call looks the context up instead
+    * glPopAttrib, glPopClientAttrib, glCallList and glCallLists
+      forget everything for the current context, as they may restore
+      or change any of the shadowed state
+    * the other glColor* entry points forget the current colour, as do
+      array draws while GL_COLOR_ARRAY may be enabled
+    * deleting textures, buffers or programs forgets the bindings
+    * binding or deleting vertex array objects forgets the
+      GL_ELEMENT_ARRAY_BUFFER binding, which is part of the VAO state
+
+State changed any other way (the raw OpenGL.raw.GL functions, other
+libraries calling the GL directly, OpenGL.GL.VERSION modules, extension
+entry points) is invisible to the cache; call invalidate() afterwards.
+Call invalidate( context ) as well when a context is destroyed, since
+platforms may hand out the same handle for a new context.
+"""
+import re
+from OpenGL import platform, _configflags
+from OpenGL import GL as _GL
+
+__all__ = [
+    'StateCache',
+    'current',
+    'switch',
+    'invalidate',
+]
+
+class StateCache( object ):
+    """Last values set through this module for one context
+
+    Keys missing from the dictionaries are unknown state.
+    """
+    def __init__( self ):
+        # capability: bool
+        self.capabilities = {}
+        # client-side array: bool
+        self.clientCapabilities = {}
+        # ('texture',unit,target), ('buffer',target) or 'program': name
+        self.bindings = {}
+        # 'activeTexture', 'color', 'blendFunc', 'blendEquation',
+        # 'depthFunc', 'depthMask': value
+        self.values = {}
+        # number of calls elided so far
+        self.skipped = 0
+    def clear( self ):
+        """Forget all shadowed state (the skipped count is kept)"""
+        self.capabilities.clear()
+        self.clientCapabilities.clear()
+        self.bindings.clear()
+        self.values.clear()
+
+_caches = {
+    # map from context ID: StateCache
+}
+# StateCache of the context believed to be current
+_active = None
+
+def switch( context=None ):
+    """Activate the cache of context (default the current context)
+
+    Call after making another context current; returns the cache, None
+    if there is no current context.
+    """
+    global _active
+    if context is None:
+        context = platform.GetCurrentContext()
+    if not context:
+        _active = None
+        return None
+    cache = _caches.get( context )
+    if cache is None:
+        cache = _caches[context] = StateCache()
+    if not _configflags.CONTEXT_CHECKING:
+        # otherwise _active stays None and every call looks up the context
+        _active = cache
+    return cache
+
+def current( ):
+    """StateCache of the active context, None if no context is current"""
+    return _active or switch()
+
+def invalidate( context=None ):
+    """Forget the shadowed state of context (default the current context)"""
+    global _active
+    if context is None:
+        context = platform.GetCurrentContext()
+    cache = _caches.pop( context, None )
+    if cache is not None and cache is _active:
+        _active = None
+
+# The wrappers below sit in front of calls made many times per frame, so
+# they are plain closures doing the cache lookup inline rather than
+# lazywrapper objects; where the GL lacks the entry point the (null)
+# base function is exported unchanged.
+
+def _export( name, baseFunction, wrapper, doc ):
+    if baseFunction:
+        wrapper.__name__ = wrapper.__qualname__ = name
+        wrapper.__doc__ = doc
+        wrapper.wrappedOperation = wrapper.__wrapped__ = baseFunction
+    else:
+        wrapper = baseFunction
+    globals()[name] = wrapper
+    __all__.append( name )
+
+def _setting( name, key, doc ):
+    """Export name as a setter of values[key] (the argument tuple) that
+    skips the call when nothing changes"""
+    baseFunction = getattr( _GL, name )
+    def setter( *args ):
+        cache = _active or switch()
+        if cache is None:
+            return baseFunction( *args )
+        if cache.values.get( key ) == args:
+            cache.skipped += 1
+            return None
+        result = baseFunction( *args )
+        cache.values[key] = args
+        return result
+    _export( name, baseFunction, setter, doc )
+
+def _capability( name, table, value, doc ):
+    """Export name as glEnable/glDisable style call for table"""
+    baseFunction = getattr( _GL, name )
+    def setter( cap ):
+        cache = _active or switch()
+        if cache is None:
+            return baseFunction( cap )
+        known = getattr( cache, table )
+        if known.get( cap ) is value:
+            cache.skipped += 1
+            return None
+        result = baseFunction( cap )
+        known[cap] = value
+        return result
+    _export( name, baseFunction, setter, doc )
+
+def _name( value ):
+    """Object name as an int, None if value is not usable as a cache key"""
+    try:
+        return int( value )
+    except (TypeError,ValueError):
+        return None
+
+def _binding( name, key, doc ):
+    """Export name as a bind call that skips re-binding the bound object
+
+    key -- function of the cache and the arguments giving the bindings key
+    """
+    baseFunction = getattr( _GL, name )
+    def bind( *args ):
+        cache = _active or switch()
+        if cache is None:
+            return baseFunction( *args )
+        k = key( cache, args )
+        bound = _name( args[-1] )
+        if bound is not None and cache.bindings.get( k ) == bound:
+            cache.skipped += 1
+            return None
+        result = baseFunction( *args )
+        if bound is None:
+            cache.bindings.pop( k, None )
+        else:
+            cache.bindings[k] = bound
+        return result
+    _export( name, baseFunction, bind, doc )
+
+def _forgetting( name, table, key, doc ):
+    """Export name as a call that makes table[key] (or all of table) unknown"""
+    baseFunction = getattr( _GL, name )
+    def forgetting( *args, **named ):
+        cache = _active or switch()
+        if cache is not None:
+            known = getattr( cache, table )
+            if key is None:
+                known.clear()
+            else:
+                known.pop( args[0] if key is _FIRST else key, None )
+        return baseFunction( *args, **named )
+    _export( name, baseFunction, forgetting, doc )
+_FIRST = object()
+
+def _clearing( name ):
+    """Export name as a call after which all shadowed state is unknown"""
+    baseFunction = getattr( _GL, name )
+    def clearing( *args, **named ):
+        result = baseFunction( *args, **named )
+        cache = _active or switch()
+        if cache is not None:
+            cache.clear()
+        return result
+    _export( name, baseFunction, clearing, """%s, then forget the shadowed state it may change"""%(name,) )
+
+def _drawing( name ):
+    """Export an array draw, which changes the colour if GL_COLOR_ARRAY is on
+
+    A GL_COLOR_ARRAY state the cache has not seen set is queried once.
+    """
+    baseFunction = getattr( _GL, name )
+    def drawing( *args, **named ):
+        cache = _active or switch()
+        if cache is not None and 'color' in cache.values:
+            colors = cache.clientCapabilities.get( _GL.GL_COLOR_ARRAY )
+            if colors is None:
+                colors = cache.clientCapabilities[_GL.GL_COLOR_ARRAY] = bool( _GL.glIsEnabled( _GL.GL_COLOR_ARRAY ) )
+            if colors:
+                del cache.values['color']
+        return baseFunction( *args, **named )
+    _export( name, baseFunction, drawing, baseFunction.__doc__ )
+
+def _activeTexture( cache, args ):
+    unit = cache.values.get( 'activeTexture' )
+    if unit is None:
+        unit = cache.values['activeTexture'] = (int( _GL.glGetIntegerv( _GL.GL_ACTIVE_TEXTURE ) ),)
+    return ('texture',unit,args[0])
+
+_capability( 'glEnable', 'capabilities', True, """Enable cap unless it is known to be enabled""" )
+_capability( 'glDisable', 'capabilities', False, """Disable cap unless it is known to be disabled""" )
+_forgetting( 'glEnablei', 'capabilities', _FIRST, """Enable an indexed capability, making the plain capability unknown""" )
+_forgetting( 'glDisablei', 'capabilities', _FIRST, """Disable an indexed capability, making the plain capability unknown""" )
+_capability( 'glEnableClientState', 'clientCapabilities', True, """Enable a client-side array unless it is known to be enabled""" )
+_capability( 'glDisableClientState', 'clientCapabilities', False, """Disable a client-side array unless it is known to be disabled""" )
+
+_setting( 'glActiveTexture', 'activeTexture', """Select the active texture unit unless it is already selected""" )
+_binding( 'glBindTexture', _activeTexture, """Bind texture on the active unit unless it is already bound there""" )
+_binding( 'glBindBuffer', lambda cache, args: ('buffer',args[0]), """Bind buffer to target unless it is already bound there""" )
+_forgetting( 'glBindBufferBase', 'bindings', None, """Bind an indexed buffer (also binding the generic target), forgetting the bindings""" )
+_forgetting( 'glBindBufferRange', 'bindings', None, """Bind an indexed buffer range (also binding the generic target), forgetting the bindings""" )
+_binding( 'glUseProgram', lambda cache, args: 'program', """Install program unless it is already current""" )
+_forgetting( 'glDeleteTextures', 'bindings', None, """Delete textures; deleted textures that were bound revert to 0""" )
+_forgetting( 'glDeleteBuffers', 'bindings', None, """Delete buffers; deleted buffers that were bound revert to 0""" )
+_forgetting( 'glDeleteProgram', 'bindings', 'program', """Delete program, forgetting the current program""" )
+_forgetting( 'glBindVertexArray', 'bindings', ('buffer',_GL.GL_ELEMENT_ARRAY_BUFFER), """Bind a vertex array object, forgetting the element array buffer it brings with it""" )
+_forgetting( 'glDeleteVertexArrays', 'bindings', ('buffer',_GL.GL_ELEMENT_ARRAY_BUFFER), """Delete vertex array objects (a deleted bound one reverts to 0), forgetting the element array buffer""" )
+
+_setting( 'glColor4f', 'color', """Set the current colour unless it is already current""" )
+_forgetting( 'glBlendFuncSeparate', 'values', 'blendFunc', """Set separate blend factors, making the blend factors unknown""" )
+_setting( 'glBlendFunc', 'blendFunc', """Set the blend factors unless they are already set""" )
+_setting( 'glBlendEquation', 'blendEquation', """Set the blend equation unless it is already set""" )
+_forgetting( 'glBlendEquationSeparate', 'values', 'blendEquation', """Set separate blend equations, making the blend equation unknown""" )
+_setting( 'glDepthFunc', 'depthFunc', """Set the depth comparison unless it is already set""" )
+
+def _colour3f( baseFunction=_GL.glColor3f ):
+    def glColor3f( red, green, blue ):
+        cache = _active or switch()
+        if cache is None:
+            return baseFunction( red, green, blue )
+        colour = (red,green,blue,1.0)
+        if cache.values.get( 'color' ) == colour:
+            cache.skipped += 1
+            return None
+        result = baseFunction( red, green, blue )
+        cache.values['color'] = colour
+        return result
+    _export( 'glColor3f', baseFunction, glColor3f, """Set the current colour unless it is already current""" )
+_colour3f()
+def _depthMask( baseFunction=_GL.glDepthMask ):
+    def glDepthMask( flag ):
+        cache = _active or switch()
+        if cache is None:
+            return baseFunction( flag )
+        flag = bool( flag )
+        if cache.values.get( 'depthMask' ) is flag:
+            cache.skipped += 1
+            return None
+        result = baseFunction( flag )
+        cache.values['depthMask'] = flag
+        return result
+    _export( 'glDepthMask', baseFunction, glDepthMask, """Turn depth writes on or off unless they already are""" )
+_depthMask()
+
+for _name_ in ('glPopAttrib','glPopClientAttrib','glCallList','glCallLists'):
+    _clearing( _name_ )
+
+_COLOR_NAME = re.compile( r'^glColor([34](b|d|f|i|s|ub|ui|us)v?)?$' )
+_DRAW_NAMES = (
+    'glArrayElement',
+    'glDrawArrays',
+    'glDrawArraysInstanced',
+    'glDrawElements',
+    'glDrawElementsInstanced',
+    'glDrawElementsub',
+    'glDrawElementsui',
+    'glDrawElementsus',
+    'glDrawRangeElements',
+    'glMultiDrawArrays',
+    'glMultiDrawElements',
+)
+for _name_ in sorted( dir( _GL ) ):
+    if _COLOR_NAME.match( _name_ ) and _name_ not in __all__:
+        _forgetting( _name_, 'values', 'color', """%s, making the current colour unknown"""%(_name_,) )
+    elif _name_ in _DRAW_NAMES:
+        _drawing( _name_ )
+del _name_
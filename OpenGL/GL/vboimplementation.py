@@ -1,4 +1,5 @@
 from OpenGL.arrays import vbo
+from OpenGL import _configflags
 from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1
 
 class Implementation( vbo.Implementation ):
@@ -17,5 +18,10 @@ class Implementation( vbo.Implementation ):
             assert found, name
         if GL_1_5.glBufferData:
             self.available = True
+        if _configflags.STATE_CACHE:
+            # keep the shadowed buffer bindings in step with VBO binds
+            from OpenGL.GL import statecache
+            self.glBindBuffer = statecache.glBindBuffer
+            self.glDeleteBuffers = statecache.glDeleteBuffers
 
 Implementation.register()
@@ -49,8 +49,69 @@ Create a new GLUQuadric object""",
     argNames=[],
 )
 
+class QuadricPool( object ):
+    """Shared GLUQuadric objects, one per quadric configuration
+
+    gluNewQuadric allocates a new GLU-side object on every call, code
+    which creates a quadric per draw (and never calls gluDeleteQuadric)
+    leaks one object per call.  The pool creates a single quadric for each
+    distinct (drawStyle, normals, orientation, texture) combination the
+    first time it is requested and hands the same object back afterwards.
+
+    Quadric objects do not hold GL state, so a pool may be shared across
+    contexts.
+    """
+    def __init__( self ):
+        self.quadrics = {}
+    def get(
+        self, drawStyle=_simple.GLU_FILL, normals=_simple.GLU_SMOOTH,
+        orientation=_simple.GLU_OUTSIDE, texture=False,
+    ):
+        """Retrieve (creating if necessary) the quadric for this configuration"""
+        key = (drawStyle, normals, orientation, bool(texture))
+        quadric = self.quadrics.get( key )
+        if quadric is None:
+            quadric = gluNewQuadric()
+            # only override GLU's defaults...
+            if drawStyle != _simple.GLU_FILL:
+                _simple.gluQuadricDrawStyle( quadric, drawStyle )
+            if normals != _simple.GLU_SMOOTH:
+                _simple.gluQuadricNormals( quadric, normals )
+            if orientation != _simple.GLU_OUTSIDE:
+                _simple.gluQuadricOrientation( quadric, orientation )
+            if texture:
+                _simple.gluQuadricTexture( quadric, True )
+            self.quadrics[ key ] = quadric
+        return quadric
+    __call__ = get
+    def clear( self ):
+        """Delete all pooled quadrics"""
+        while self.quadrics:
+            key, quadric = self.quadrics.popitem()
+            _simple.gluDeleteQuadric( quadric )
+    def __len__( self ):
+        return len( self.quadrics )
+
+QUADRIC_POOL = QuadricPool()
+
+def gluSharedQuadric(
+    drawStyle=_simple.GLU_FILL, normals=_simple.GLU_SMOOTH,
+    orientation=_simple.GLU_OUTSIDE, texture=False,
+):
+    """Retrieve a pooled GLUQuadric for the given configuration
+
+    Unlike gluNewQuadric, repeated calls with the same settings return the
+    same object, so this is safe to call from per-frame drawing code.  The
+    returned quadric is shared, callers must not gluDeleteQuadric it or
+    change its settings.
+    """
+    return QUADRIC_POOL.get( drawStyle, normals, orientation, texture )
+
 __all__ = (
     'gluNewQuadric',
     'gluQuadricCallback',
+    'gluSharedQuadric',
     'GLUQuadric',
+    'QuadricPool',
+    'QUADRIC_POOL',
 )
@@ -22,7 +22,7 @@ platform module *not* in the module here!
 """
 from OpenGL.platform import CurrentContextIsValid, GLUT_GUARD_CALLBACKS, PLATFORM
 GLUT = PLATFORM.GLUT
-from OpenGL import contextdata, error, platform, logs
+from OpenGL import contextdata, error, platform, logs, _configflags
 from OpenGL.raw import GLUT as _simple
 from OpenGL._bytes import bytes, unicode,as_8_bit
 import ctypes, os, sys, traceback
@@ -345,8 +345,26 @@ def glutDestroyWindow( window ):
         GLUT.glutSetWindow(window)
         context = contextdata.getContext()
         result = contextdata.cleanupContext( context )
+        if _configflags.STATE_CACHE:
+            from OpenGL.GL import statecache
+            statecache.invalidate( context )
         _log.info( """Cleaning up context data for window %s: %s""", window, result )
     except Exception as err:
         _log.error( """Error attempting to clean up context data for GLUT window %s: %s""", window, result )
     return _base_glutDestroyWindow( window )
 glutDestroyWindow.wrappedOperation = _simple.glutDestroyWindow
+
+if _configflags.STATE_CACHE:
+    def _switching( baseFunction ):
+        """Wrap a call that makes another window's context current"""
+        def switching( *args ):
+            from OpenGL.GL import statecache
+            result = baseFunction( *args )
+            statecache.switch()
+            return result
+        switching.__name__ = baseFunction.__name__
+        switching.__doc__ = baseFunction.__doc__
+        switching.wrappedOperation = baseFunction
+        return switching
+    glutSetWindow = _switching( _simple.glutSetWindow )
+    glutCreateWindow = _switching( globals().get( 'glutCreateWindow', _simple.glutCreateWindow ) )
@@ -177,6 +177,30 @@ import occurs the flags should no longer be changed.
         annotations dictionary are generally either ctypes types or 
         ArrayDataType references, so this isn't *likely* to be all that useful
         without further work.
+
+    STATE_CACHE -- if True, OpenGL.GL exports the state-shadowing
+        versions of glEnable/glDisable, the bind calls, glColor3f/4f,
+        blend and depth setters from OpenGL.GL.statecache, which skip
+        calls that would set state to the value it already has in the
+        current context.  Only correct if all changes to that state go
+        through OpenGL.GL (or are followed by statecache.invalidate()).
+
+        Default: False
+
+    SPECIALISE_WRAPPERS -- if True (and OpenGL_accelerate is not in use),
+        finalised wrappers get a call generated as straight-line Python
+        source by OpenGL.specialise instead of the generic closures that
+        loop over their converters on every call.
+
+        Default: True
+
+    LAZY_NAMESPACES -- if True, importing OpenGL.GL does not import the
+        GL_1_1 ... GL_4_6 wrapper modules; each name is looked up in a
+        generated index (OpenGL.GL._lazyindex) on first access and only
+        the module defining it is imported (see OpenGL.lazynamespace).
+        Code that does "from OpenGL.GL import *" still loads everything.
+
+        Default: False
 """
 from OpenGL.version import __version__
 import os
@@ -209,6 +233,9 @@ ALLOW_NUMPY_SCALARS = environ_key("ALLOW_NUMPY_SCALARS", False)
 UNSIGNED_BYTE_IMAGES_AS_STRING = environ_key("UNSIGNED_BYTE_IMAGES_AS_STRING", True)
 MODULE_ANNOTATIONS = False
 TYPE_ANNOTATIONS = False
+STATE_CACHE = environ_key("STATE_CACHE", False)
+SPECIALISE_WRAPPERS = environ_key("SPECIALISE_WRAPPERS", True)
+LAZY_NAMESPACES = environ_key("LAZY_NAMESPACES", False)
 
 
 # Declarations of plugins provided by PyOpenGL itself
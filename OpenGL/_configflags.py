@@ -16,4 +16,7 @@ from OpenGL import (
     UNSIGNED_BYTE_IMAGES_AS_STRING,
     MODULE_ANNOTATIONS,
     TYPE_ANNOTATIONS,
+    STATE_CACHE,
+    SPECIALISE_WRAPPERS,
+    LAZY_NAMESPACES,
 )
@@ -35,7 +35,7 @@ from OpenGL.arrays.formathandler import FormatHandler
 from OpenGL.raw.GL import _types 
 from OpenGL import error
 from OpenGL._bytes import bytes,unicode,as_8_bit
-import ctypes,logging
+import ctypes,logging,importlib
 _log = logging.getLogger( 'OpenGL.arrays.vbo' )
 from OpenGL._bytes import long, integer_types
 
@@ -46,14 +46,22 @@ class Implementation( object ):
     """Abstraction point for the various implementations that can be used
     """
     IMPLEMENTATION_CLASSES = []
+    # modules registering implementations, imported on first use
+    IMPLEMENTATION_MODULES = []
     CHOSEN = None
     @classmethod
     def register( cls ):
         cls.IMPLEMENTATION_CLASSES.append( cls )
+    @classmethod
+    def register_module( cls, name ):
+        """Import module name (which registers implementations) when first needed"""
+        cls.IMPLEMENTATION_MODULES.append( name )
     
     @classmethod 
     def get_implementation( cls, *args ):
         if cls.CHOSEN is None:
+            while cls.IMPLEMENTATION_MODULES:
+                importlib.import_module( cls.IMPLEMENTATION_MODULES.pop( 0 ) )
             for possible in cls.IMPLEMENTATION_CLASSES:
                 implementation = possible()
                 if possible:
@@ -0,0 +1,266 @@
+"""Recorded command buffers: GL calls converted once, replayed raw
+
+Code that issues the same GL commands every frame (a static part of a
+scene, a fixed overlay) pays for the full wrapper on each call: Python
+argument converters, array size checks and data-pointer lookups, the
+error-checking errcheck hook.  A CommandBuffer runs all of that once:
+
+    from OpenGL import commandbuffer
+
+    with commandbuffer.recording() as ground:
+        draw_ground()      # nothing is drawn, the calls are captured
+    ...
+    ground.replay()        # every frame: raw ctypes calls only
+
+While recording, the gl*/glu* entry points bound in the namespaces of
+loaded modules (the usual `from OpenGL.GL import *` targets, plus any
+namespaces passed in) and of the VBO implementation are swapped for
+recorders.  A recorder runs the
+entry point's converters, then stores the resolved function pointer and
+the final ctypes argument tuple instead of calling the GL.  On replay the
+calls go through an error-check-free prototype of each function, and
+glGetError is checked once at the end (if OpenGL.ERROR_CHECKING).
+
+What gets recorded:
+
+    * Wrapper entry points (via OpenGL.specialise), raw ctypes entry
+      points, lazy wrappers (their Python part runs while recording,
+      their base call is recorded) and alternates
+    * wrappers exposing the entry point they call as __wrapped__ (the
+      OpenGL.GL.statecache functions) record that entry point; the
+      state cache is bypassed while recording and invalidated after a
+      replay
+
+Calls that return something (queries, object name generation such as
+glGenTextures, glCreate*, glMapBuffer, glReadPixels, anything with a
+non-void result or output arrays) and glDelete*, glNewList/glEndList run
+immediately while recording, as do Python-coded
+helpers that are not wrappers (whose own GL calls are recorded as long as
+their module is swapped).  Arguments are captured by value: arrays are
+referenced by the buffer and must not be resized or freed, and anything
+a converter computed (array sizes, VBO offsets, object names) is replayed
+as it was at recording time.
+"""
+import ctypes, re, sys, logging
+from OpenGL import platform, error, converters, specialise, _configflags
+from OpenGL.latebind import Curry
+from OpenGL.platform import baseplatform
+from OpenGL.wrapper import Wrapper
+_log = logging.getLogger( 'OpenGL.commandbuffer' )
+
+__all__ = (
+    'CommandBuffer',
+    'recording',
+)
+
+IMMEDIATE = re.compile(
+    r'^gl(u|)('
+    r'Gen(Textures|Buffers|Lists|Queries|Framebuffers|Renderbuffers|VertexArrays|Samplers|'
+    r'TransformFeedbacks|ProgramPipelines|Programs|Fences|OcclusionQueries|Semaphores)[A-Z]*$|'
+    r'(Map|Unmap)(Buffer|NamedBuffer)(Range)?[A-Z]*$|Readn?Pixels[A-Z]*$|'
+    r'Create|Delete|Get|Is|NewList|EndList|'
+    r'RenderMode|FeedbackBuffer|SelectBuffer|AreTexturesResident|'
+    r'CheckFramebufferStatus|FenceSync|ClientWaitSync|NewQuadric|NewNurbsRenderer|NewTess)'
+)
+NATIVE = (
+    ctypes._SimpleCData, ctypes._Pointer, ctypes.Array,
+    ctypes.Structure, ctypes.Union,
+)
+
+# map from id( base function ): (base function, raw function, converters)
+_prototypes = {}
+
+def _baseFunction( function ):
+    """The loaded ctypes function behind a (possibly null) base function"""
+    if isinstance( function, baseplatform._NullFunctionPointer ):
+        if not function.resolved:
+            loaded = function.load()
+            if loaded is None:
+                raise error.NullFunctionError(
+                    """Attempt to record an undefined function %s"""%(function.__name__,)
+                )
+            return loaded
+        # load() installed the loaded function's bound __call__
+        return type( function ).__dict__['__call__'].__func__.__self__
+    return function
+
+def _prototype( function ):
+    """(raw function, argument converters) replaying calls to function
+
+    The raw function has the same C signature but no errcheck, and
+    Python-level argument types (ArrayDatatype) are replaced by c_void_p;
+    such arguments are converted with from_param while recording.
+    """
+    base = _baseFunction( function )
+    cached = _prototypes.get( id( base ))
+    if cached is not None:
+        return cached[1:]
+    if not isinstance( base, ctypes._CFuncPtr ):
+        # e.g. a CONTEXT_CHECKING wrapper, replay it as-is
+        result = (base, ())
+    else:
+        argTypes = base.argtypes or ()
+        convert = tuple( [
+            (i,typ) for (i,typ) in enumerate( argTypes )
+            if not (isinstance( typ, type ) and issubclass( typ, NATIVE ))
+        ] )
+        resolved = list( argTypes )
+        for i,typ in convert:
+            resolved[i] = ctypes.c_void_p
+        prototype = platform.PLATFORM.functionTypeFor( base.DLL )(
+            base.restype, *resolved
+        )
+        result = (prototype( ctypes.cast( base, ctypes.c_void_p ).value ), convert)
+    _prototypes[id( base )] = (base,)+result
+    return result
+
+class CommandBuffer( object ):
+    """Sequence of GL calls with their final ctypes arguments
+
+    commands -- list of (raw function, argument tuple)
+    """
+    def __init__( self ):
+        self.commands = []
+        # Python objects owning memory the arguments point into
+        self._keepAlive = []
+    def __len__( self ):
+        return len( self.commands )
+    def clear( self ):
+        """Drop every recorded call"""
+        del self.commands[:]
+        del self._keepAlive[:]
+    def record( self, function, cArguments, *keepAlive ):
+        """Append a call of base function with cArguments"""
+        raw, convert = _prototype( function )
+        if convert:
+            cArguments = list( cArguments )
+            for i,typ in convert:
+                cArguments[i] = typ.from_param( cArguments[i] )
+        self.commands.append( (raw, tuple( cArguments )) )
+        self._keepAlive.append( (cArguments,keepAlive) )
+        return None
+    def recordConverted( self, function, cArguments, pyArgs, cArgs ):
+        """Wrapper recording callback (see OpenGL.specialise)"""
+        return self.record( function, cArguments, pyArgs, cArgs )
+    def replay( self ):
+        """Issue the recorded calls"""
+        for function,args in self.commands:
+            function( *args )
+        if _configflags.STATE_CACHE:
+            from OpenGL.GL import statecache
+            statecache.invalidate()
+        if _configflags.ERROR_CHECKING:
+            from OpenGL.raw.GL._errors import _error_checker
+            if _error_checker:
+                _error_checker.glCheckError( None, self, () )
+
+class _Recording( object ):
+    """Swaps recorders into namespaces while active"""
+    def __init__( self, buffer, namespaces ):
+        self.buffer = buffer
+        self.namespaces = namespaces
+        self.recorders = {}
+        self.swapped = []
+    def recorder( self, name, function ):
+        """Recorder to put in place of function, None to leave it alone"""
+        key = id( function )
+        if key in self.recorders:
+            return self.recorders[key][1]
+        recorder = self._recorder( name, function )
+        # keep function referenced so its id stays unique
+        self.recorders[key] = (function, recorder)
+        return recorder
+    def _recorder( self, name, function ):
+        buffer = self.buffer
+        if isinstance( function, Wrapper ):
+            base = function.wrappedOperation
+            if getattr( base, 'restype', None ) is not None:
+                return None
+            for converter in getattr( function, 'cConverters', None ) or ():
+                if isinstance( converter, converters.Output ):
+                    return None
+            generated = []
+            def recorder( *args ):
+                # finalising and specialising every wrapper in sight up
+                # front would be slow, do it on first use...
+                if not generated:
+                    function.getFinalCall()
+                    call = specialise.specialise( function, record=buffer.recordConverted )
+                    if call is None:
+                        raise error.Error( """Unable to record calls to %s"""%(name,) )
+                    generated.append( call )
+                return generated[0]( *args )
+            return recorder
+        if isinstance( function, (ctypes._CFuncPtr, baseplatform._NullFunctionPointer) ):
+            if function.restype is not None:
+                return None
+            def recorder( *args ):
+                return buffer.record( function, args )
+            return recorder
+        if isinstance( function, Curry ):
+            base = self.recorder( name, function.baseFunction )
+            if base is None:
+                return None
+            wrapperFunction = function.wrapperFunction
+            def recorder( *args, **named ):
+                return wrapperFunction( base, *args, **named )
+            return recorder
+        getFinalCall = getattr( function, 'getFinalCall', None )
+        if getFinalCall is not None and getattr( function, '_alternatives', None ):
+            try:
+                chosen = getFinalCall()
+            except error.NullFunctionError:
+                return None
+            return self.recorder( name, chosen )
+        wrapped = getattr( function, '__wrapped__', None )
+        if wrapped is not None:
+            return self.recorder( name, wrapped )
+        return None
+    def swap( self, namespace ):
+        for name,value in list( namespace.items() ):
+            if (
+                name[:2] != 'gl' or name[:4] == 'glut' or
+                IMMEDIATE.match( name ) or not callable( value )
+            ):
+                continue
+            recorder = self.recorder( name, value )
+            if recorder is not None:
+                namespace[name] = recorder
+                self.swapped.append( (namespace,name,value) )
+    def __enter__( self ):
+        seen = set()
+        namespaces = [
+            getattr( module, '__dict__', None ) for module in list( sys.modules.values() )
+        ] + [getattr( namespace, '__dict__', namespace ) for namespace in self.namespaces]
+        # VBO objects bind and upload through their implementation object
+        from OpenGL.arrays import vbo
+        if vbo.Implementation.CHOSEN is not None:
+            namespaces.append( vars( vbo.Implementation.CHOSEN ))
+        try:
+            for namespace in namespaces:
+                if isinstance( namespace, dict ) and id( namespace ) not in seen:
+                    seen.add( id( namespace ))
+                    self.swap( namespace )
+        except Exception:
+            self.restore()
+            raise
+        return self.buffer
+    def restore( self ):
+        while self.swapped:
+            namespace,name,value = self.swapped.pop()
+            namespace[name] = value
+    def __exit__( self, *args ):
+        self.restore()
+
+def recording( buffer=None, namespaces=() ):
+    """Context manager recording GL calls into buffer (default a new one)
+
+    namespaces -- extra module globals() dicts (or modules) to swap, for
+        code whose module is not in sys.modules (e.g. loaded from a
+        spec without registering it)
+
+    Returns the buffer from __enter__.
+    """
+    if buffer is None:
+        buffer = CommandBuffer()
+    return _Recording( buffer, namespaces )
@@ -0,0 +1,190 @@
+"""PEP 562 lazy namespaces for OpenGL.GL and the GL extension packages
+
+Importing OpenGL.GL normally star-imports every GL_1_1 ... GL_4_6 wrapper
+module, building thousands of Wrapper, Constant and ctypes prototype
+objects before the first call is made.  With OpenGL.LAZY_NAMESPACES set
+(or PYOPENGL_LAZY_NAMESPACES=1) OpenGL.GL instead gets a module-level
+__getattr__ which looks the name up in a generated index and imports only
+the module defining it:
+
+    import OpenGL
+    OpenGL.LAZY_NAMESPACES = True
+    from OpenGL.GL import glClear, GL_COLOR_BUFFER_BIT    # imports GL_1_1
+
+The resolved value is stored in the namespace, so later lookups are plain
+module attribute accesses.  The index maps every public name of the eager
+OpenGL.GL namespace to the module it comes from (an alias to the module
+and attribute it is bound to), so the lazy namespace exposes exactly the
+same objects; __all__ lists them all, which means star-imports resolve
+every name and cost as much as the eager import.
+
+The index is OpenGL/GL/_lazyindex.py, regenerate it after changing the
+modules OpenGL.GL imports with:
+
+    python -m OpenGL.lazynamespace
+
+The vendor extension packages (OpenGL.GL.ARB, OpenGL.GL.NV, ...) import
+their extension modules on attribute access, so OpenGL.GL.ARB.imaging
+works without importing OpenGL.GL.ARB.imaging first.
+"""
+import importlib, sys, types
+
+# modules whose public names make up the eager OpenGL.GL namespace, in
+# the order OpenGL/GL/__init__.py star-imports them (the aliases it defines
+# itself are found by identity)
+GL_SOURCES = (
+    'OpenGL.GL.VERSION.GL_1_1',
+    'OpenGL.GL.pointers',
+    'OpenGL.GL.images',
+    'OpenGL.GL.exceptional',
+    'OpenGL.GL.glget',
+    'OpenGL.GL.VERSION.GL_1_2',
+    'OpenGL.GL.VERSION.GL_1_3',
+    'OpenGL.GL.VERSION.GL_1_4',
+    'OpenGL.GL.VERSION.GL_1_5',
+    'OpenGL.GL.VERSION.GL_2_0',
+    'OpenGL.GL.VERSION.GL_2_1',
+    'OpenGL.GL.VERSION.GL_3_0',
+    'OpenGL.GL.VERSION.GL_3_1',
+    'OpenGL.GL.VERSION.GL_3_2',
+    'OpenGL.GL.VERSION.GL_3_3',
+    'OpenGL.GL.VERSION.GL_4_0',
+    'OpenGL.GL.VERSION.GL_4_1',
+    'OpenGL.GL.VERSION.GL_4_2',
+    'OpenGL.GL.VERSION.GL_4_3',
+    'OpenGL.GL.VERSION.GL_4_4',
+    'OpenGL.GL.VERSION.GL_4_5',
+    'OpenGL.GL.VERSION.GL_4_6',
+    'OpenGL.error',
+)
+
+def namespace( package, modules, index ):
+    """(__getattr__, __dir__, __all__) for a package resolving through index
+
+    modules -- sequence of module names
+    index -- name: i, where modules[i] defines name, or name: (i, attribute)
+        for a name bound to modules[i].attribute, or name: (i, None) for
+        the module modules[i] itself
+    """
+    def __getattr__( name ):
+        try:
+            entry = index[name]
+        except KeyError:
+            raise AttributeError(
+                """module %r has no attribute %r"""%(package,name)
+            ) from None
+        if entry.__class__ is tuple:
+            source, attribute = entry
+        else:
+            source, attribute = entry, name
+        value = importlib.import_module( modules[source] )
+        if attribute is not None:
+            value = getattr( value, attribute )
+        setattr( sys.modules[package], name, value )
+        return value
+    def __dir__():
+        return sorted( set( vars( sys.modules[package] )) | set( index ))
+    return __getattr__, __dir__, sorted( index )
+
+def submodules( package ):
+    """(__getattr__, __dir__) for a package importing submodules on access"""
+    def __getattr__( name ):
+        if name[:1] != '_':
+            qualified = '%s.%s'%(package,name)
+            try:
+                return importlib.import_module( qualified )
+            except ModuleNotFoundError as err:
+                if err.name != qualified:
+                    raise
+        raise AttributeError(
+            """module %r has no attribute %r"""%(package,name)
+        )
+    def __dir__():
+        import pkgutil
+        module = sys.modules[package]
+        return sorted( set( vars( module )) | set( [
+            info.name for info in pkgutil.iter_modules( module.__path__ )
+        ] ))
+    return __getattr__, __dir__
+
+def build( package, sources ):
+    """(modules, index) reproducing the eager namespace of package
+
+    package must have been imported eagerly; every public name in it is
+    indexed to the earliest of sources binding the very same object under
+    that name, else to a source binding it under another name, else (for
+    modules) to the module itself.  Raises ValueError for names that can
+    not be found that way.
+    """
+    target = vars( importlib.import_module( package ))
+    modules = list( sources )
+    namespaces = [vars( importlib.import_module( source )) for source in sources]
+    byIdentity = {}
+    for i,source in reversed( list( enumerate( namespaces ))):
+        for name,value in source.items():
+            if name[:1] != '_':
+                byIdentity[id( value )] = (i,name)
+    index = {}
+    missing = []
+    for name,value in target.items():
+        if name[:1] == '_':
+            continue
+        if isinstance( value, types.ModuleType ):
+            if value.__name__ not in modules:
+                modules.append( value.__name__ )
+            index[name] = (modules.index( value.__name__ ), None)
+            continue
+        for i,source in enumerate( namespaces ):
+            if name in source and source[name] is value:
+                index[name] = i
+                break
+        else:
+            entry = byIdentity.get( id( value ))
+            if entry is None:
+                missing.append( name )
+            else:
+                index[name] = entry
+    if missing:
+        raise ValueError(
+            """Names of %s not bound in any of its sources: %s"""%(package,", ".join( sorted( missing )))
+        )
+    # the index has to hand back the identical objects...
+    resolve,_,_ = namespace( package, modules, index )
+    saved = dict( target )
+    try:
+        for name,value in list( target.items() ):
+            if name in index and resolve( name ) is not value:
+                raise ValueError( """Index resolves %s.%s to another object"""%(package,name) )
+    finally:
+        target.update( saved )
+    return modules, index
+
+def source( modules, index, docstring ):
+    """Python source for an index module"""
+    lines = ['"""%s'%(docstring,), '', 'Generated by "python -m OpenGL.lazynamespace", do not edit.', '"""']
+    lines.append( 'MODULES = (' )
+    lines.extend( ['    %r,'%(module,) for module in modules] )
+    lines.append( ')' )
+    lines.append( 'INDEX = {' )
+    lines.extend( ['    %r: %r,'%(name,index[name]) for name in sorted( index )] )
+    lines.append( '}' )
+    return '\n'.join( lines )+'\n'
+
+def main():
+    import os, OpenGL
+    if 'OpenGL.GL' in sys.modules and OpenGL.LAZY_NAMESPACES:
+        raise RuntimeError( """The index has to be built from the eager OpenGL.GL namespace""" )
+    # the index describes the default namespace, STATE_CACHE overrides
+    # are star-imported over it at run-time
+    OpenGL.LAZY_NAMESPACES = False
+    OpenGL.STATE_CACHE = False
+    modules, index = build( 'OpenGL.GL', GL_SOURCES )
+    target = os.path.join( os.path.dirname( OpenGL.__file__ ), 'GL', '_lazyindex.py' )
+    with open( target, 'w' ) as handle:
+        handle.write( source(
+            modules, index, """Name to module index for the lazy OpenGL.GL namespace""",
+        ))
+    print( 'Wrote %s names from %s modules to %s'%(len(index),len(modules),target) )
+
+if __name__ == "__main__":
+    main()
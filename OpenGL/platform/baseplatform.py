@@ -212,37 +212,25 @@ class BasePlatform( object ):
         base function from a DLL.
         """
         from OpenGL import wrapper
-        result = None
-        try:
-            if (
-                _configflags.FORWARD_COMPATIBLE_ONLY and 
-                dll is self.GL and 
-                deprecated
-            ):
-                result = self.nullFunction(
-                    functionName, dll=dll,
-                    resultType=resultType, 
-                    argTypes=argTypes,
-                    doc = doc, argNames = argNames,
-                    extension = extension,
-                    deprecated = deprecated,
-                    error_checker = error_checker,
-                )
-            else:
-                result = self.constructFunction(
-                    functionName, dll, 
-                    resultType=resultType, argTypes=argTypes,
-                    doc = doc, argNames = argNames,
-                    extension = extension,
-                    error_checker = error_checker,
-                )
-        except AttributeError as err:
-            result = self.nullFunction( 
+        if (
+            _configflags.FORWARD_COMPATIBLE_ONLY and 
+            dll is self.GL and 
+            deprecated
+        ):
+            result = self.nullFunction(
                 functionName, dll=dll,
                 resultType=resultType, 
                 argTypes=argTypes,
                 doc = doc, argNames = argNames,
                 extension = extension,
+                deprecated = deprecated,
+                error_checker = error_checker,
+            )
+        else:
+            # symbol lookup and prototype are deferred to first use
+            result = _LazyFunctionPointer(
+                functionName, dll, resultType, argTypes, argNames,
+                extension = extension, doc = doc,
                 error_checker = error_checker,
             )
         if MODULE_ANNOTATIONS:
@@ -288,7 +276,20 @@ class BasePlatform( object ):
         a definition created by the automated generator.
         """
         from OpenGL import wrapper, error
-        if isinstance( original, _NullFunctionPointer ):
+        if isinstance( original, _LazyFunctionPointer ):
+            # copies of lazy entry points stay lazy, true when loadable
+            return self.createBaseFunction(
+                original.__name__,
+                original.DLL,
+                resultType = original.restype,
+                argTypes= original.argtypes,
+                doc = original.doc,
+                argNames = original.argNames,
+                extension = original.extension,
+                deprecated = original.deprecated,
+                error_checker = original.error_checker,
+            )
+        elif isinstance( original, _NullFunctionPointer ):
             return self.nullFunction(
                 original.__name__,
                 original.DLL,
@@ -322,24 +323,27 @@ class BasePlatform( object ):
         error_checker = None,
         force_extension = False,
     ):
-        """Construct a "null" function pointer"""
+        """Construct a "null" function pointer
+        
+        The function is only looked up (and its ctypes prototype built)
+        by the first call, or truth test for extension functions, see
+        _NullFunctionPointer.load
+        """
         if deprecated:
             base = _DeprecatedFunctionPointer
         else:
             base = _NullFunctionPointer
-        cls = type( functionName, (base,), {
-            '__doc__': doc,
-            'deprecated': deprecated,
-        } )
+        result = base(
+            functionName, dll, resultType, argTypes, argNames, extension=extension, doc=doc,
+            deprecated = deprecated,
+            error_checker = error_checker, force_extension=force_extension,
+        )
         if MODULE_ANNOTATIONS:
             if not module:
                 module = _find_module( )
             if module:
-                cls.__module__ = module
-        return cls(
-            functionName, dll, resultType, argTypes, argNames, extension=extension, doc=doc,
-            error_checker = error_checker, force_extension=force_extension,
-        )
+                result.__module__ = module
+        return result
     def GetCurrentContext( self ):
         """Retrieve opaque pointer for the current context"""
         raise NotImplementedError( 
@@ -358,7 +362,13 @@ class BasePlatform( object ):
     def OpenGL(self): return self.GL
 
 class _NullFunctionPointer( object ):
-    """Function-pointer-like object for undefined functions"""
+    """Function-pointer-like object for undefined functions
+    
+    Instances share their class until load() succeeds, which moves the
+    instance to a class of its own whose __call__ is the loaded function,
+    so generating thousands of entry points creates no classes and a
+    loaded function is called without going through load() again.
+    """
     def __init__( 
         self, name, dll, resultType, argTypes, argNames, 
         extension=None, doc=None, deprecated=False,
@@ -372,11 +382,13 @@ class _NullFunctionPointer( object ):
         self.errcheck = None
         self.restype = resultType
         self.extension = extension
-        self.doc = doc
+        self.doc = self.__doc__ = doc
         self.deprecated = deprecated
         self.error_checker = error_checker
         self.force_extension = force_extension
     resolved = False
+    def __repr__( self ):
+        return '<%s.%s object at %#x>'%( self.__module__, self.__name__, id(self) )
     def __nonzero__( self ):
         """Make this object appear to be NULL"""
         if (not self.resolved) and (self.extension or self.force_extension):
@@ -406,7 +418,10 @@ class _NullFunctionPointer( object ):
             return None 
         else:
             # now short-circuit so that we don't need to check again...
-            self.__class__.__call__ = staticmethod( func.__call__ )
+            self.__class__ = type( self.__name__, (self.__class__,), {
+                '__call__': staticmethod( func.__call__ ),
+                '__doc__': self.doc,
+            } )
             self.resolved = True
             return func
         return None
@@ -426,6 +441,18 @@ class _NullFunctionPointer( object ):
                     )
                 )
 
+class _LazyFunctionPointer( _NullFunctionPointer ):
+    """Function pointer for an entry point bound on first use
+    
+    Returned by createBaseFunction, which used to look the symbol up
+    immediately; it is false only if the function can not be loaded.
+    """
+    def __nonzero__( self ):
+        if not self.resolved:
+            self.load()
+        return self.resolved
+    __bool__ = __nonzero__
+
 class _DeprecatedFunctionPointer( _NullFunctionPointer ):
     deprecated = True
     def __call__( self, *args, **named ):
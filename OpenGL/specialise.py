@@ -0,0 +1,216 @@
+"""Source-generating specialiser for finalised Wrapper calls
+
+Without OpenGL_accelerate, Wrapper.finaliseCall picks one of a set of
+generic wrapperCall closures, each of which loops over the pyConverters,
+cConverters and cResolvers lists (through generators) on every call.
+
+specialise() instead writes out straight-line Python source for the one
+wrapper being finalised: every converter is called by index with its own
+local name, None/default stages are reduced to plain variable references,
+constant cConverters are bound once, absent stages are not mentioned at
+all, and the C function is called with explicit positional arguments.  The
+source is compiled with exec and the resulting function behaves exactly as
+the generic closure would have, including the extra information attached
+to exceptions raised by converters and by the C call.
+
+The function is built by a generated factory whose parameters are the
+converters and constants it uses, so they are closure variables of the
+call rather than attribute or global lookups.  Wrappers with the same
+shape generate identical source, so factories are cached by source text.
+"""
+import ctypes, logging
+from OpenGL import error, converters
+from OpenGL._null import NULL
+_log = logging.getLogger( 'OpenGL.specialise' )
+
+_factoryCache = {}
+
+def _pyConverterSource( index, converter, lines, namespace ):
+    """Source computing Python argument #index into py<index>"""
+    if converter is None:
+        lines.append( 'py%(i)s = args[%(i)s]'%{'i':index} )
+        return
+    name = 'pyConverter%s'%(index,)
+    namespace[name] = converter
+    function = getattr( converter, 'function', None )
+    if type(converter) is converters.CallFuncPyConverter and function is not None:
+        # inline the trivial CallFuncPyConverter.__call__
+        namespace['pyFunction%s'%(index,)] = function
+        call = 'pyFunction%(i)s( args[%(i)s] )'
+    else:
+        call = 'pyConverter%(i)s( args[%(i)s], self, args )'
+    lines.extend( [line%{'i':index} for line in [
+        'try:',
+        '    py%(i)s = '+call,
+        'except IndexError as err:',
+        '    py%(i)s = NULL',
+        'except Exception as err:',
+        '    if hasattr( err, "args" ):',
+        '        err.args += ( pyConverter%(i)s, )',
+        '    raise',
+    ]] )
+
+def _cConverterSource( index, converter, pyNames, withSelf, lines, namespace ):
+    """Source computing C argument #index into c<index>"""
+    if not hasattr( converter, '__call__' ):
+        namespace['cConstant%s'%(index,)] = converter
+        lines.append( 'c%(i)s = cConstant%(i)s'%{'i':index} )
+        return
+    if (
+        pyNames is not None and
+        isinstance( converter, converters.DefaultCConverter ) and
+        isinstance( getattr( converter, 'index', None ), int ) and
+        0 <= converter.index < len(pyNames)
+    ):
+        # DefaultCConverter just returns pyArgs[ index ]
+        lines.append( 'c%s = %s'%(index,pyNames[converter.index]) )
+        return
+    namespace['cConverter%s'%(index,)] = converter
+    extra = withSelf and ', self' or ''
+    lines.extend( [line%{'i':index,'self':extra} for line in [
+        'try:',
+        '    c%(i)s = cConverter%(i)s( pyArgs, %(i)s, self )',
+        'except Exception as err:',
+        '    if hasattr( err, "args" ):',
+        '        err.args += ( """Failure in cConverter %%r"""%%(cConverter%(i)s), pyArgs, %(i)s%(self)s )',
+        '    raise',
+    ]] )
+
+def _cResolverSource( index, converter, cName, lines, namespace ):
+    """Source resolving C argument cName into r<index>"""
+    if converter is None:
+        lines.append( 'r%s = %s'%(index,cName) )
+        return
+    namespace['cResolver%s'%(index,)] = converter
+    lines.extend( [line%{'i':index,'c':cName} for line in [
+        'try:',
+        '    r%(i)s = cResolver%(i)s( %(c)s )',
+        'except Exception as err:',
+        '    err.args += ( cResolver%(i)s, )',
+        '    raise',
+    ]] )
+
+def _tuple( names ):
+    if len(names) == 1:
+        return '( %s, )'%(names[0],)
+    return '( %s )'%(', '.join( names ),)
+
+def specialise( wrapper, record=None ):
+    """Generate the specialised wrapperCall for a finalised wrapper
+
+    Mirrors the pure-Python branches of Wrapper.finaliseCall, returns
+    None for the shapes it does not handle (the caller then falls back
+    to the generic closures).
+
+    record -- if given, the call runs every converter but instead of the
+        C function calls record( wrappedOperation, cArguments, pyArgs,
+        cArgs ) and uses its return value as the result (used by
+        OpenGL.commandbuffer)
+    """
+    pyConverters = getattr( wrapper, 'pyConverters', None )
+    cConverters = getattr( wrapper, 'cConverters', None )
+    cResolvers = getattr( wrapper, 'cResolvers', None )
+    storeValues = getattr( wrapper, 'storeValues', None )
+    returnValues = getattr( wrapper, 'returnValues', None )
+    namespace = {
+        'self': wrapper,
+        'wrappedOperation': wrapper.wrappedOperation,
+        'storeValues': storeValues,
+        'returnValues': returnValues,
+        'NULL': NULL,
+        'ctypes': ctypes,
+        'error': error,
+    }
+    lines = []
+    # Python-level arguments...
+    if pyConverters:
+        required = len([p for p in pyConverters if not getattr( p, 'optional', False)])
+        namespace['pyConverters_length'] = required
+        lines.extend( [
+            'if pyConverters_length > len(args):',
+            '    raise ValueError(',
+            '        """%s requires %r arguments (%s), received %s: %r"""%(',
+            '            wrappedOperation.__name__,',
+            '            pyConverters_length,',
+            '            ", ".join( self.pyConverterNames ),',
+            '            len(args),',
+            '            args',
+            '        )',
+            '    )',
+        ] )
+        pyNames = []
+        for index,converter in enumerate( pyConverters ):
+            _pyConverterSource( index, converter, lines, namespace )
+            pyNames.append( 'py%s'%(index,) )
+        lines.append( 'pyArgs = %s'%(_tuple( pyNames ),) )
+    else:
+        pyNames = None
+        lines.append( 'pyArgs = args' )
+    # C-level arguments...
+    if cConverters:
+        cNames = []
+        for index,converter in enumerate( cConverters ):
+            _cConverterSource(
+                index, converter, pyNames, bool(pyConverters), lines, namespace
+            )
+            cNames.append( 'c%s'%(index,) )
+        lines.append( 'cArgs = %s'%(_tuple( cNames ),) )
+    else:
+        cNames = pyNames
+        lines.append( 'cArgs = pyArgs' )
+    # ctypes-compatible arguments...
+    if cResolvers:
+        if cNames is not None and len(cResolvers) > len(cNames):
+            # the generic version raises IndexError on each call here
+            return None
+        rNames = []
+        for index,converter in enumerate( cResolvers ):
+            cName = cNames[index] if cNames is not None else 'cArgs[%s]'%(index,)
+            _cResolverSource( index, converter, cName, lines, namespace )
+            rNames.append( 'r%s'%(index,) )
+        callArgs = ', '.join( rNames )
+        cArguments = _tuple( rNames )
+    elif cNames is not None:
+        callArgs = ', '.join( cNames )
+        cArguments = 'cArgs'
+    else:
+        callArgs = '*cArgs'
+        cArguments = 'cArgs'
+    if record is None:
+        call = 'wrappedOperation( %s )'%(callArgs,)
+    else:
+        namespace['record'] = record
+        call = 'record( wrappedOperation, %s, pyArgs, cArgs )'%(cArguments,)
+    lines.extend( [
+        'try:',
+        '    result = '+call,
+        'except ctypes.ArgumentError as err:',
+        '    err.args = err.args + (%s,)'%(cArguments,),
+        '    raise err',
+        'except error.GLError as err:',
+        '    err.cArgs = cArgs',
+        '    err.pyArgs = pyArgs',
+        '    raise err',
+    ] )
+    if storeValues:
+        lines.append( 'storeValues( result, self, pyArgs, cArgs )' )
+    if returnValues:
+        lines.append( 'return returnValues( result, self, pyArgs, cArgs )' )
+    else:
+        lines.append( 'return result' )
+    # everything the call refers to is a closure variable of a factory
+    # taking the namespace, so one compiled factory serves every wrapper
+    # of the same shape...
+    names = sorted( namespace )
+    source = 'def factory( %s ):\n    def wrapperCall( *args ):\n        """Specialised wrapper"""\n%s\n    return wrapperCall\n'%(
+        ', '.join( names ),
+        '\n'.join( ['        '+line for line in lines] ),
+    )
+    factory = _factoryCache.get( source )
+    if factory is None:
+        scope = {}
+        exec( compile( source, '<specialised %s>'%(wrapper.wrappedOperation.__name__,), 'exec' ), scope )
+        factory = _factoryCache[source] = scope['factory']
+    wrapperCall = factory( **namespace )
+    wrapperCall.source = source
+    return wrapperCall
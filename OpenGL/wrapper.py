@@ -2,8 +2,8 @@
 import ctypes, logging
 from OpenGL import platform, error
 assert platform
-from OpenGL._configflags import STORE_POINTERS, ERROR_ON_COPY, SIZE_1_ARRAY_UNPACK
-from OpenGL import converters
+from OpenGL._configflags import STORE_POINTERS, ERROR_ON_COPY, SIZE_1_ARRAY_UNPACK, SPECIALISE_WRAPPERS
+from OpenGL import converters, specialise
 from OpenGL.converters import DefaultCConverter
 from OpenGL.converters import returnCArgument,returnPyArgument
 from OpenGL.latebind import LateBind
@@ -506,6 +506,10 @@ class Wrapper( LateBind ):
                 storeValues=storeValues,
                 returnValues=returnValues,
             )
+        if SPECIALISE_WRAPPERS:
+            wrapperCall = specialise.specialise( self )
+            if wrapperCall is not None:
+                return wrapperCall
         if pyConverters:
             if cConverters:
                 # create a map of index,converter, callable
@@ -0,0 +1,353 @@
+# ----------------- Dino Runner offscreen capture -----------------
+# Renders frames without a window and writes them to disk.
+#
+#     python dino_capture.py --frames 600 --fps 30 --out frames/dino_%05d.png
+#
+# The frames come from an EGL pbuffer or an OSMesa buffer (PyOpenGL's
+# OpenGL.platform.egl / OpenGL.platform.osmesa plugins), so no display is
+# needed.  Time is simulated: frame k shows the game at k/fps seconds no
+# matter how long it took to render, so captures run as fast as the GPU and
+# the disk allow.
+#
+# Encoding and writing happen on a background thread.  The render loop
+# reads each frame into one of a fixed ring of preallocated buffers and
+# queues it; the writer hands the buffer back once the file is written.
+# Reads go through OpenGL.GL.readback's pixel-pack buffers (--pbo N), so
+# frame k is copied out while frame k+1 renders instead of stalling.
+# When every buffer is queued the render loop blocks, which bounds memory
+# no matter how far ahead rendering gets.
+#
+# Any PyOpenGL scene can be captured with OffscreenContext, FrameWriter
+# and capture(); the platform has to be chosen before OpenGL.GL is first
+# imported, which OffscreenContext does for you.
+
+import argparse
+import importlib.util
+import os
+import queue
+import random
+import struct
+import sys
+import threading
+import time
+import zlib
+
+import numpy
+import OpenGL
+
+from dino_entities import PTERO
+from dino_sim import NOOP, JUMP, CROUCH, OBS_AHEAD
+
+PLATFORMS = ("egl", "osmesa")
+GAME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "3D Dino Runner.py")
+
+
+def select_platform(name):
+    """Make PyOpenGL use the name platform plugin ("egl" or "osmesa")"""
+    platform = sys.modules.get("OpenGL.platform")
+    if platform is None:
+        OpenGL.setPlatform(name)
+    elif type(platform.PLATFORM).__module__ != "OpenGL.platform." + name:
+        raise RuntimeError(
+            "OpenGL.platform is already loaded as %s; select the %s platform before importing OpenGL.GL"
+            % (type(platform.PLATFORM).__module__, name)
+        )
+
+
+class OffscreenContext(object):
+    """A current GL context rendering into an offscreen RGBA buffer
+
+    width, height -- framebuffer size
+    platform -- "egl" (pbuffer surface) or "osmesa" (client memory)
+    """
+
+    def __init__(self, width, height, platform="egl"):
+        if platform not in PLATFORMS:
+            raise ValueError("Unknown offscreen platform %r, expected one of %s" % (platform, PLATFORMS))
+        select_platform(platform)
+        self.width, self.height = width, height
+        self.platform = platform
+        getattr(self, "_create_" + platform)()
+
+        from OpenGL.GL import glViewport, glPixelStorei, GL_PACK_ALIGNMENT
+        glViewport(0, 0, width, height)
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+
+    def _create_egl(self):
+        import ctypes
+        from OpenGL import EGL
+
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(self.display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise RuntimeError("eglInitialize failed")
+        attributes = (EGL.EGLint * 13)(
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE,
+        )
+        config, count = EGL.EGLConfig(), EGL.EGLint()
+        if not EGL.eglChooseConfig(self.display, attributes, ctypes.pointer(config), 1, ctypes.pointer(count)) or not count.value:
+            raise RuntimeError("No EGL config with an RGB888 + depth pbuffer")
+        self.surface = EGL.eglCreatePbufferSurface(
+            self.display, config,
+            (EGL.EGLint * 5)(EGL.EGL_WIDTH, self.width, EGL.EGL_HEIGHT, self.height, EGL.EGL_NONE),
+        )
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        self.context = EGL.eglCreateContext(self.display, config, EGL.EGL_NO_CONTEXT, None)
+        if not EGL.eglMakeCurrent(self.display, self.surface, self.surface, self.context):
+            raise RuntimeError("eglMakeCurrent failed")
+
+    def _create_osmesa(self):
+        from OpenGL import osmesa, arrays
+        from OpenGL.GL import GL_UNSIGNED_BYTE
+
+        self.context = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 0, 0, None)
+        if not self.context:
+            raise RuntimeError("OSMesaCreateContextExt failed")
+        self.buffer = arrays.GLubyteArray.zeros((self.height, self.width, 4))
+        if not osmesa.OSMesaMakeCurrent(self.context, self.buffer, GL_UNSIGNED_BYTE, self.width, self.height):
+            raise RuntimeError("OSMesaMakeCurrent failed")
+
+    def read(self, out):
+        """Read the framebuffer into out, an (height, width, 3 or 4) uint8 array"""
+        from OpenGL.GL import glReadPixels, GL_RGB, GL_RGBA, GL_UNSIGNED_BYTE
+        glReadPixels(0, 0, self.width, self.height, GL_RGBA if out.shape[2] == 4 else GL_RGB,
+                     GL_UNSIGNED_BYTE, array=out)
+        return out
+
+    def destroy(self):
+        if self.platform == "egl":
+            from OpenGL import EGL
+            EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroySurface(self.display, self.surface)
+            EGL.eglDestroyContext(self.display, self.context)
+        else:
+            from OpenGL import osmesa
+            osmesa.OSMesaDestroyContext(self.context)
+        self.context = None
+
+
+# Image files :
+
+
+def _png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+
+def write_image(path, pixels, compression=1):
+    """Write a bottom-up (GL order) uint8 RGB/RGBA image as .png, .ppm or .npy"""
+    pixels = pixels[::-1]
+    if path.endswith(".npy"):
+        numpy.save(path, pixels)
+        return
+    height, width, channels = pixels.shape
+    if path.endswith(".ppm"):
+        with open(path, "wb") as f:
+            f.write(b"P6\n%d %d\n255\n" % (width, height))
+            f.write(numpy.ascontiguousarray(pixels[:, :, :3]).tobytes())
+        return
+
+    # PNG: filter type 0 on every row, one zlib stream (zlib drops the GIL) :
+
+    rows = numpy.empty((height, width * channels + 1), 'u1')
+    rows[:, 0] = 0
+    rows[:, 1:] = pixels.reshape((height, -1))
+    header = struct.pack(">IIBBBBB", width, height, 8, 6 if channels == 4 else 2, 0, 0, 0)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", header))
+        f.write(_png_chunk(b"IDAT", zlib.compress(rows.tobytes(), compression)))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+class FrameWriter(object):
+    """Writes frames on a background thread from a ring of preallocated buffers
+
+    pattern -- output path with a %d-style frame number, e.g. "out/f_%05d.png"
+    buffers -- frames that may be waiting to be written at once
+    """
+
+    def __init__(self, pattern, width, height, channels=3, buffers=8, compression=1):
+        self.pattern = pattern
+        self.compression = compression
+        self.buffers = [numpy.empty((height, width, channels), 'u1') for _ in range(buffers)]
+        self.free = queue.Queue()
+        for index in range(buffers):
+            self.free.put(index)
+        self.full = queue.Queue(maxsize=buffers)
+        self.written = 0
+        self.stalled = 0.0   # seconds the producer waited for a free buffer
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name="FrameWriter", daemon=True)
+        self.thread.start()
+
+    def acquire(self):
+        """(index, buffer) of a free buffer; blocks while all are queued"""
+        t = time.perf_counter()
+        index = self.free.get()
+        self.stalled += time.perf_counter() - t
+        if self.error is not None:
+            raise self.error
+        return index, self.buffers[index]
+
+    def submit(self, index, frame):
+        """Queue buffer index to be written as frame number frame"""
+        self.full.put((index, frame))
+
+    def close(self):
+        """Write everything still queued and stop the thread"""
+        if self.thread is None:
+            return
+        self.full.put(None)
+        self.thread.join()
+        self.thread = None
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        while True:
+            item = self.full.get()
+            if item is None:
+                break
+            index, frame = item
+            try:
+                if self.error is None:
+                    write_image(self.pattern % frame, self.buffers[index], self.compression)
+                    self.written += 1
+            except Exception as err:
+                self.error = err
+            finally:
+                self.free.put(index)
+
+
+def _write_oldest(readback, writer):
+    index, buffer = writer.acquire()
+    _, frame = readback.collect(buffer, withTag=True)
+    writer.submit(index, frame)
+
+
+def capture(context, render, frames, fps, writer, first=0, readback=None):
+    """Render and write frames at simulated times first/fps, (first+1)/fps, ...
+
+    render -- render(t) draws the scene at simulated time t seconds
+    readback -- optional OpenGL.GL.readback.AsyncReadback of the
+        writer's frame size and an RGB format; frames are then read
+        asynchronously, None reads each frame synchronously
+    Returns (frames rendered, wall seconds).
+    """
+    t0 = time.perf_counter()
+    try:
+        for k in range(first, first + frames):
+            render(k / float(fps))
+            if readback is None:
+                index, buffer = writer.acquire()
+                context.read(buffer)
+                writer.submit(index, k)
+                continue
+            readback.start(tag=k)
+            if readback.full():
+                _write_oldest(readback, writer)
+        while readback is not None and len(readback):
+            _write_oldest(readback, writer)
+    finally:
+        writer.close()
+    return frames, time.perf_counter() - t0
+
+
+# Dino Runner :
+
+
+def load_game(path=GAME_PATH):
+    """Import the game script as a module (its name is not an identifier)"""
+    sys.path.insert(0, os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location("dino_runner", path)
+    game = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(game)
+    return game
+
+
+def autopilot(sim):
+    """Simple bot: jump cacti, duck under pterodactyls"""
+    obs = sim.observe()
+    near = obs[7:7 + 5*OBS_AHEAD].reshape((OBS_AHEAD, 5))
+    dx, kind = near[0, 0], near[0, 4]
+    if 0.0 < dx < 3.5:
+        return CROUCH if kind == PTERO else JUMP
+    return NOOP
+
+
+def game_renderer(game, policy=None):
+    """render(t) for capture(): advances game.sim to t and draws it"""
+    sim, clock = game.sim, game.clock
+    state = {"steps": 0, "t": 0.0}
+    game.anim_clock = lambda: state["t"]
+
+    def render(t):
+        state["t"] = t
+        while (state["steps"] + 1) * sim.dt <= t:
+            sim.step(policy(sim) if policy else None)
+            state["steps"] += 1
+        clock.acc = t - state["steps"] * sim.dt   # interpolation fraction
+        game.render()
+
+    return render
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the Dino Runner offscreen to image files")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--fps", type=float, default=60.0, help="simulated frame rate")
+    parser.add_argument("--out", default="frames/dino_%05d.png",
+                        help="output pattern; .png, .ppm or .npy")
+    parser.add_argument("--platform", choices=PLATFORMS, default="egl")
+    parser.add_argument("--size", default=None, help="WxH (default: the game window size)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--buffers", type=int, default=8, help="frames queued for the writer at most")
+    parser.add_argument("--pbo", type=int, default=2,
+                        help="pixel-pack buffers for asynchronous readback (0 reads synchronously)")
+    parser.add_argument("--night", action="store_true")
+    parser.add_argument("--first-person", action="store_true")
+    parser.add_argument("--autopilot", action="store_true", help="let a simple bot play")
+    args = parser.parse_args()
+
+    select_platform(args.platform)
+    random.seed(args.seed)   # stars and trees come from the global generator
+    game = load_game()
+    width, height = game.WIN_W, game.WIN_H
+    if args.size:
+        width, height = (int(v) for v in args.size.lower().split("x"))
+    game.set_window_size(width, height)
+
+    context = OffscreenContext(width, height, args.platform)
+    game.text_enabled = False   # bitmap fonts need glutInit, which needs a display
+    game.init_gl()
+    game.sim.reset(args.seed)
+    game.is_night = args.night
+    game.view_first_person = args.first_person
+
+    directory = os.path.dirname(args.out)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    writer = FrameWriter(args.out, width, height, buffers=args.buffers)
+    render = game_renderer(game, autopilot if args.autopilot else None)
+    readback = None
+    if args.pbo:
+        from OpenGL.GL import GL_RGB
+        from OpenGL.GL.readback import AsyncReadback
+        readback = AsyncReadback(width, height, GL_RGB, count=args.pbo)
+    try:
+        frames, seconds = capture(context, render, args.frames, args.fps, writer, readback=readback)
+    finally:
+        if readback is not None:
+            readback.delete()
+        game.release_gl()
+        context.destroy()
+    print("%d frames in %.2fs (%.1f fps), render loop waited %.2fs on the writer"
+          % (frames, seconds, frames / seconds, writer.stalled))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# ----------------- Dino Runner collision -----------------
+# Batched axis-aligned box tests against the columnar entity stores.
+#
+# Boxes are (cx, cy, cz, w, h, d): centre plus full extents, the same
+# convention the old scalar aabb() used.  The comparisons below are the
+# exact float64 expressions of that test, so the batched versions report
+# the same hits, in ascending slot order.
+
+import numpy
+
+
+def aabb_hits(box, x, y, z, w, h, d):
+    """Boolean mask of which boxes (given as column arrays) overlap box"""
+    ax, ay, az, aw, ah, ad = box
+    return ((numpy.abs(ax - x)*2 < (aw + w)) &
+            (numpy.abs(ay - y)*2 < (ah + h)) &
+            (numpy.abs(az - z)*2 < (ad + d)))
+
+
+def _centre_y(store, slots, lift):
+    # Obstacles stand on y (lift=0.5 puts the centre at y+h/2),
+    # eggs are centred on it (lift=0) :
+    y = store.y[slots]
+    return y + store.h[slots]*lift if lift else y
+
+
+def store_hits(box, store, lift=0.5):
+    """Slots of live entities in store whose box overlaps box"""
+    live = store.live()
+    mask = aabb_hits(box, store.x[live], _centre_y(store, live, lift), store.z[live],
+                     store.w[live], store.h[live], store.d[live])
+    return live[mask]
+
+
+def sweep_hits(actors, store, lift=0.5):
+    """Sort-and-sweep broad phase for many actors against one store
+
+    actors -- (n, 6) array of actor boxes (cx, cy, cz, w, h, d)
+
+    Entities are sorted once by their low x edge.  Any entity that can
+    touch an actor has its low edge in [actor_lo - max_w, actor_hi), a
+    contiguous run of the sorted order found with two searchsorted calls,
+    so only those candidate pairs reach the exact box test.
+
+    Returns (actor_index, slot) arrays of every overlapping pair, ordered
+    by actor and then by slot.
+    """
+    actors = numpy.asarray(actors, dtype='d').reshape((-1, 6))
+    live = store.live()
+    if not len(actors) or not len(live):
+        empty = numpy.zeros(0, int)
+        return empty, empty
+
+    ex, ew = store.x[live], store.w[live]
+    lo = ex - ew/2
+    order = numpy.argsort(lo, kind='stable')
+    lo_sorted = lo[order]
+    ax, aw = actors[:, 0], actors[:, 3]
+    # A little slack keeps rounding in the edge arithmetic from dropping a
+    # pair the exact test would accept :
+    slack = 1e-6
+    start = numpy.searchsorted(lo_sorted, ax - aw/2 - ew.max() - slack, 'left')
+    stop = numpy.searchsorted(lo_sorted, ax + aw/2 + slack, 'right')
+    counts = numpy.maximum(stop - start, 0)
+    if not counts.sum():
+        empty = numpy.zeros(0, int)
+        return empty, empty
+
+    # Expand the per-actor [start, stop) runs into flat candidate pairs :
+
+    actor_idx = numpy.repeat(numpy.arange(len(actors)), counts)
+    offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    cand = order[numpy.repeat(start, counts) + offsets]
+
+    slots = live[cand]
+    a = actors[actor_idx]
+    mask = aabb_hits((a[:, 0], a[:, 1], a[:, 2], a[:, 3], a[:, 4], a[:, 5]),
+                     ex[cand], _centre_y(store, slots, lift), store.z[slots],
+                     ew[cand], store.h[slots], store.d[slots])
+    actor_idx, slots = actor_idx[mask], slots[mask]
+    result = numpy.lexsort((slots, actor_idx))
+    return actor_idx[result], slots[result]
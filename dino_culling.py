@@ -0,0 +1,82 @@
+# ----------------- Dino Runner view-frustum culling -----------------
+# Drops entities the camera cannot see before any GL call is made for them.
+#
+# The frustum is rebuilt each frame from the same parameters the game hands
+# to gluPerspective and gluLookAt: the six clip planes are the rows of the
+# combined projection * view matrix (Gribb & Hartmann), normalized.  Each
+# entity is tested as an axis-aligned box, all entities of a kind at once:
+# a box is outside when its corner furthest along a plane's normal is still
+# behind that plane.  The test is conservative (a box straddling a frustum
+# corner may survive), never the other way round, so culling does not change
+# what ends up on screen.
+
+import math
+import numpy
+
+
+def perspective(fovy, aspect, near, far):
+    """The matrix gluPerspective multiplies onto the projection stack"""
+    f = 1.0 / math.tan(math.radians(fovy) / 2.0)
+    return numpy.array([
+        [f / aspect, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)],
+        [0.0, 0.0, -1.0, 0.0],
+    ])
+
+
+def look_at(eye, center, up):
+    """The matrix gluLookAt multiplies onto the modelview stack"""
+    eye = numpy.asarray(eye, dtype='d')
+    f = numpy.asarray(center, dtype='d') - eye
+    f /= numpy.linalg.norm(f)
+    s = numpy.cross(f, up)
+    s /= numpy.linalg.norm(s)
+    u = numpy.cross(s, f)
+    m = numpy.identity(4)
+    m[0, :3], m[1, :3], m[2, :3] = s, u, -f
+    m[:3, 3] = -m[:3, :3].dot(eye)
+    return m
+
+
+class Frustum(object):
+    """The six clip planes of a projection * view matrix"""
+
+    def __init__(self, matrix):
+        m = numpy.asarray(matrix, dtype='d')
+        planes = numpy.array([
+            m[3] + m[0], m[3] - m[0],   # left, right
+            m[3] + m[1], m[3] - m[1],   # bottom, top
+            m[3] + m[2], m[3] - m[2],   # near, far
+        ])
+        planes /= numpy.linalg.norm(planes[:, :3], axis=1)[:, None]
+        self.normals = planes[:, :3]
+        self.offsets = planes[:, 3]
+        self.extents = numpy.abs(self.normals)
+
+    @classmethod
+    def from_camera(cls, fovy, aspect, near, far, eye, center, up=(0.0, 1.0, 0.0)):
+        return cls(perspective(fovy, aspect, near, far).dot(look_at(eye, center, up)))
+
+    def boxes(self, cx, cy, cz, hx, hy, hz):
+        """Mask of the boxes (centre, half extents; arrays or scalars) that may be visible"""
+        centres = numpy.stack(numpy.broadcast_arrays(cx, cy, cz), axis=-1)
+        halves = numpy.stack(numpy.broadcast_arrays(hx, hy, hz), axis=-1)
+        distance = centres.dot(self.normals.T) + self.offsets
+        reach = halves.dot(self.extents.T)
+        return (distance + reach >= 0.0).all(axis=-1)
+
+    def visible(self, bounds, x, y, z, sx=1.0, sy=1.0, sz=1.0):
+        """Mask of the instances of a model that may be visible
+
+        bounds -- (lo, hi) corners of the model's box in its own space
+        x, y, z -- translation of each instance
+        sx, sy, sz -- scale of each instance (glScalef after glTranslatef)
+        """
+        lo, hi = bounds
+        centre = (numpy.asarray(lo, 'd') + hi) / 2.0
+        half = (numpy.asarray(hi, 'd') - lo) / 2.0
+        return self.boxes(
+            x + centre[0]*sx, y + centre[1]*sy, z + centre[2]*sz,
+            half[0]*numpy.abs(sx), half[1]*numpy.abs(sy), half[2]*numpy.abs(sz),
+        )
@@ -0,0 +1,108 @@
+# ----------------- Dino Runner entity store -----------------
+# Columnar (struct-of-arrays) storage for obstacles, eggs and clouds.
+#
+# Each field is one NumPy array indexed by slot.  Spawning takes a slot from
+# the head of a ring of free slots (growing the arrays by doubling when it
+# runs dry) and despawning appends slots at its tail, so both are O(1) per
+# entity and no per-entity Python objects are created.  Movement, despawn
+# and collision then become whole-array operations over the live slots.
+
+import numpy
+
+# Entity kinds :
+
+CACTUS, PTERO, EGG, CLOUD = range(4)
+
+FIELDS = ("x", "y", "z", "w", "h", "d", "speed", "prev_x")
+
+
+class EntityStore(object):
+    """Fixed-layout entity columns with first-freed, first-reused slots"""
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.ring = numpy.zeros(0, int)  # free slots, ring[head] is next
+        self.head = self.nfree = 0
+        self.x = self.y = self.z = numpy.zeros(0)
+        self.w = self.h = self.d = self.speed = self.prev_x = numpy.zeros(0)
+        self.kind = numpy.zeros(0, 'i1')
+        self.alive = numpy.zeros(0, bool)
+        self.serial = numpy.zeros(0, int)  # spawn number of each slot's entity
+        self.spawns = 0
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        old = self.capacity
+        if capacity <= old:
+            return
+        for name in FIELDS + ("kind", "alive", "serial"):
+            column = getattr(self, name)
+            grown = numpy.zeros(capacity, column.dtype)
+            grown[:old] = column
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+        # Unroll the ring so the free slots still come first, then the new
+        # ones, lowest first :
+
+        ring = numpy.zeros(capacity, int)
+        ring[:self.nfree] = numpy.roll(self.ring, -self.head)[:self.nfree]
+        ring[self.nfree:self.nfree + capacity - old] = numpy.arange(old, capacity)
+        self.ring, self.head = ring, 0
+        self.nfree += capacity - old
+
+    def spawn(self, kind, x, y, z, w, h, d, speed):
+        if not self.nfree:
+            self.grow(2 * self.capacity)
+        slot = int(self.ring[self.head])
+        self.head = (self.head + 1) % self.capacity
+        self.nfree -= 1
+        self.kind[slot] = kind
+        self.x[slot], self.y[slot], self.z[slot] = x, y, z
+        self.prev_x[slot] = x
+        self.w[slot], self.h[slot], self.d[slot] = w, h, d
+        self.speed[slot] = speed
+        self.alive[slot] = True
+        self.spawns += 1
+        self.serial[slot] = self.spawns
+        return slot
+
+    def despawn(self, slots):
+        if not len(slots):
+            return  # the usual case, most steps despawn nothing
+        slots = numpy.unique(numpy.asarray(slots, dtype=int))
+        slots = slots[self.alive[slots]]
+        self.alive[slots] = False
+        tail = (self.head + self.nfree + numpy.arange(len(slots))) % self.capacity
+        self.ring[tail] = slots
+        self.nfree += len(slots)
+
+    def clear(self):
+        self.alive[:] = False
+        self.ring[:] = numpy.arange(self.capacity)
+        self.head, self.nfree = 0, self.capacity
+
+    def live(self):
+        """Slot indices of every live entity"""
+        return numpy.flatnonzero(self.alive)
+
+    def advance(self, dt, speed_mul=1.0):
+        # Dead slots move too; that is cheaper than masking and harmless,
+        # spawn overwrites every field :
+        self.x -= self.speed * (speed_mul * dt)
+
+    def remember(self):
+        """Snapshot x as the previous-step position used for interpolation"""
+        self.prev_x[:] = self.x
+
+    def lerp_x(self, slots, alpha):
+        """x of slots interpolated alpha of the way from the previous step"""
+        prev = self.prev_x[slots]
+        return prev + (self.x[slots] - prev) * alpha
+
+    def behind(self, limit):
+        """Live slots whose x has scrolled past limit"""
+        return numpy.flatnonzero(self.alive & (self.x < limit))
+
+    def __len__(self):
+        return self.capacity - self.nfree
@@ -0,0 +1,280 @@
+# ----------------- PyOpenGL import-time and memory benchmark -----------------
+# Measures what importing the OpenGL package costs, so startup regressions
+# show up in a diff instead of a bug report.
+#
+#     python dino_importbench.py --out imports.json
+#     python dino_importbench.py --baseline imports.json --out after.json
+#     python dino_importbench.py OpenGL.GL OpenGL.raw.GL.VERSION.GL_4_6 --repeat 9
+#     python dino_importbench.py --env PYOPENGL_LAZY_NAMESPACES=1 OpenGL.GL
+#
+# Every number comes from a fresh interpreter that imports one module and
+# nothing else first: its wall time (the median and best of --repeat runs,
+# after one warm-up run that fills the bytecode cache), a run under
+# -X importtime for the per-module times, and a run under tracemalloc for
+# the memory allocated (total and per OpenGL module file), the number of
+# gc-tracked objects added, by type, and the number of modules loaded.
+#
+# All of it is done with OpenGL_accelerate disabled (PYOPENGL_USE_ACCELERATE=0)
+# and, when it is installed, again with it enabled.  The results go to JSON;
+# given a baseline file, the medians, allocations and object counts are
+# compared and the run fails if any grows by more than --threshold.
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+
+FORMAT = 1
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+TARGETS = ("OpenGL", "OpenGL.GL", "OpenGL.GLU", "OpenGL.GLUT",
+           "OpenGL.GLES2", "OpenGL.GLES3", "OpenGL.EGL")
+MODES = {"python": "0", "accelerate": "1"}   # PYOPENGL_USE_ACCELERATE
+COMPARED = ("median_ms", "allocated_kb", "objects")
+
+# Runs in the child interpreter.  It imports nothing before the measured
+# import except what the interpreter has already loaded (and, for the
+# memory run, gc and tracemalloc) :
+
+CHILD = r'''
+import sys, time
+name, kind, root = sys.argv[1], sys.argv[2], sys.argv[3]
+result = {}
+def count_types():
+    import gc
+    for _ in range(3):
+        gc.collect()   # drop garbage; repeated, nested atomic tuples get untracked
+    counts = {}
+    for obj in gc.get_objects():
+        key = type(obj).__name__
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+if kind == "memory":
+    import tracemalloc
+    before = count_types()
+    modules = len(sys.modules)
+    tracemalloc.start()
+    __import__(name)
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    types = {}
+    for key, count in count_types().items():
+        if count > before.get(key, 0):
+            types[key] = count - before.get(key, 0)
+    by_module = {}
+    for stat in snapshot.statistics("filename"):
+        path = stat.traceback[0].filename
+        if path.startswith(root):
+            module = path[len(root):-3].replace("\\", "/").strip("/").replace("/", ".")
+            if module.endswith(".__init__"):
+                module = module[:-9]
+        else:
+            module = "(other)"
+        by_module[module] = by_module.get(module, 0) + stat.size
+    result.update(allocated=current, peak=peak, objects=sum(types.values()), types=types,
+                  modules=len(sys.modules) - modules, by_module=by_module)
+else:
+    t0 = time.perf_counter()
+    __import__(name)
+    result["seconds"] = time.perf_counter() - t0
+accelerate = sys.modules.get("OpenGL.acceleratesupport")
+result["accelerated"] = bool(getattr(accelerate, "ACCELERATE_AVAILABLE", False))
+import json
+print(json.dumps(result))
+'''
+
+
+def raw_version_modules():
+    """The OpenGL.raw.GL.VERSION modules, in version order"""
+    directory = os.path.join(HERE, "OpenGL", "raw", "GL", "VERSION")
+    names = sorted(name[:-3] for name in os.listdir(directory)
+                   if name.startswith("GL_") and name.endswith(".py"))
+    return ["OpenGL.raw.GL.VERSION." + name for name in names]
+
+
+class ChildError(RuntimeError):
+    pass
+
+
+def run_child(target, kind, env, options=()):
+    """Import target in a fresh interpreter; returns (result dict, stderr)"""
+    process = subprocess.run(
+        [sys.executable] + list(options) + ["-c", CHILD, target, kind, HERE],
+        cwd=HERE, env=env, capture_output=True, text=True,
+    )
+    if process.returncode:
+        lines = process.stderr.strip().splitlines() or ["exit status %d" % process.returncode]
+        raise ChildError(lines[-1])
+    return json.loads(process.stdout.strip().splitlines()[-1]), process.stderr
+
+
+def parse_importtime(stderr, prefix="OpenGL"):
+    """{module: [self ms, cumulative ms]} from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue   # the header
+        name = fields[2].strip()
+        if name == prefix or name.startswith(prefix + "."):
+            modules[name] = [int(fields[0]) / 1000.0, int(fields[1]) / 1000.0]
+    return modules
+
+
+def measure(target, env, repeat, top=15):
+    """Timing, import profile and memory of importing target"""
+    run_child(target, "time", env)   # warm-up, fills the bytecode cache
+    times = [run_child(target, "time", env)[0]["seconds"] * 1000.0 for _ in range(repeat)]
+    _, stderr = run_child(target, "time", env, ["-X", "importtime"])
+    memory, _ = run_child(target, "memory", env)
+    types = sorted(memory["types"].items(), key=lambda item: -item[1])
+    return {
+        "accelerated": memory["accelerated"],
+        "times_ms": [round(t, 3) for t in times],
+        "median_ms": round(statistics.median(times), 3),
+        "best_ms": round(min(times), 3),
+        "allocated_kb": round(memory["allocated"] / 1024.0, 1),
+        "peak_kb": round(memory["peak"] / 1024.0, 1),
+        "objects": memory["objects"],
+        "modules": memory["modules"],
+        "object_types": dict(types[:top]),
+        "memory_by_module_kb": {name: round(size / 1024.0, 1) for name, size
+                                in sorted(memory["by_module"].items(), key=lambda item: -item[1])},
+        "import_time_by_module_ms": parse_importtime(stderr),
+    }
+
+
+def child_env(use_accelerate, pycache, extra):
+    env = dict(os.environ)
+    env["PYOPENGL_USE_ACCELERATE"] = use_accelerate
+    # compile once into our own cache instead of on every run (or into the tree)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = pycache
+    env.update(extra)
+    return env
+
+
+def run_benchmarks(targets, repeat, pycache, extra_env, log=print):
+    """{"environment": ..., "results": {mode: {target: measurement}}}"""
+    accelerate = importlib.util.find_spec("OpenGL_accelerate") is not None
+    results = {}
+    for mode, use_accelerate in MODES.items():
+        if use_accelerate == "1" and not accelerate:
+            results[mode] = {"skipped": "OpenGL_accelerate is not installed"}
+            log("%s: skipped, OpenGL_accelerate is not installed" % mode)
+            continue
+        env = child_env(use_accelerate, pycache, extra_env)
+        results[mode] = {}
+        for target in targets:
+            try:
+                results[mode][target] = entry = measure(target, env, repeat)
+            except ChildError as err:
+                results[mode][target] = {"error": str(err)}
+                log("%-8s %-36s failed: %s" % (mode, target, err))
+            else:
+                log("%-8s %-36s %8.1f ms %8.1f ms best %9.1f KB %7d objects %4d modules"
+                    % (mode, target, entry["median_ms"], entry["best_ms"],
+                       entry["allocated_kb"], entry["objects"], entry["modules"]))
+    return {
+        "format": FORMAT,
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "opengl": opengl_version(),
+            "pyopengl_platform": os.environ.get("PYOPENGL_PLATFORM"),
+            "accelerate_installed": accelerate,
+            "repeat": repeat,
+            "env": extra_env,
+        },
+        "results": results,
+    }
+
+
+def opengl_version():
+    namespace = {}
+    with open(os.path.join(HERE, "OpenGL", "version.py")) as f:
+        exec(f.read(), namespace)
+    return namespace.get("__version__")
+
+
+def compare(current, baseline, threshold):
+    """{mode: {target: {field: [baseline, current, change]}}} and regressions
+
+    change is the relative growth (0.1 == 10% more); a regression is a
+    compared field that grew by more than threshold.
+    """
+    comparison = {}
+    regressions = []
+    for mode, entries in current["results"].items():
+        before = baseline.get("results", {}).get(mode, {})
+        for target, entry in entries.items():
+            old = before.get(target)
+            if not isinstance(entry, dict) or not isinstance(old, dict) \
+                    or "error" in entry or "error" in old:
+                continue
+            fields = {}
+            for field in COMPARED:
+                if field in entry and field in old:
+                    change = (entry[field] - old[field]) / float(old[field]) if old[field] else 0.0
+                    fields[field] = [old[field], entry[field], round(change, 4)]
+                    if change > threshold:
+                        regressions.append((mode, target, field, old[field], entry[field], change))
+            comparison.setdefault(mode, {})[target] = fields
+    return comparison, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark importing the OpenGL package")
+    parser.add_argument("targets", nargs="*",
+                        help="modules to import (default: the main packages and every raw.GL.VERSION module)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed imports per module")
+    parser.add_argument("--out", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="earlier --out file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative growth counted as a regression (default 0.10)")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE",
+                        help="extra environment for the imports, e.g. PYOPENGL_LAZY_NAMESPACES=1")
+    parser.add_argument("--pycache", default=os.path.join(tempfile.gettempdir(), "dino_importbench_pycache"),
+                        help="bytecode cache directory for the imported modules")
+    args = parser.parse_args()
+
+    targets = args.targets or list(TARGETS) + raw_version_modules()
+    extra_env = dict(item.split("=", 1) for item in args.env)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("format") != FORMAT:
+            raise SystemExit("%s is not a format %d import benchmark" % (args.baseline, FORMAT))
+
+    results = run_benchmarks(targets, args.repeat, args.pycache, extra_env)
+    regressions = []
+    if baseline is not None:
+        results["baseline"] = {"path": args.baseline, "environment": baseline.get("environment")}
+        results["comparison"], regressions = compare(results, baseline, args.threshold)
+        for mode, entries in results["comparison"].items():
+            for target, fields in entries.items():
+                print("%-8s %-36s %s" % (mode, target, "  ".join(
+                    "%s %+.1f%%" % (field, change * 100.0) for field, (_, _, change) in fields.items())))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=1)
+
+    if regressions:
+        for mode, target, field, old, new, change in regressions:
+            print("REGRESSION %s %s %s: %s -> %s (%+.1f%%)" % (mode, target, field, old, new, change * 100.0))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# ----------------- Dino Runner instanced rendering -----------------
+# Draws every entity of one kind (cacti, pterodactyls, eggs, clouds) with a
+# single glDrawArraysInstanced call.
+#
+# The per-instance data is one float32 row per entity:
+#
+#     x, y, z, yaw,   sx, sy, sz, 0,   r, g, b, a
+#
+# uploaded into a stream VBO each frame and fed to the vertex shader through
+# attributes with a divisor of 1.  The shader rebuilds the
+# translate * rotate(yaw about y) * scale model transform that the
+# immediate-mode path issues with glTranslatef/glRotatef/glScalef, and
+# reproduces the fixed-function GL_LIGHT0 + GL_COLOR_MATERIAL lighting so both
+# paths look the same.  With set_lighting() the light comes from the shared
+# uniform block of dino_lighting instead of the fixed-function light state.
+
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+from OpenGL.GL.VERSION import GL_3_1, GL_3_3
+from OpenGL.GL.ARB import draw_instanced, instanced_arrays
+from OpenGL.arrays import vbo
+from OpenGL.extensions import alternate
+import numpy
+
+import dino_lighting
+
+
+INSTANCE_FLOATS = 12
+INSTANCE_STRIDE = INSTANCE_FLOATS * 4
+
+glDrawArraysInstanced = alternate(
+    GL_3_1.glDrawArraysInstanced, draw_instanced.glDrawArraysInstancedARB,
+)
+glVertexAttribDivisor = alternate(
+    GL_3_3.glVertexAttribDivisor, instanced_arrays.glVertexAttribDivisorARB,
+)
+
+# Lighting as GL_LIGHT0 does it, read from the fixed-function state :
+
+LIGHT_HEADER = """#version 120
+"""
+
+LIGHT_FUNCTION = """
+vec3 light(vec3 n, vec4 eye) {
+    vec4 lp = gl_LightSource[0].position;
+    vec3 l = normalize(lp.xyz - eye.xyz * lp.w);
+    return gl_LightModel.ambient.rgb + gl_LightSource[0].ambient.rgb
+         + gl_LightSource[0].diffuse.rgb * max(dot(n, l), 0.0);
+}
+"""
+
+VERTEX_SHADER = """
+attribute vec4 a_offset;   // x, y, z, yaw (degrees)
+attribute vec4 a_scale;
+attribute vec4 a_color;
+uniform bool u_lit;
+varying vec4 v_color;
+
+void main() {
+    float s = sin(radians(a_offset.w));
+    float c = cos(radians(a_offset.w));
+    vec3 p = gl_Vertex.xyz * a_scale.xyz;
+    p = vec3(c*p.x + s*p.z, p.y, -s*p.x + c*p.z) + a_offset.xyz;
+    vec4 eye = gl_ModelViewMatrix * vec4(p, 1.0);
+    gl_Position = gl_ProjectionMatrix * eye;
+
+    if (u_lit) {
+        vec3 n = gl_Normal / a_scale.xyz;
+        n = vec3(c*n.x + s*n.z, n.y, -s*n.x + c*n.z);
+        n = normalize(gl_NormalMatrix * n);
+        v_color = vec4(min(a_color.rgb * light(n, eye), 1.0), a_color.a);
+    } else {
+        v_color = a_color;
+    }
+}
+"""
+
+FRAGMENT_SHADER = """#version 120
+varying vec4 v_color;
+
+void main() {
+    gl_FragColor = v_color;
+}
+"""
+
+_program = None
+_locations = None
+_lighting = None
+
+
+def available():
+    """True if the current context can run the instanced path"""
+    return bool(glDrawArraysInstanced) and bool(glVertexAttribDivisor) and bool(glCreateShader)
+
+
+def set_lighting(lighting):
+    """Light instances from a dino_lighting.Lighting (None: fixed-function)"""
+    global _program, _lighting
+    if _program is not None:
+        glDeleteProgram(_program)
+        _program = None
+    _lighting = lighting
+
+
+def get_program():
+    global _program, _locations
+    if _program is None:
+        if _lighting is None:
+            source = LIGHT_HEADER + LIGHT_FUNCTION + VERTEX_SHADER
+        else:
+            source = dino_lighting.HEADER + dino_lighting.LIGHT_FUNCTION + VERTEX_SHADER
+        _program = shaders.compileProgram(
+            shaders.compileShader(source, GL_VERTEX_SHADER),
+            shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            validate=False,
+        )
+        _locations = {
+            name: glGetAttribLocation(_program, name)
+            for name in ('a_offset', 'a_scale', 'a_color')
+        }
+        _locations['u_lit'] = glGetUniformLocation(_program, 'u_lit')
+        if _lighting is not None:
+            _lighting.attach(_program)
+    return _program, _locations
+
+
+class InstanceBatch(object):
+    """All instances of one mesh, redrawn each frame with one call"""
+
+    def __init__(self, mesh, lit=True):
+        self.mesh = mesh
+        self.lit = lit
+        self.capacity = 0
+        self.vbo = None
+
+    def upload(self, instances):
+        instances = numpy.ascontiguousarray(instances, dtype='f')
+        if self.vbo is None or len(instances) > self.capacity:
+
+            # Grow by doubling so a rising spawn rate does not reallocate
+            # the GL buffer every frame :
+
+            self.capacity = max(16, 2*self.capacity, len(instances))
+            storage = numpy.zeros((self.capacity, INSTANCE_FLOATS), 'f')
+            if self.vbo is not None:
+                self.vbo.delete()
+            self.vbo = vbo.VBO(storage, usage='GL_STREAM_DRAW')
+        if len(instances):
+            self.vbo[0:len(instances)] = instances
+
+    def draw(self, instances):
+        count = len(instances)
+        if not count:
+            return
+        self.upload(instances)
+        program, loc = get_program()
+        glUseProgram(program)
+        glUniform1i(loc['u_lit'], int(self.lit))
+
+        self.mesh.bind()
+        self.vbo.bind()
+        for i, name in enumerate(('a_offset', 'a_scale', 'a_color')):
+            glEnableVertexAttribArray(loc[name])
+            glVertexAttribPointer(loc[name], 4, GL_FLOAT, GL_FALSE, INSTANCE_STRIDE, self.vbo + i*16)
+            glVertexAttribDivisor(loc[name], 1)
+        self.vbo.unbind()
+
+        glDrawArraysInstanced(self.mesh.mode, 0, self.mesh.count, count)
+
+        # Divisors live in the shared default vertex array state, reset them
+        # so later non-instanced draws are unaffected :
+
+        for name in ('a_offset', 'a_scale', 'a_color'):
+            glVertexAttribDivisor(loc[name], 0)
+            glDisableVertexAttribArray(loc[name])
+        glUseProgram(0)
+
+    def delete(self):
+        if self.vbo is not None:
+            self.vbo.delete()
+            self.vbo = None
+        self.capacity = 0
+
+
+def instance_rows(count):
+    """Preallocated (count, INSTANCE_FLOATS) array with unit scale and alpha"""
+    rows = numpy.zeros((count, INSTANCE_FLOATS), 'f')
+    rows[:, 4:7] = 1.0
+    rows[:, 11] = 1.0
+    return rows
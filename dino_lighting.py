@@ -0,0 +1,132 @@
+# ----------------- Dino Runner shader lighting -----------------
+# GL_LIGHT0 + GL_COLOR_MATERIAL lighting as a GLSL program.
+#
+# The fixed-function path re-enables lighting and re-uploads three
+# glLightfv arrays every frame.  Here the light's colours and world-space
+# position live in a std140 uniform block, backed by one small buffer that
+# is rewritten only when the day/night parameters actually change.  The only
+# per-frame work is moving the light into eye space (the view matrix changes
+# with the camera) and passing it as four plain floats to each program that
+# lights with the block.
+#
+# Other programs (the instanced entity shader) light the same way by
+# splicing HEADER and LIGHT_FUNCTION into their source and handing the
+# compiled program to Lighting.attach().
+
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+from OpenGL.arrays import vbo
+import numpy
+
+BINDING = 0  # uniform buffer binding point of the Lighting block
+
+HEADER = """#version 120
+#extension GL_ARB_uniform_buffer_object : require
+layout(std140) uniform Lighting {
+    vec4 light_position;   // world space
+    vec4 light_diffuse;
+    vec4 light_ambient;
+    vec4 scene_ambient;    // GL_LIGHT_MODEL_AMBIENT
+};
+uniform vec4 u_light_eye;  // light_position in eye space, set per frame
+"""
+
+LIGHT_FUNCTION = """
+vec3 light(vec3 n, vec4 eye) {
+    vec3 l = normalize(u_light_eye.xyz - eye.xyz * u_light_eye.w);
+    return scene_ambient.rgb + light_ambient.rgb + light_diffuse.rgb * max(dot(n, l), 0.0);
+}
+"""
+
+VERTEX_SHADER = HEADER + LIGHT_FUNCTION + """
+uniform bool u_lit;
+varying vec4 v_color;
+
+void main() {
+    vec4 eye = gl_ModelViewMatrix * gl_Vertex;
+    gl_Position = gl_ProjectionMatrix * eye;
+    if (u_lit) {
+        vec3 n = normalize(gl_NormalMatrix * gl_Normal);
+        v_color = vec4(min(gl_Color.rgb * light(n, eye), 1.0), gl_Color.a);
+    } else {
+        v_color = gl_Color;
+    }
+}
+"""
+
+FRAGMENT_SHADER = """#version 120
+varying vec4 v_color;
+
+void main() {
+    gl_FragColor = v_color;
+}
+"""
+
+SCENE_AMBIENT = (0.2, 0.2, 0.2, 1.0)
+
+
+def available():
+    """True if the current context has GLSL and uniform buffer objects"""
+    return bool(glCreateShader) and bool(glGetUniformBlockIndex) and bool(glBindBufferBase)
+
+
+class Lighting(object):
+    """World lighting program plus the uniform block it shares"""
+
+    def __init__(self):
+        self.program = shaders.compileProgram(
+            shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            validate=False,
+        )
+        self.lit_location = glGetUniformLocation(self.program, 'u_lit')
+        self.block = numpy.zeros((4, 4), 'f')
+        self.block[3] = SCENE_AMBIENT
+        self.buffer = vbo.VBO(self.block, usage='GL_DYNAMIC_DRAW', target='GL_UNIFORM_BUFFER')
+        self.key = None
+        self.light_eye = (0.0, 0.0, 1.0, 0.0)
+        self.programs = {}
+        self.attach(self.program)
+
+    def attach(self, program):
+        """Light program from the shared block (its source uses HEADER)"""
+        glUniformBlockBinding(program, glGetUniformBlockIndex(program, 'Lighting'), BINDING)
+        location = self.programs[program] = glGetUniformLocation(program, 'u_light_eye')
+        glUseProgram(program)
+        glUniform4f(location, *self.light_eye)
+        glUseProgram(0)
+
+    def update(self, key, position, diffuse, ambient):
+        """Set the light; the buffer is only rewritten when key changes"""
+        if key == self.key:
+            return
+        self.key = key
+        self.block[0], self.block[1], self.block[2] = position, diffuse, ambient
+        self.buffer.set_array(self.block)
+        self.buffer.bind()   # re-uploads the changed array
+        self.buffer.unbind()
+        glBindBufferBase(GL_UNIFORM_BUFFER, BINDING, int(self.buffer))
+
+    def begin(self, view):
+        """Start lit world drawing with the camera's view matrix"""
+        self.light_eye = tuple(float(v) for v in numpy.dot(view, self.block[0]))
+        for program, location in self.programs.items():
+            glUseProgram(program)
+            glUniform4f(location, *self.light_eye)
+        self.use()
+
+    def use(self):
+        """Bind the world program again (after another program was used)"""
+        glUseProgram(self.program)
+        glUniform1i(self.lit_location, 1)
+
+    def set_lit(self, lit):
+        glUniform1i(self.lit_location, int(lit))
+
+    def end(self):
+        glUseProgram(0)
+
+    def delete(self):
+        self.buffer.delete()
+        glDeleteProgram(self.program)
+        self.programs.clear()
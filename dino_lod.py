@@ -0,0 +1,78 @@
+# ----------------- Dino Runner level of detail -----------------
+# Picks a tessellation level per object from its projected size.
+#
+# Each primitive (tree canopy sphere, egg sphere, cloud puff fan) has a few
+# precomputed levels, finest first.  An object's projected radius in pixels
+# decides its level: below thresholds[i] it drops from level i to i+1.  To
+# keep objects hovering near a threshold from flickering between levels,
+# the switch only happens once the size is `margin` past the threshold, in
+# the direction of the change; in between, the object keeps the level it
+# had last frame.  Levels are chosen for all objects of a kind at once.
+#
+# Entity slots and streamed scenery ids are reused, so their levels are
+# kept with a serial of the id's occupant (its spawn, its chunk); a new
+# object under an old id starts from scratch rather than from the level of
+# the one before it.
+
+import math
+import numpy
+
+
+def screen_radius(eye, x, y, z, radius, fovy, viewport_h):
+    """Approximate projected radius in pixels of spheres at (x, y, z)"""
+    focal = (viewport_h / 2.0) / math.tan(math.radians(fovy) / 2.0)
+    distance = numpy.sqrt((x - eye[0])**2 + (y - eye[1])**2 + (z - eye[2])**2)
+    return radius * focal / numpy.maximum(distance, 1e-6)
+
+
+class LodLevels(object):
+    """Tessellation levels of one primitive, with per-object hysteresis
+
+    levels -- per-level parameters (e.g. (slices, stacks)), finest first
+    thresholds -- projected radius in pixels below which level i gives
+        way to level i+1; descending, one fewer than levels
+    margin -- fraction a size must pass a threshold by to switch level
+    """
+
+    def __init__(self, levels, thresholds, margin=0.2, capacity=64):
+        if len(thresholds) != len(levels) - 1:
+            raise ValueError("Need one threshold between each pair of levels")
+        self.levels = list(levels)
+        thresholds = numpy.asarray(thresholds, dtype='d')
+        self.finer = thresholds * (1.0 + margin)    # grow past this to refine
+        self.coarser = thresholds * (1.0 - margin)  # shrink below this to coarsen
+        self.current = numpy.zeros(capacity, 'i1')
+        self.serial = numpy.zeros(capacity, int)
+
+    def select(self, ids, size, serials=None):
+        """Level index for each object id given its projected radius
+
+        ids -- stable integer ids (entity slots, tree indices); each id
+            remembers its level for the hysteresis
+        serials -- for reused ids, the serial of each id's occupant
+            (EntityStore.serial, the WorldStreamer.items() serials); an
+            id whose serial changed forgets its level
+        """
+        ids = numpy.asarray(ids, dtype=int)
+        size = numpy.asarray(size, dtype='d').reshape(-1, 1)
+        if len(ids) and ids.max() >= len(self.current):
+            capacity = max(2*len(self.current), ids.max() + 1)
+            for name in ("current", "serial"):
+                column = getattr(self, name)
+                grown = numpy.zeros(capacity, column.dtype)
+                grown[:len(column)] = column
+                setattr(self, name, grown)
+        if serials is not None:
+            reused = ids[self.serial[ids] != serials]
+            self.current[reused] = 0
+            self.serial[ids] = serials
+
+        # The coarsest level the size allows without passing a threshold by
+        # the margin, and the finest; keep the current level if it lies
+        # between the two :
+
+        coarsest = (self.finer > size).sum(axis=1)
+        finest = (self.coarser > size).sum(axis=1)
+        level = numpy.clip(self.current[ids], finest, coarsest).astype('i1')
+        self.current[ids] = level
+        return level
@@ -0,0 +1,249 @@
+# ----------------- Dino Runner mesh cache -----------------
+# Retained-mode primitives for the Dino Runner.
+#
+# Every primitive is tessellated once into an interleaved (normal, position)
+# float32 VBO and replayed with a single glDrawArrays call.  Callers size and
+# place it with the model transform (glTranslatef / glScalef), so the Python
+# side only pays for a handful of wrapper calls per draw instead of one call
+# per vertex.  Scaled meshes need GL_NORMALIZE enabled for correct lighting.
+
+from OpenGL.GL import *
+from OpenGL.arrays import vbo
+import math
+import numpy
+
+STRIDE = 6 * 4  # nx,ny,nz, x,y,z  (float32)
+
+_cache = {}
+_bound = None
+
+
+class Mesh(object):
+    """Static mesh stored in a VBO, drawn with one glDrawArrays"""
+
+    def __init__(self, mode, data):
+        self.mode = mode
+        self.data = numpy.asarray(data, dtype='f').reshape((-1, 6))
+        self.count = len(self.data)
+        self.vbo = vbo.VBO(self.data, usage='GL_STATIC_DRAW')
+        points = self.data[:, 3:] if self.count else numpy.zeros((1, 3), 'f')
+        self.lo, self.hi = points.min(axis=0), points.max(axis=0)
+
+    def bounds(self):
+        """(lo, hi) corners of the mesh's axis-aligned bounding box"""
+        return self.lo, self.hi
+
+    def bind(self):
+        global _bound
+        self.vbo.bind()
+        if _bound is None:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glEnableClientState(GL_VERTEX_ARRAY)
+        glNormalPointer(GL_FLOAT, STRIDE, self.vbo)
+        glVertexPointer(3, GL_FLOAT, STRIDE, self.vbo + 12)
+        _bound = self
+
+    def draw(self):
+        # Consecutive draws of the same mesh (the common case for boxes)
+        # skip the bind and pointer setup entirely.
+        if _bound is not self:
+            self.bind()
+        glDrawArrays(self.mode, 0, self.count)
+
+    def delete(self):
+        self.vbo.delete()
+
+
+def release():
+    """Unbind whatever mesh is bound and disable the client arrays
+
+    Call once after the last mesh draw of a pass, before any code
+    that relies on the default array state (2D overlay, text).
+    """
+    global _bound
+    if _bound is not None:
+        _bound.vbo.unbind()
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        _bound = None
+
+
+def get_mesh(key, build):
+    """Return the cached mesh for key, building it with build() on first use"""
+    mesh = _cache.get(key)
+    if mesh is None:
+        mode, data = build()
+        mesh = _cache[key] = Mesh(mode, data)
+    return mesh
+
+
+def clear():
+    """Delete all cached meshes (e.g. before the GL context goes away)"""
+    release()
+    for mesh in _cache.values():
+        mesh.delete()
+    _cache.clear()
+
+# Compound meshes :
+
+
+class MeshBuilder(object):
+    """CPU-side matrix stack for baking several primitives into one mesh
+
+    Mirrors the glPushMatrix / glTranslatef / glRotatef / glScalef calls of
+    an immediate-mode draw function, but transforms the primitive's
+    vertices on the CPU once, so the whole model can be replayed (or
+    instanced) as a single mesh.
+    """
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.stack = [numpy.identity(4, dtype='d')]
+        self.parts = []
+
+    def push(self):
+        self.stack.append(self.stack[-1].copy())
+
+    def pop(self):
+        self.stack.pop()
+
+    def _apply(self, m):
+        self.stack[-1] = self.stack[-1].dot(m)
+
+    def translate(self, x, y, z):
+        m = numpy.identity(4)
+        m[:3, 3] = (x, y, z)
+        self._apply(m)
+
+    def scale(self, x, y, z):
+        self._apply(numpy.diag((x, y, z, 1.0)))
+
+    def rotate(self, angle, x, y, z):
+        # Same matrix glRotatef builds :
+        axis = numpy.array((x, y, z), 'd')
+        x, y, z = axis / numpy.linalg.norm(axis)
+        a = math.radians(angle); c, s = math.cos(a), math.sin(a)
+        m = numpy.identity(4)
+        m[:3, :3] = [
+            [x*x*(1-c)+c, x*y*(1-c)-z*s, x*z*(1-c)+y*s],
+            [y*x*(1-c)+z*s, y*y*(1-c)+c, y*z*(1-c)-x*s],
+            [x*z*(1-c)-y*s, y*z*(1-c)+x*s, z*z*(1-c)+c],
+        ]
+        self._apply(m)
+
+    def add(self, mesh):
+        assert mesh.mode == self.mode, "Can only combine meshes of the same mode"
+        m = self.stack[-1]
+        data = mesh.data.astype('d')
+        normals = data[:, :3].dot(numpy.linalg.inv(m[:3, :3]))
+        normals /= numpy.linalg.norm(normals, axis=1)[:, None]
+        points = data[:, 3:].dot(m[:3, :3].T) + m[:3, 3]
+        self.parts.append(numpy.hstack((normals, points)))
+
+    def box(self, w, h, d):
+        self.push(); self.scale(w, h, d); self.add(unit_box()); self.pop()
+
+    def build(self):
+        return self.mode, numpy.vstack(self.parts)
+
+# Builders :
+
+
+def _build_box():
+
+    # Unit cube centred on the origin, same winding as the old draw_box :
+
+    faces = [
+        ((0, 0, 1), [(-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)]),
+        ((0, 0, -1), [(-1, -1, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1)]),
+        ((-1, 0, 0), [(-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1)]),
+        ((1, 0, 0), [(1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1)]),
+        ((0, 1, 0), [(-1, 1, -1), (-1, 1, 1), (1, 1, 1), (1, 1, -1)]),
+        ((0, -1, 0), [(-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1)]),
+    ]
+    data = []
+    for n, quad in faces:
+        for v in quad:
+            data.append(n + tuple(c * 0.5 for c in v))
+    return GL_QUADS, data
+
+
+def _build_disc(slices):
+
+    # Unit disc (radius 1, thickness 1) as plain triangles so the two caps
+    # and the rim go out in one draw :
+
+    ring = [(math.cos(2 * math.pi * i / slices), math.sin(2 * math.pi * i / slices))
+            for i in range(slices + 1)]
+    data = []
+    for i in range(slices):
+        (c0, s0), (c1, s1) = ring[i], ring[i + 1]
+        data += [(0, 1, 0, 0, 0.5, 0), (0, 1, 0, c0, 0.5, s0), (0, 1, 0, c1, 0.5, s1)]
+        data += [(0, -1, 0, 0, -0.5, 0), (0, -1, 0, c0, -0.5, s0), (0, -1, 0, c1, -0.5, s1)]
+        a0 = (c0, 0, s0, c0, -0.5, s0); b0 = (c0, 0, s0, c0, 0.5, s0)
+        a1 = (c1, 0, s1, c1, -0.5, s1); b1 = (c1, 0, s1, c1, 0.5, s1)
+        data += [a0, b0, b1, a0, b1, a1]
+    return GL_TRIANGLES, data
+
+
+def _build_sphere(radius, slices, stacks):
+
+    # Same layout as gluSphere: poles on the z axis, `stacks` bands of
+    # `slices` quads, each split into two triangles :
+
+    def point(i, j):
+        theta, rho = 2 * math.pi * i / slices, math.pi * j / stacks
+        n = (math.cos(theta) * math.sin(rho), math.sin(theta) * math.sin(rho), math.cos(rho))
+        return n + tuple(radius * c for c in n)
+
+    data = []
+    for j in range(stacks):
+        for i in range(slices):
+            a, b = point(i, j), point(i + 1, j)
+            c, d = point(i + 1, j + 1), point(i, j + 1)
+            data += [a, d, c, a, c, b]
+    return GL_TRIANGLES, data
+
+
+def _build_cylinder(base, top, height, slices, stacks):
+
+    # Same layout as gluCylinder: open tube along +z from 0 to height :
+
+    slope = (base - top) / height if height else 0.0
+    nlen = math.sqrt(1 + slope * slope)
+
+    def point(i, j):
+        theta = 2 * math.pi * i / slices
+        c, s = math.cos(theta), math.sin(theta)
+        r = base + (top - base) * j / stacks
+        return (c / nlen, s / nlen, slope / nlen, r * c, r * s, height * j / stacks)
+
+    data = []
+    for j in range(stacks):
+        for i in range(slices):
+            a, b = point(i, j), point(i + 1, j)
+            c, d = point(i + 1, j + 1), point(i, j + 1)
+            data += [a, b, c, a, c, d]
+    return GL_TRIANGLES, data
+
+# Public primitives :
+
+
+def unit_box():
+    return get_mesh(('box',), _build_box)
+
+
+def unit_disc(slices=24):
+    return get_mesh(('disc', slices), lambda: _build_disc(slices))
+
+
+def sphere(radius=1.0, slices=16, stacks=12):
+    """Baked replacement for gluSphere(q, radius, slices, stacks)"""
+    return get_mesh(('sphere', radius, slices, stacks),
+                    lambda: _build_sphere(radius, slices, stacks))
+
+
+def cylinder(base=1.0, top=1.0, height=1.0, slices=16, stacks=1):
+    """Baked replacement for gluCylinder(q, base, top, height, slices, stacks)"""
+    return get_mesh(('cylinder', base, top, height, slices, stacks),
+                    lambda: _build_cylinder(base, top, height, slices, stacks))
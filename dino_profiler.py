@@ -0,0 +1,228 @@
+# ----------------- Dino Runner frame profiler -----------------
+# Per-phase wall time and GL call counts for every frame.
+#
+# The game marks where each phase of a frame starts:
+#
+#     profiler.phase("trees")
+#     ...
+#     profiler.phase("clouds")
+#     ...
+#     profiler.end_frame()
+#
+# Each mark closes the previous phase, adding its perf_counter time and the
+# number of GL/GLU/GLUT calls made during it to the current frame.  Calls
+# are counted by count_gl_calls(), which swaps the gl* names in the given
+# module namespaces for thin counting proxies (and restore_gl_calls() puts
+# them back), so an un-profiled game pays nothing.  Calls that bypass the
+# proxies, such as a replayed OpenGL.commandbuffer, are added with
+# count_calls().
+#
+# Finished frames go into a ring buffer for the on-screen graph and,
+# optionally, stream to a CSV file or a JSON-lines file.
+
+import csv
+import json
+import time
+
+import numpy
+from OpenGL.GL import *
+
+PHASES = ("update", "clear", "camera", "lighting", "ground", "trees",
+          "clouds", "obstacles", "eggs", "dino", "hud")
+
+# Graph colours, one per phase :
+
+PHASE_COLORS = (
+    (0.90, 0.30, 0.30), (0.55, 0.55, 0.55), (0.35, 0.35, 0.80), (0.95, 0.85, 0.30),
+    (0.55, 0.35, 0.20), (0.25, 0.65, 0.30), (0.85, 0.85, 0.95), (0.00, 0.60, 0.60),
+    (1.00, 0.60, 0.85), (0.00, 0.40, 0.30), (0.10, 0.10, 0.10),
+)
+
+# GL call counting :
+
+_calls = [0]
+_patched = []
+
+
+class _Counted(object):
+    """Callable proxy that bumps the shared call counter"""
+    __slots__ = ("function",)
+
+    def __init__(self, function):
+        self.function = function
+
+    @property
+    def __wrapped__(self):
+        return self.function
+
+    def __call__(self, *args, **named):
+        _calls[0] += 1
+        return self.function(*args, **named)
+
+    def __bool__(self):
+        return bool(self.function)
+
+    def __getattr__(self, key):
+        return getattr(self.function, key)
+
+
+def count_gl_calls(*namespaces):
+    """Start counting calls to the gl*/glu*/glut* functions in namespaces
+
+    namespaces -- module globals() dicts (or modules) whose GL names
+        should be counted; typically the ones that did `from OpenGL.GL
+        import *`
+    """
+    for namespace in namespaces:
+        namespace = getattr(namespace, "__dict__", namespace)
+        for name, value in list(namespace.items()):
+            if name.startswith("gl") and callable(value) and not isinstance(value, _Counted):
+                namespace[name] = _Counted(value)
+                _patched.append((namespace, name, value))
+
+
+def count_calls(count):
+    """Add count GL calls made without the proxies (e.g. a command buffer replay)"""
+    _calls[0] += count
+
+
+def restore_gl_calls():
+    """Undo count_gl_calls"""
+    while _patched:
+        namespace, name, value = _patched.pop()
+        namespace[name] = value
+
+
+class FrameProfiler(object):
+    """Phase timer with history, GL call counts and optional file stream"""
+
+    def __init__(self, phases=PHASES, history=240):
+        self.phases = tuple(phases)
+        self.index = {name: i for i, name in enumerate(self.phases)}
+        self.times = numpy.zeros((history, len(self.phases)))   # seconds
+        self.calls = numpy.zeros((history, len(self.phases)), int)
+        self.frames = 0
+        self.enabled = False
+        self.row_times = [0.0] * len(self.phases)
+        self.row_calls = [0] * len(self.phases)
+        self.current = None
+        self.t0 = 0.0
+        self.c0 = 0
+        self.log = None
+        self.writer = None
+
+    # Recording :
+
+    def phase(self, name):
+        """Close the running phase (if any) and start timing name"""
+        if not self.enabled:
+            return
+        t, c = time.perf_counter(), _calls[0]
+        if self.current is not None:
+            self.row_times[self.current] += t - self.t0
+            self.row_calls[self.current] += c - self.c0
+        self.current = self.index[name]
+        self.t0, self.c0 = t, c
+
+    def stop(self):
+        """Close the running phase without starting another"""
+        if not self.enabled or self.current is None:
+            return
+        self.row_times[self.current] += time.perf_counter() - self.t0
+        self.row_calls[self.current] += _calls[0] - self.c0
+        self.current = None
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.stop()
+        slot = self.frames % len(self.times)
+        self.times[slot] = self.row_times
+        self.calls[slot] = self.row_calls
+        if self.log is not None:
+            self._write(self.frames, self.row_times, self.row_calls)
+        self.frames += 1
+        self.row_times = [0.0] * len(self.phases)
+        self.row_calls = [0] * len(self.phases)
+
+    # Streaming :
+
+    def open_log(self, path):
+        """Stream every frame to path: .json/.jsonl as JSON lines, else CSV"""
+        self.close_log()
+        self.log = open(path, "w", newline="")
+        if path.endswith((".json", ".jsonl")):
+            self.writer = None
+        else:
+            self.writer = csv.writer(self.log)
+            self.writer.writerow(["frame"] + [p + "_ms" for p in self.phases] +
+                                 [p + "_calls" for p in self.phases])
+
+    def close_log(self):
+        if self.log is not None:
+            self.log.close()
+        self.log = self.writer = None
+
+    def _write(self, frame, times, calls):
+        ms = [round(t * 1000.0, 4) for t in times]
+        if self.writer is not None:
+            self.writer.writerow([frame] + ms + list(calls))
+        else:
+            self.log.write(json.dumps({
+                "frame": frame,
+                "ms": dict(zip(self.phases, ms)),
+                "calls": dict(zip(self.phases, calls)),
+            }) + "\n")
+
+    # Reporting :
+
+    def recent(self):
+        """(times, calls) of the frames in the ring buffer, oldest first"""
+        n = min(self.frames, len(self.times))
+        order = (numpy.arange(n) + self.frames - n) % len(self.times)
+        return self.times[order], self.calls[order]
+
+    def summary(self):
+        """[(phase, mean ms, mean calls)] over the ring buffer"""
+        times, calls = self.recent()
+        if not len(times):
+            return [(p, 0.0, 0.0) for p in self.phases]
+        return list(zip(self.phases, times.mean(axis=0) * 1000.0, calls.mean(axis=0)))
+
+    def draw_graph(self, x, y, w, h, budget_ms=1000.0/60):
+        """Stacked per-phase bars for the recent frames, in 2D (ortho) coords
+
+        The full graph height is two frame budgets; a line marks one.
+        """
+        times, _ = self.recent()
+        if not len(times):
+            return
+        n, p = times.shape
+        bar_w = float(w) / len(self.times)
+        top = numpy.cumsum(times * 1000.0, axis=1) * (h / (2.0 * budget_ms))
+        top = numpy.minimum(top, h)
+        bottom = numpy.hstack((numpy.zeros((n, 1)), top[:, :-1]))
+        x0 = x + numpy.arange(n)[:, None] * bar_w + numpy.zeros((1, p))
+        x1 = x0 + bar_w
+
+        quads = numpy.empty((n, p, 4, 2), 'f')
+        quads[:, :, 0] = numpy.dstack((x0, y + bottom))
+        quads[:, :, 1] = numpy.dstack((x1, y + bottom))
+        quads[:, :, 2] = numpy.dstack((x1, y + top))
+        quads[:, :, 3] = numpy.dstack((x0, y + top))
+        colors = numpy.empty((n, p, 4, 3), 'f')
+        colors[:] = numpy.array(PHASE_COLORS[:p], 'f')[None, :, None, :]
+
+        glEnable(GL_BLEND); glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor4f(1, 1, 1, 0.6)
+        glRectf(x, y, x + w, y + h)
+        glDisable(GL_BLEND)
+
+        glEnableClientState(GL_VERTEX_ARRAY); glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, quads)
+        glColorPointer(3, GL_FLOAT, 0, colors)
+        glDrawArrays(GL_QUADS, 0, n * p * 4)
+        glDisableClientState(GL_COLOR_ARRAY); glDisableClientState(GL_VERTEX_ARRAY)
+
+        glColor3f(0.8, 0.1, 0.1)
+        glBegin(GL_LINES); glVertex2f(x, y + h/2); glVertex2f(x + w, y + h/2); glEnd()
@@ -0,0 +1,264 @@
+# ----------------- Dino Runner input recording and replay -----------------
+# Records a play session so it can be re-run exactly, as a benchmark or a
+# regression trace.
+#
+#     python "3D Dino Runner.py" --record session.json [--seed 7]
+#     python dino_replay.py session.json                  # headless, max speed
+#     python dino_replay.py session.json --render --profile frames.csv
+#
+# A session is a seed (the sim's RNG and the star field) plus every
+# keyboard, keyboard-up and special-key event, stamped with the number of
+# simulation steps run before it arrived.  Wall-clock time only decides how
+# many fixed steps a frame runs, never what a step does, so applying each
+# event before the same step reproduces the game bit for bit.  Every
+# CHECKPOINT steps the recorder also stores score, lives, eggs and a CRC of
+# the complete sim state; replays compare against that trace and report the
+# first step where they diverge.
+#
+# Headless replays apply keys through DinoSim.key_down/key_up and need no
+# GL at all; rendered replays feed them to the game's own GLUT handlers
+# (so camera, night and view keys replay too), draw into an offscreen
+# context and time every frame.
+
+import argparse
+import json
+import struct
+import time
+import zlib
+
+import numpy
+
+from dino_entities import FIELDS
+from dino_sim import DinoSim
+
+FORMAT = 1
+CHECKPOINT = 60  # steps between trace entries
+
+
+def state_crc(sim):
+    """CRC32 of everything a step can change"""
+    dino = sim.dino
+    crc = zlib.crc32(struct.pack(
+        "<10d4?4q", dino["x"], dino["y"], dino["z"], dino["vy"], sim.invuln_t,
+        sim.time_score_acc, sim.game_time, sim.spawn_t, sim.coin_t, sim.cloud_t,
+        dino["jumping"], dino["crouch"], sim.running, sim.game_over,
+        sim.lives, sim.score, sim.eggs_collected, sim.ticks,
+    ))
+    for store in (sim.obstacles, sim.coins, sim.clouds):
+        live = store.live()
+        crc = zlib.crc32(live.tobytes(), crc)
+        for name in FIELDS:
+            crc = zlib.crc32(getattr(store, name)[live].tobytes(), crc)
+    return crc
+
+
+def checkpoint(steps, sim):
+    return [steps, sim.score, sim.lives, sim.eggs_collected, state_crc(sim)]
+
+
+class Recorder(object):
+    """Collects the input events and trace of a live session"""
+
+    def __init__(self, seed, every=CHECKPOINT):
+        self.seed = seed
+        self.every = every
+        self.steps = 0
+        self.events = []
+        self.trace = []
+
+    def record(self, kind, key):
+        self.events.append([self.steps, kind, key])
+
+    def wrap(self, kind, handler):
+        """GLUT key callback that records the event, then calls handler"""
+        def callback(key, x, y):
+            self.record(kind, key.decode("utf-8") if isinstance(key, bytes) else key)
+            return handler(key, x, y)
+        return callback
+
+    def stepped(self, sim):
+        """Call after every sim.step()"""
+        self.steps += 1
+        if self.steps % self.every == 0:
+            self.trace.append(checkpoint(self.steps, sim))
+
+    def session(self):
+        return {"format": FORMAT, "seed": self.seed, "steps": self.steps,
+                "checkpoint": self.every, "events": self.events, "trace": self.trace}
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.session(), f)
+
+
+def load(path):
+    with open(path) as f:
+        session = json.load(f)
+    if session.get("format") != FORMAT:
+        raise ValueError("%s is not a format %d Dino Runner session" % (path, FORMAT))
+    return session
+
+
+class Replay(object):
+    """Steps a sim through a session, applying its events on schedule
+
+    apply(kind, key) delivers one event; the default drives the sim's key
+    bindings only.  After each step the state is checked against the
+    session's trace; `diverged` is the first step where it differs.
+    """
+
+    def __init__(self, session, sim=None, apply=None):
+        self.session = session
+        self.sim = sim if sim is not None else DinoSim()
+        self.sim.reset(session["seed"])
+        self.apply = apply or self.apply_to_sim
+        self.events = session["events"]
+        self.next_event = 0
+        self.trace = {entry[0]: entry for entry in session["trace"]}
+        self.steps = 0
+        self.checked = 0
+        self.diverged = None
+        self.quit = False
+
+    def apply_to_sim(self, kind, key):
+        if kind == "keyboard":
+            self.sim.key_down(key.lower())
+        elif kind == "keyboard_up":
+            self.sim.key_up(key.lower())
+
+    def deliver(self):
+        """Apply the events that arrived before the next step"""
+        events = self.events
+        while self.next_event < len(events) and events[self.next_event][0] <= self.steps:
+            tick, kind, key = events[self.next_event]
+            self.next_event += 1
+            if kind == "keyboard" and key.lower() == 'q' and self.sim.game_over:
+                self.quit = True   # the recorded session ended here
+                return
+            self.apply(kind, key)
+
+    def done(self):
+        return self.quit or self.steps >= self.session["steps"]
+
+    def step(self):
+        self.deliver()
+        if self.quit:
+            return
+        self.sim.step()
+        self.steps += 1
+        expected = self.trace.get(self.steps)
+        if expected is not None:
+            self.checked += 1
+            if self.diverged is None and checkpoint(self.steps, self.sim) != expected:
+                self.diverged = self.steps
+
+    def finish(self):
+        """Deliver the events after the last step (e.g. the final quit)"""
+        self.deliver()
+
+
+def replay_headless(session, repeat=1):
+    """Re-run session without rendering as fast as possible
+
+    Returns (replay, best seconds over repeat runs).
+    """
+    best = None
+    for _ in range(repeat):
+        replay = Replay(session)
+        t0 = time.perf_counter()
+        while not replay.done():
+            replay.step()
+        replay.finish()
+        seconds = time.perf_counter() - t0
+        best = seconds if best is None else min(best, seconds)
+    return replay, best
+
+
+def replay_rendered(session, width=None, height=None, platform="egl", every=1, profile=None):
+    """Re-run session in the game, rendering offscreen after every `every` steps
+
+    Returns (replay, per-frame render milliseconds as an array).
+    """
+    import dino_capture
+
+    dino_capture.select_platform(platform)
+    game = dino_capture.load_game()
+    width, height = width or game.WIN_W, height or game.WIN_H
+    game.set_window_size(width, height)
+    context = dino_capture.OffscreenContext(width, height, platform)
+    from OpenGL.GL import glFinish
+
+    game.text_enabled = False   # bitmap fonts need glutInit, which needs a display
+    game.init_gl()
+    handlers = {
+        "keyboard": lambda key: game.keyboard(key.encode("utf-8"), 0, 0),
+        "keyboard_up": lambda key: game.keyboard_up(key.encode("utf-8"), 0, 0),
+        "special": lambda key: game.special_keyboard(key, 0, 0),
+    }
+    replay = Replay(session, game.sim, lambda kind, key: handlers[kind](key))
+    game.seed_world(session["seed"])
+    if profile:
+        game.profiler.open_log(profile)
+        game.profiler.enabled = True
+        game.dino_profiler.count_gl_calls(vars(game), game.dino_meshes, game.dino_instancing,
+                                          game.dino_text, game.dino_lighting, game.dino_stars)
+    game.anim_clock = lambda: replay.steps * game.sim.dt
+    game.clock.acc = 0.0   # draw each step as it is, no interpolation
+    times = []
+    try:
+        while not replay.done():
+            game.profiler.phase("update")
+            for _ in range(every):
+                replay.step()
+                if replay.done():
+                    break
+            game.profiler.stop()
+            t0 = time.perf_counter()
+            game.render()
+            glFinish()
+            times.append((time.perf_counter() - t0) * 1000.0)
+        replay.finish()
+    finally:
+        if profile:
+            game.profiler.close_log()
+        game.release_gl()
+        context.destroy()
+    return replay, numpy.array(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Dino Runner session")
+    parser.add_argument("session", help="session file written by the game's --record")
+    parser.add_argument("--render", action="store_true", help="draw every frame offscreen and time it")
+    parser.add_argument("--platform", choices=("egl", "osmesa"), default="egl")
+    parser.add_argument("--size", default=None, help="WxH (default: the game window size)")
+    parser.add_argument("--every", type=int, default=1, help="steps per rendered frame")
+    parser.add_argument("--profile", metavar="PATH", help="per-phase frame timings (.csv or .json)")
+    parser.add_argument("--repeat", type=int, default=3, help="headless runs; the best is reported")
+    args = parser.parse_args()
+
+    session = load(args.session)
+    if args.render:
+        width = height = None
+        if args.size:
+            width, height = (int(v) for v in args.size.lower().split("x"))
+        replay, times = replay_rendered(session, width, height, args.platform, args.every, args.profile)
+        if len(times):
+            print("%d frames, %.2f ms mean, %.2f ms median, %.2f ms 95th percentile, %.2f ms max (%.1f fps)"
+                  % (len(times), times.mean(), numpy.median(times), numpy.percentile(times, 95),
+                     times.max(), 1000.0 / times.mean()))
+    else:
+        replay, seconds = replay_headless(session, args.repeat)
+        print("%d steps in %.3fs (%.0f steps/s)" % (replay.steps, seconds, replay.steps / max(seconds, 1e-9)))
+
+    sim = replay.sim
+    print("score %d, lives %d, eggs %d after %d steps"
+          % (sim.score, sim.lives, sim.eggs_collected, replay.steps))
+    if replay.diverged is not None:
+        print("DIVERGED from the recording at step %d" % replay.diverged)
+        raise SystemExit(1)
+    print("matches the recording (%d checkpoints)" % replay.checked)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+# ----------------- Dino Runner simulation core -----------------
+# Game logic for the Dino Runner with no window and no GL context.
+#
+# DinoSim owns everything the game used to keep in module globals (dino,
+# entity stores, spawn timers, score, lives) and advances it one fixed step
+# at a time with step(action, dt).  The GLUT front-end in
+# "3D Dino Runner.py" is just one consumer: it feeds key presses in and
+# draws the state out.  Headless users drive step() directly, e.g.
+#
+#     sim = DinoSim(seed=7)
+#     while not sim.game_over:
+#         sim.step(JUMP if bot(sim) else NOOP)
+#
+# All randomness comes from the sim's own random.Random, so a seed plus the
+# action sequence reproduces a run exactly.
+
+import random
+import numpy
+
+from dino_entities import EntityStore, CACTUS, PTERO, EGG, CLOUD
+import dino_collision
+
+# Actions :
+
+NOOP, JUMP, CROUCH = range(3)
+
+# Dino :
+
+GRAVITY = -22.0
+JUMP_V = 11.5
+GROUND_Y = 0.0
+CROUCH_SCALE = 0.65
+
+# World :
+
+SIM_DT = 1.0/60
+WORLD_SPEED = 10.0
+SPAWN_X = 28.0
+SPAWN_INT_BASE, SPAWN_INT_JIT = 1.2, 0.5
+COIN_INT_BASE, COIN_INT_JIT = 1.3, 0.9
+CLOUD_INT_BASE, CLOUD_INT_JIT = 1.0, 0.8
+
+CACTUS_DIMS = (0.9, 1.6, 0.7)
+PTERO_DIMS = (1.0, 0.7, 0.9)
+EGG_BOX = 0.6  # egg pickup box edge
+START_LIVES = 3
+
+# Observation layout (see DinoSim.observe) :
+
+OBS_AHEAD = 3      # nearest obstacles reported
+OBS_FAR = 100.0    # dx reported for an empty obstacle/egg slot
+OBS_SIZE = 7 + 5*OBS_AHEAD + 2
+
+
+class DinoSim(object):
+    """Complete Dino Runner game state, advanced by fixed steps"""
+
+    def __init__(self, seed=None, dt=SIM_DT):
+        self.dt = dt
+        self.obstacles, self.coins, self.clouds = EntityStore(), EntityStore(), EntityStore()
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a fresh game; seed=None draws a seed from the OS"""
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.dino = {"x":0.0,"y":0.0,"z":0.0,"w":1.6,"h":2.2,"d":0.9,"vy":0.0,"jumping":False,"crouch":False}
+        self.dino_prev_y = 0.0  # y at the previous step, for interpolation
+        self.distance = self.prev_distance = 0.0  # how far the ground has scrolled
+        self.running = True
+        self.game_over = False
+        self.invuln_t = 0.0
+        self.lives = START_LIVES
+        self.score = 0
+        self.eggs_collected = 0
+        self.time_score_acc = 0.0
+        self.game_time = 0.0
+        self.ticks = 0
+        self.spawn_t = self.coin_t = self.cloud_t = 0.0
+        self.obstacles.clear(); self.coins.clear(); self.clouds.clear()
+
+    # Input :
+
+    def jump(self):
+        if not self.dino["jumping"]:
+            self.dino["vy"] = JUMP_V; self.dino["jumping"] = True
+
+    def set_crouch(self, crouch):
+        self.dino["crouch"] = crouch
+
+    def toggle_pause(self):
+        self.running = not self.running
+
+    def restart(self):
+        """In-game restart (R key): new lives and score, same clock and timers"""
+        self.lives = START_LIVES; self.score = 0; self.eggs_collected = 0
+        self.obstacles.clear(); self.coins.clear(); self.clouds.clear()
+        self.dino["y"] = 0; self.dino["z"] = 0.0; self.dino["jumping"] = False
+        self.game_over = False; self.running = True
+
+    def key_down(self, key):
+        """Game key press: w jumps, s crouches, p pauses, r restarts
+
+        The GLUT front-end's bindings, here so replays can apply recorded
+        keys without a window.
+        """
+        if key == 'w':
+            self.jump()
+        elif key == 's':
+            self.set_crouch(True)
+        elif key == 'p':
+            self.toggle_pause()
+        elif key == 'r':
+            self.restart()
+
+    def key_up(self, key):
+        if key == 's':
+            self.set_crouch(False)
+
+    def apply(self, action):
+        """Apply one action: JUMP starts a jump, CROUCH holds crouch for the step"""
+        if action == JUMP:
+            self.jump()
+        self.set_crouch(action == CROUCH)
+
+    # Queries :
+
+    def dino_height(self):
+        return self.dino["h"]*(CROUCH_SCALE if self.dino["crouch"] and not self.dino["jumping"] else 1.0)
+
+    def speed_mul(self):
+        # Global speed multiplier increases over time (caps out)
+        return 1.0 + min(self.game_time * 0.008, 0.2)
+
+    def observe(self, out=None):
+        """Fixed-size float32 observation vector for bots
+
+        dino y, vy, jumping, crouch, invuln_t, speed multiplier, lives, then
+        (dx, y, w, h, kind) for the OBS_AHEAD nearest obstacles ahead of the
+        dino and (dx, y) of the nearest egg; empty slots have dx=OBS_FAR.
+        out -- optional float32 array of OBS_SIZE to fill in place
+        """
+        if out is None:
+            out = numpy.zeros(OBS_SIZE, 'f')
+        dino = self.dino
+        x0 = dino["x"] - dino["w"]/2
+        out[:7] = (dino["y"], dino["vy"], dino["jumping"], dino["crouch"],
+                   self.invuln_t, self.speed_mul(), self.lives)
+
+        store = self.obstacles
+        live = store.live()
+        live = live[store.x[live] + store.w[live]/2 > x0]
+        live = live[numpy.argsort(store.x[live], kind='stable')][:OBS_AHEAD]
+        near = out[7:7+5*OBS_AHEAD].reshape((OBS_AHEAD, 5))
+        near[:] = 0.0
+        near[:, 0] = OBS_FAR
+        n = len(live)
+        near[:n, 0] = store.x[live] - dino["x"]
+        near[:n, 1] = store.y[live]
+        near[:n, 2] = store.w[live]
+        near[:n, 3] = store.h[live]
+        near[:n, 4] = store.kind[live]
+
+        store = self.coins
+        live = store.live()
+        live = live[store.x[live] + store.w[live]/2 > x0]
+        out[-2:] = (OBS_FAR, 0.0)
+        if len(live):
+            i = live[numpy.argmin(store.x[live])]
+            out[-2:] = (store.x[i] - dino["x"], store.y[i])
+        return out
+
+    def dino_box(self):
+        dh = self.dino_height()
+        return (self.dino["x"], self.dino["y"]+dh/2, self.dino["z"], self.dino["w"], dh, self.dino["d"])
+
+    # Spawning :
+
+    def spawn_coin(self):
+        y = 0.9 if self.rng.random()<0.6 else 0.6
+        self.coins.spawn(EGG, SPAWN_X, y, 0.0, EGG_BOX, EGG_BOX, EGG_BOX, WORLD_SPEED*1.05)
+
+    def spawn_obstacle(self):
+        kind = self.rng.choice([CACTUS,PTERO])
+
+        if kind==CACTUS:
+            (w,h,d)=CACTUS_DIMS; y=GROUND_Y
+
+        else:
+            (w,h,d)=PTERO_DIMS; y=1.7  # air for crouch
+
+        self.obstacles.spawn(kind, SPAWN_X, y, 0.0, w, h, d, WORLD_SPEED)
+
+    def spawn_cloud(self):
+        z = self.rng.choice([-2,2]) * self.rng.uniform(12.0, 16.0)
+        y = self.rng.uniform(3.8,6.5)
+        s = self.rng.uniform(0.8,1.4)  # cloud scale lives in w/h
+        self.clouds.spawn(CLOUD, SPAWN_X, y, z, s, s, 1.0, WORLD_SPEED*0.45)
+
+    # Update :
+
+    def step(self, action=None, dt=None):
+        """Advance one step; returns the score gained during it
+
+        action -- NOOP / JUMP / CROUCH, or None to keep the current input
+            state (the GLUT front-end sets it from key events instead)
+        dt -- step length, defaults to the sim's fixed dt
+        """
+        if action is not None:
+            self.apply(action)
+        before = self.score
+        self.update(self.dt if dt is None else dt)
+        return self.score - before
+
+    def run(self, steps, inputs=None):
+        """Run up to steps steps (stopping at game over) from an input source
+
+        inputs -- None (no input), a callable policy(sim) -> action, or an
+            iterable of actions (scripted input; NOOP once it runs out)
+        """
+        if inputs is None or callable(inputs):
+            policy = inputs
+        else:
+            script = iter(inputs)
+            policy = lambda sim: next(script, NOOP)
+        for _ in range(steps):
+            if self.game_over:
+                break
+            self.step(policy(self) if policy else None)
+        return self
+
+    def update(self, dt):
+        dino = self.dino
+        rng = self.rng
+
+        # Snapshot before the pause check so a paused frame interpolates to
+        # the same place it started :
+
+        self.dino_prev_y = dino["y"]
+        self.prev_distance = self.distance
+        self.obstacles.remember(); self.coins.remember(); self.clouds.remember()
+
+        if not self.running or self.game_over:
+            return
+
+        self.ticks += 1
+        self.game_time += dt
+        self.time_score_acc += dt
+
+        if self.time_score_acc >= 1.0:
+            add = int(self.time_score_acc); self.score += add; self.time_score_acc -= add
+
+        if self.invuln_t > 0:
+            self.invuln_t = max(0, self.invuln_t - dt)
+
+        if dino["jumping"]:
+
+            dino["vy"] += GRAVITY*dt
+            dino["y"] += dino["vy"]*dt
+
+            if dino["y"] <= GROUND_Y:
+                dino["y"]=GROUND_Y; dino["jumping"]=False; dino["vy"]=0
+
+        speed_mul = self.speed_mul()
+        self.distance += WORLD_SPEED*speed_mul*dt
+
+        # Movement and despawn run over whole columns :
+
+        self.obstacles.advance(dt, speed_mul); self.coins.advance(dt, speed_mul); self.clouds.advance(dt, speed_mul)
+        box = self.dino_box()
+
+        if self.invuln_t<=0 and len(dino_collision.store_hits(box, self.obstacles, lift=0.5)):
+            self.lives -= 1; self.invuln_t = 1.2
+
+        got = dino_collision.store_hits(box, self.coins, lift=0.0)
+        self.eggs_collected += len(got)
+        self.score += 10*len(got)
+        self.coins.despawn(got)
+
+        self.obstacles.despawn(self.obstacles.behind(-40))
+        self.coins.despawn(self.coins.behind(-40))
+        self.clouds.despawn(self.clouds.behind(-80))
+
+        speed_factor = (0.985)**(self.score//5)
+        self.spawn_t -= dt; self.coin_t -= dt; self.cloud_t -= dt
+
+        if self.spawn_t<=0:
+            self.spawn_t = max(0.3, rng.uniform(SPAWN_INT_BASE, SPAWN_INT_BASE+SPAWN_INT_JIT)*speed_factor); self.spawn_obstacle()
+
+        if self.coin_t<=0:
+            self.coin_t = max(0.2, rng.uniform(0.8, 1.4)*speed_factor); self.spawn_coin()
+
+        if self.cloud_t<=0:
+            self.cloud_t = max(0.25, rng.uniform(CLOUD_INT_BASE, CLOUD_INT_BASE+CLOUD_INT_JIT)); self.spawn_cloud()
+
+        if self.lives <= 0:
+            self.game_over = True; self.running = False
@@ -0,0 +1,119 @@
+# ----------------- Dino Runner star field -----------------
+# The night sky's stars (or any other fixed set of 2D points) as one
+# vertex buffer.
+#
+# Immediate mode paid one glVertex2f wrapper call per star per frame.  Here
+# the positions are uploaded once, next to a per-point twinkle phase, and
+# every frame is a single glDrawArrays(GL_POINTS).  The buffer is only
+# rebuilt when the caller hands in a different point list (a new seed
+# re-scatters the stars).  Twinkling is optional and done by a small
+# shader that dims each point over time from its phase, so the vertices are
+# never re-submitted.
+
+from OpenGL.GL import *
+from OpenGL.GL import shaders
+from OpenGL.arrays import vbo
+import math
+import numpy
+
+STRIDE = 3 * 4  # x,y, phase  (float32)
+GOLDEN_ANGLE = math.pi * (3.0 - math.sqrt(5.0))  # spreads the phases evenly
+
+VERTEX_SHADER = """#version 120
+uniform float u_time;
+varying vec4 v_color;
+
+void main() {
+    gl_Position = gl_ModelViewProjectionMatrix * gl_Vertex;
+    float phase = gl_MultiTexCoord0.x;
+    float k = 0.7 + 0.3 * sin(u_time * (1.5 + 0.25 * mod(phase, 4.0)) + phase);
+    v_color = vec4(gl_Color.rgb * k, gl_Color.a);
+}
+"""
+
+FRAGMENT_SHADER = """#version 120
+varying vec4 v_color;
+
+void main() {
+    gl_FragColor = v_color;
+}
+"""
+
+
+def available():
+    """True if the current context can compile the twinkle shader"""
+    return bool(glCreateShader)
+
+
+class StarField(object):
+    """Fixed 2D points in a VBO, drawn with one glDrawArrays(GL_POINTS)"""
+
+    def __init__(self, size=2.0, color=(0.9, 0.9, 1.0)):
+        self.size = size
+        self.color = color
+        self.points = None
+        self.count = 0
+        self.vbo = None
+        self.program = None
+        self.time_location = None
+
+    def set_points(self, points):
+        """Upload points ((x, y) pairs) unless they are the ones already held"""
+        if points is self.points:
+            return
+        self.points = points
+        data = numpy.zeros((len(points), 3), 'f')
+        if len(points):
+            data[:, :2] = points
+            data[:, 2] = numpy.arange(len(points)) * GOLDEN_ANGLE
+        self.count = len(data)
+        if self.vbo is None:
+            self.vbo = vbo.VBO(data, usage='GL_STATIC_DRAW')
+        else:
+            self.vbo.set_array(data)
+
+    def _twinkle_program(self):
+        if self.program is None:
+            self.program = shaders.compileProgram(
+                shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+                shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+                validate=False,
+            )
+            self.time_location = glGetUniformLocation(self.program, 'u_time')
+        return self.program
+
+    def draw(self, points, time=None):
+        """Draw points in the current (2D) projection
+
+        time -- seconds of the animation clock to twinkle with, or None
+            for steady points
+        """
+        self.set_points(points)
+        if not self.count:
+            return
+        glPointSize(self.size)
+        glColor3f(*self.color)
+        twinkle = time is not None and available()
+        if twinkle:
+            glUseProgram(self._twinkle_program())
+            glUniform1f(self.time_location, time % 3600.0)
+        self.vbo.bind()
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, STRIDE, self.vbo)
+        if twinkle:
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glTexCoordPointer(1, GL_FLOAT, STRIDE, self.vbo + 8)
+        glDrawArrays(GL_POINTS, 0, self.count)
+        if twinkle:
+            glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+            glUseProgram(0)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        self.vbo.unbind()
+
+    def delete(self):
+        if self.vbo is not None:
+            self.vbo.delete()
+        if self.program is not None:
+            glDeleteProgram(self.program)
+        # upload again on the next draw (e.g. in another context) :
+        self.points, self.count, self.vbo, self.program = None, 0, None, None
@@ -0,0 +1,191 @@
+# ----------------- Dino Runner HUD text -----------------
+# Texture-atlas text for the GLUT bitmap fonts.
+#
+# glutBitmapCharacter is one wrapper call (and one glBitmap) per character,
+# every frame.  Instead, each font is rasterized once: every printable
+# character is drawn with glutBitmapCharacter into its own cell of an RGBA
+# texture through a framebuffer object, so the atlas holds exactly the
+# pixels GLUT would have produced.  A string then becomes one quad per
+# character, drawn with a single glDrawArrays from client arrays, and the
+# quads of strings that did not change since the last frame are reused.
+#
+# Glyphs are white on transparent black; GL_MODULATE tints them with the
+# current colour and the alpha test drops the background, so the result is
+# pixel-identical to the bitmap path when strings start on whole pixels.
+
+from OpenGL.GL import *
+from OpenGL.GL.VERSION import GL_3_0
+from OpenGL.GL.EXT import framebuffer_object
+from OpenGL.GLUT import glutBitmapCharacter, glutBitmapWidth
+from OpenGL.extensions import alternate
+import math
+import numpy
+
+glGenFramebuffers = alternate(
+    GL_3_0.glGenFramebuffers, framebuffer_object.glGenFramebuffersEXT,
+)
+glBindFramebuffer = alternate(
+    GL_3_0.glBindFramebuffer, framebuffer_object.glBindFramebufferEXT,
+)
+glFramebufferTexture2D = alternate(
+    GL_3_0.glFramebufferTexture2D, framebuffer_object.glFramebufferTexture2DEXT,
+)
+glCheckFramebufferStatus = alternate(
+    GL_3_0.glCheckFramebufferStatus, framebuffer_object.glCheckFramebufferStatusEXT,
+)
+glDeleteFramebuffers = alternate(
+    GL_3_0.glDeleteFramebuffers, framebuffer_object.glDeleteFramebuffersEXT,
+)
+
+FIRST_CHAR, LAST_CHAR = 32, 126
+CELL_H = 32      # cell height, enough for the 18px font's ascent and descent
+BASELINE = 8     # baseline height inside a cell
+PAD = 4          # spare columns either side of a glyph for its x origin
+ATLAS_W = 512
+MAX_STRINGS = 256  # cached string geometries per font
+
+_atlases = {}
+
+
+def available():
+    """True if the current context can render into a texture"""
+    return bool(glGenFramebuffers) and bool(glFramebufferTexture2D)
+
+
+class GlyphAtlas(object):
+    """One GLUT bitmap font rasterized into a texture"""
+
+    def __init__(self, font):
+        codes = numpy.arange(FIRST_CHAR, LAST_CHAR + 1)
+        self.advance = numpy.zeros(256, 'f')
+        self.advance[codes] = [glutBitmapWidth(font, int(c)) for c in codes]
+
+        # Pack the cells left to right, wrapping at ATLAS_W :
+
+        self.cell_x = numpy.zeros(256, 'f')
+        self.cell_y = numpy.zeros(256, 'f')
+        self.cell_w = numpy.zeros(256, 'f')
+        x = y = 0
+        for c in codes:
+            w = self.advance[c] + 2*PAD
+            if x + w > ATLAS_W:
+                x, y = 0, y + CELL_H
+            self.cell_x[c], self.cell_y[c], self.cell_w[c] = x, y, w
+            x += w
+        self.width = ATLAS_W
+        self.height = 2 ** int(math.ceil(math.log(y + CELL_H, 2)))
+
+        self.texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, self.width, self.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        self._rasterize(font, codes)
+        self.strings = {}
+
+    def _rasterize(self, font, codes):
+        previous = glGetIntegerv(GL_FRAMEBUFFER_BINDING)
+        fbo = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.texture, 0)
+        try:
+            if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+                raise RuntimeError("Glyph atlas framebuffer is incomplete")
+            glPushAttrib(GL_VIEWPORT_BIT | GL_COLOR_BUFFER_BIT | GL_CURRENT_BIT | GL_ENABLE_BIT)
+            glMatrixMode(GL_PROJECTION); glPushMatrix(); glLoadIdentity()
+            glOrtho(0, self.width, 0, self.height, -1, 1)
+            glMatrixMode(GL_MODELVIEW); glPushMatrix(); glLoadIdentity()
+            glViewport(0, 0, self.width, self.height)
+            glDisable(GL_DEPTH_TEST); glDisable(GL_LIGHTING); glDisable(GL_TEXTURE_2D)
+            glClearColor(0, 0, 0, 0)
+            glClear(GL_COLOR_BUFFER_BIT)
+            glColor4f(1, 1, 1, 1)
+            for c in codes:
+                glRasterPos2i(int(self.cell_x[c]) + PAD, int(self.cell_y[c]) + BASELINE)
+                glutBitmapCharacter(font, int(c))
+            glMatrixMode(GL_PROJECTION); glPopMatrix()
+            glMatrixMode(GL_MODELVIEW); glPopMatrix()
+            glPopAttrib()
+        finally:
+            glBindFramebuffer(GL_FRAMEBUFFER, int(previous))
+            glDeleteFramebuffers(1, [fbo])
+
+    def geometry(self, s):
+        """(texcoords, vertices) of s laid out from the origin, cached"""
+        arrays = self.strings.get(s)
+        if arrays is not None:
+            return arrays
+        if len(self.strings) >= MAX_STRINGS:
+            self.strings.clear()
+
+        codes = numpy.frombuffer(s.encode('latin-1', 'replace'), 'u1')
+        codes = codes[(codes >= FIRST_CHAR) & (codes <= LAST_CHAR)]
+        pen = numpy.cumsum(self.advance[codes]) - self.advance[codes]
+        x0 = pen - PAD
+        x1 = x0 + self.cell_w[codes]
+        y0, y1 = -BASELINE, CELL_H - BASELINE
+        u0 = self.cell_x[codes] / self.width
+        u1 = (self.cell_x[codes] + self.cell_w[codes]) / self.width
+        v0 = self.cell_y[codes] / self.height
+        v1 = (self.cell_y[codes] + CELL_H) / self.height
+
+        vertices = numpy.empty((len(codes), 4, 2), 'f')
+        vertices[:, 0] = numpy.column_stack((x0, numpy.full_like(x0, y0)))
+        vertices[:, 1] = numpy.column_stack((x1, numpy.full_like(x0, y0)))
+        vertices[:, 2] = numpy.column_stack((x1, numpy.full_like(x0, y1)))
+        vertices[:, 3] = numpy.column_stack((x0, numpy.full_like(x0, y1)))
+        texcoords = numpy.empty((len(codes), 4, 2), 'f')
+        texcoords[:, 0] = numpy.column_stack((u0, v0))
+        texcoords[:, 1] = numpy.column_stack((u1, v0))
+        texcoords[:, 2] = numpy.column_stack((u1, v1))
+        texcoords[:, 3] = numpy.column_stack((u0, v1))
+
+        arrays = self.strings[s] = (texcoords, vertices)
+        return arrays
+
+    def draw(self, x, y, s):
+        """Draw s with its baseline starting at (x, y) in the current 2D frame"""
+        texcoords, vertices = self.geometry(s)
+        if not len(vertices):
+            return
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_TEXTURE_BIT)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glEnable(GL_ALPHA_TEST)
+        glAlphaFunc(GL_GREATER, 0.5)
+
+        glPushMatrix()
+        glTranslatef(math.floor(x), math.floor(y), 0)
+        glEnableClientState(GL_VERTEX_ARRAY); glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glTexCoordPointer(2, GL_FLOAT, 0, texcoords)
+        glVertexPointer(2, GL_FLOAT, 0, vertices)
+        glDrawArrays(GL_QUADS, 0, vertices.shape[0] * 4)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY); glDisableClientState(GL_VERTEX_ARRAY)
+        glPopMatrix()
+        glPopAttrib()
+
+    def delete(self):
+        glDeleteTextures([self.texture])
+
+
+def get_atlas(font):
+    """Return the atlas for a GLUT bitmap font, rasterizing it on first use"""
+    key = getattr(font, "value", font)  # GLX fonts are unhashable c_void_ps
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font)
+    return atlas
+
+
+def draw_text(x, y, s, font):
+    """Draw s at (x, y) in the current colour, like glRasterPos + glutBitmapCharacter"""
+    get_atlas(font).draw(x, y, s)
+
+
+def clear():
+    """Delete all atlases (e.g. before the GL context goes away)"""
+    for atlas in _atlases.values():
+        atlas.delete()
+    _atlases.clear()
@@ -0,0 +1,51 @@
+# ----------------- Dino Runner fixed-step clock -----------------
+# Fixed-timestep scheduling for the simulation.
+#
+# The render loop asks the clock how many whole simulation steps are due
+# since the last frame; leftover time stays in the accumulator and is
+# exposed as `alpha`, the fraction of a step to interpolate rendered state
+# by.  After a hitch at most `max_steps` are run and the rest of the
+# backlog is dropped, so the game slows down briefly instead of
+# spiralling or letting obstacles tunnel through the dino.
+
+import time
+
+
+class FixedStep(object):
+    """Accumulator-based fixed-timestep clock"""
+
+    def __init__(self, step=1.0/60, max_steps=5, clock=time.perf_counter):
+        self.step = step
+        self.max_steps = max_steps
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.last = self.clock()
+        self.acc = 0.0
+        self.ticks = 0     # simulation steps run so far
+        self.dropped = 0   # steps skipped by the catch-up limit
+
+    def advance(self):
+        """Number of simulation steps to run for the time since the last call"""
+        now = self.clock()
+        self.acc += now - self.last
+        self.last = now
+        steps = int(self.acc / self.step)
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+            self.acc = self.acc % self.step
+        else:
+            self.acc -= steps * self.step
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step elapsed since the last simulation step"""
+        return min(self.acc / self.step, 1.0)
+
+
+def lerp(a, b, t):
+    return a + (b - a) * t
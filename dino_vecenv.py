@@ -0,0 +1,237 @@
+# ----------------- Dino Runner vectorized environments -----------------
+# Runs N independent DinoSim games across a pool of worker processes.
+#
+# Observations, actions, rewards and done flags live in shared-memory NumPy
+# arrays (multiprocessing.shared_memory).  Each worker owns a contiguous
+# slice of the environments and steps them in place; the pipes to the
+# workers only carry one-word commands, never game state.
+#
+#     with VectorEnv(256, seed=0) as env:
+#         obs = env.reset()
+#         for _ in range(10000):
+#             obs, rewards, dones = env.step(policy(obs))
+#
+# Finished games reset automatically (with a new deterministic seed); the
+# returned observation is then the first one of the new game and `dones`
+# flags the boundary.
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy
+
+from dino_sim import DinoSim, OBS_SIZE
+
+# (name, per-env shape, dtype) of every shared buffer :
+
+BUFFERS = (
+    ("obs", (OBS_SIZE,), 'f4'),
+    ("actions", (), 'i1'),
+    ("rewards", (), 'f4'),
+    ("dones", (), 'bool'),
+)
+
+
+def _views(blocks, num_envs):
+    return {
+        name: numpy.ndarray((num_envs,) + shape, dtype, buffer=blocks[name].buf)
+        for name, shape, dtype in BUFFERS
+    }
+
+
+def _attach(name):
+
+    # Workers only borrow the parent's blocks, the parent unlinks them.
+    # Before Python 3.13 attaching always registers with the resource
+    # tracker, but workers share the parent's tracker and its registry is a
+    # set, so that is a no-op rather than a second owner :
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class _Slice(object):
+    """The environments one worker (or the serial fallback) steps"""
+
+    def __init__(self, arrays, start, seeds, num_envs, frame_skip):
+        self.arrays = arrays
+        self.start = start
+        self.num_envs = num_envs
+        self.frame_skip = frame_skip
+        self.seeds = list(seeds)
+        self.sims = [DinoSim(seed) for seed in seeds]
+
+    def reset(self):
+        obs = self.arrays["obs"]
+        for i, (sim, seed) in enumerate(zip(self.sims, self.seeds), self.start):
+            sim.reset(seed)
+            sim.observe(obs[i])
+        self.arrays["dones"][self.start:self.start+len(self.sims)] = False
+
+    def step(self):
+        obs, actions = self.arrays["obs"], self.arrays["actions"]
+        rewards, dones = self.arrays["rewards"], self.arrays["dones"]
+        for i, sim in enumerate(self.sims, self.start):
+            action = int(actions[i])
+            reward = 0
+            for _ in range(self.frame_skip):
+                reward += sim.step(action)
+                if sim.game_over:
+                    break
+            rewards[i] = reward
+            dones[i] = sim.game_over
+            if sim.game_over:
+                sim.reset(None if sim.seed is None else sim.seed + self.num_envs)
+            sim.observe(obs[i])
+
+
+def _worker(conn, names, num_envs, start, seeds, frame_skip):
+    blocks = {name: _attach(names[name]) for name in names}
+    envs = None
+    try:
+        envs = _Slice(_views(blocks, num_envs), start, seeds, num_envs, frame_skip)
+        while True:
+            command = conn.recv()
+            if command == "step":
+                envs.step()
+            elif command == "reset":
+                envs.reset()
+            elif command == "close":
+                break
+            conn.send(command)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        envs = None  # drop the array views before closing their buffers
+        for block in blocks.values():
+            block.close()
+        conn.close()
+
+
+class VectorEnv(object):
+    """N DinoSim games stepped in parallel by a process pool
+
+    num_envs -- number of independent games
+    seed -- base seed; game i starts from seed+i (None for OS entropy)
+    workers -- worker processes (default os.cpu_count()); 0 steps every
+        game in this process, useful for debugging and tiny batches
+    frame_skip -- sim steps per step() call, repeating the same action
+    """
+
+    def __init__(self, num_envs, seed=None, workers=None, frame_skip=1, context=None):
+        self.num_envs = num_envs
+        self.frame_skip = frame_skip
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, num_envs)
+        seeds = [None if seed is None else seed + i for i in range(num_envs)]
+
+        self.blocks = {}
+        for name, shape, dtype in BUFFERS:
+            size = max(1, num_envs * int(numpy.prod(shape, dtype=int)) * numpy.dtype(dtype).itemsize)
+            self.blocks[name] = shared_memory.SharedMemory(create=True, size=size)
+        arrays = _views(self.blocks, num_envs)
+        self.obs, self.actions = arrays["obs"], arrays["actions"]
+        self.rewards, self.dones = arrays["rewards"], arrays["dones"]
+        self.actions[:] = 0
+
+        self.local = None
+        self.pipes, self.procs = [], []
+        if not workers:
+            self.local = _Slice(arrays, 0, seeds, num_envs, frame_skip)
+            return
+
+        ctx = context or multiprocessing.get_context()
+        names = {name: block.name for name, block in self.blocks.items()}
+        bounds = numpy.linspace(0, num_envs, workers + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(
+                target=_worker,
+                args=(child, names, num_envs, int(start), seeds[start:stop], frame_skip),
+                daemon=True,
+            )
+            proc.start()
+            child.close()
+            self.pipes.append(parent)
+            self.procs.append(proc)
+
+    def _broadcast(self, command):
+        if self.local is not None:
+            getattr(self.local, command)()
+            return
+        for pipe in self.pipes:
+            pipe.send(command)
+        for pipe in self.pipes:
+            pipe.recv()
+
+    def reset(self):
+        """Restart every game from its initial seed
+
+        Returns the first observations, a view that later calls overwrite.
+        """
+        self._broadcast("reset")
+        return self.obs
+
+    def step(self, actions):
+        """Step every game once with actions; returns (obs, rewards, dones)
+
+        The returned arrays are views into shared memory and are
+        overwritten by the next step(); copy them to keep them.
+        """
+        self.actions[:] = actions
+        self._broadcast("step")
+        return self.obs, self.rewards, self.dones
+
+    def close(self):
+        if self.blocks is None:
+            return
+        for pipe in self.pipes:
+            try:
+                pipe.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self.procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for pipe in self.pipes:
+            pipe.close()
+        self.pipes, self.procs, self.local = [], [], None
+        self.obs = self.actions = self.rewards = self.dones = None
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def check_reset(num_envs=8, steps=300, workers=0):
+    """reset() after steps random steps gives the first reset()'s observations"""
+    rng = numpy.random.default_rng(0)
+    with VectorEnv(num_envs, seed=0, workers=workers) as env:
+        first = env.reset().copy()
+        for _ in range(steps):
+            env.step(rng.integers(0, 3, num_envs))
+        assert numpy.array_equal(env.reset(), first), "reset() did not restart the games"
+
+
+if __name__ == "__main__":
+    check_reset(workers=0)
+    check_reset(workers=2)
+    print("reset() restarts every game")
@@ -0,0 +1,167 @@
+# ----------------- Dino Runner world streaming -----------------
+# Scenery generated chunk by chunk ahead of the player, off the render thread.
+#
+# The world is cut along x into chunks of `size` world units.  A chunk's
+# contents are a pure function of (seed, chunk index): each one gets its own
+# random.Random, so whether it was made by the worker thread or, in a pinch,
+# on the render thread, and in whatever order, the world comes out the same.
+#
+# Every frame the render thread calls update() with the distance travelled.
+# That asks for the chunks from `behind` units behind the camera to `ahead`
+# units in front of it, plus `prefetch` more chunks beyond, and drops the
+# chunks that have fallen behind.  Requests and finished chunks travel
+# between the two threads through collections.deque, whose append and
+# popleft are atomic, so neither side ever takes a lock; the worker only
+# sleeps on an Event while there is nothing to generate.  A chunk inside the
+# view that is still missing (the first frame after a reset) is generated on
+# the spot rather than leaving a hole.
+#
+# Each resident chunk holds a slot, the lowest one free when it arrived,
+# and its items are numbered from slot * capacity, so item ids stay put for
+# as long as the chunk is resident and per-object state keyed by them (LOD
+# hysteresis) stays bounded.  A chunk that later takes over the slot reuses
+# the ids; the serial handed out with them tells the two apart.
+
+import collections
+import math
+import random
+import threading
+
+import numpy
+
+
+def chunk_rng(seed, index):
+    """The generator for chunk index of world seed (str seeds hash stably)"""
+    return random.Random("%s:%d" % (seed, index))
+
+
+class WorldStreamer(object):
+    """Chunks of generated scenery around a moving camera
+
+    generate -- generate(rng, x0, x1) -> (n, k) array of the items in
+        [x0, x1) of world x, column 0 being x
+    size -- chunk length in world units
+    ahead, behind -- world units in front of / behind the camera that must
+        be resident
+    prefetch -- extra chunks to request beyond `ahead`
+    capacity -- most items one chunk may hold
+    threaded -- generate on a worker thread (False: always on the spot)
+    """
+
+    def __init__(self, generate, seed=0, size=40.0, ahead=160.0, behind=40.0, prefetch=2,
+                 columns=2, capacity=64, threaded=True):
+        self.generate = generate
+        self.size = float(size)
+        self.ahead, self.behind = ahead, behind
+        self.prefetch = prefetch
+        self.columns = columns
+        self.capacity = capacity
+        self.threaded = threaded
+        self.requests = collections.deque()   # (generation, index), render -> worker
+        self.ready = collections.deque()      # (generation, index, items), worker -> render
+        self.wake = threading.Event()
+        self.worker = None
+        self.generated = 0   # chunks made by the worker
+        self.inline = 0      # chunks the render thread had to make itself
+        self.loaded = 0      # chunks made resident, numbers their serials
+        self.reset(seed)
+
+    def reset(self, seed):
+        """Forget every chunk and start streaming the world of seed"""
+        self.seed = seed
+        self.generation = getattr(self, "generation", 0) + 1   # outdates chunks in flight
+        self.chunks = {}
+        self.slots = {}      # index: (slot, serial) of every resident chunk
+        self.pending = set()
+        self.requests.clear()
+        self._items = None
+
+    def chunk_range(self, x0, x1):
+        return range(int(math.floor(x0 / self.size)), int(math.floor(x1 / self.size)) + 1)
+
+    def make_chunk(self, index):
+        x0 = index * self.size
+        items = numpy.asarray(self.generate(chunk_rng(self.seed, index), x0, x0 + self.size), dtype='d')
+        return items.reshape((-1, self.columns))
+
+    def _add(self, index, items):
+        if len(items) > self.capacity:
+            raise ValueError("Chunk %d has %d items, capacity is %d" % (index, len(items), self.capacity))
+        used = set(slot for slot, _ in self.slots.values())
+        slot = 0
+        while slot in used:
+            slot += 1
+        self.loaded += 1
+        self.chunks[index] = items
+        self.slots[index] = slot, self.loaded
+        self._items = None
+
+    def update(self, distance):
+        """Stream around the camera at world x = distance"""
+        generation, chunks = self.generation, self.chunks
+
+        # Collect what the worker finished :
+
+        while self.ready:
+            gen, index, items = self.ready.popleft()
+            self.pending.discard(index)
+            if gen == generation and index not in chunks:
+                self._add(index, items)
+
+        # Evict behind the camera, fill in the view, prefetch beyond it :
+
+        needed = self.chunk_range(distance - self.behind, distance + self.ahead)
+        for index in [i for i in chunks if i < needed.start]:
+            del chunks[index], self.slots[index]
+            self._items = None
+        for index in needed:
+            if index not in chunks:
+                self._add(index, self.make_chunk(index))
+                self.inline += 1
+        if self.threaded:
+            for index in range(needed.stop, needed.stop + self.prefetch):
+                if index not in chunks and index not in self.pending:
+                    self.pending.add(index)
+                    self.requests.append((generation, index))
+                    self._start()
+                    self.wake.set()
+
+    def items(self):
+        """(ids, serials, items) of every resident chunk
+
+        ids -- slot * capacity + index in the chunk, fixed while the chunk
+            is resident and reused by later chunks in the same slot
+        serials -- the serial of each item's chunk, which changes whenever
+            a slot gets a new chunk (reset() included)
+        """
+        if self._items is None:
+            ids, serials, parts = [], [], []
+            for index in sorted(self.chunks):
+                items = self.chunks[index]
+                slot, serial = self.slots[index]
+                ids.append(slot * self.capacity + numpy.arange(len(items)))
+                serials.append(numpy.full(len(items), serial))
+                parts.append(items)
+            if parts:
+                self._items = numpy.concatenate(ids), numpy.concatenate(serials), numpy.vstack(parts)
+            else:
+                self._items = numpy.zeros(0, int), numpy.zeros(0, int), numpy.zeros((0, self.columns))
+        return self._items
+
+    # Worker :
+
+    def _start(self):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, name="world streamer", daemon=True)
+            self.worker.start()
+
+    def _run(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            while self.requests:
+                generation, index = self.requests.popleft()
+                if generation != self.generation:
+                    continue
+                self.ready.append((generation, index, self.make_chunk(index)))
+                self.generated += 1